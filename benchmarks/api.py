@@ -0,0 +1,172 @@
+"""
+Benchmark of every API route registered by setup.app.routes.register_routes.
+
+Routes are requested in-process through an ASGI client against the database configured in the environment (.env),
+seeded with benchmarks/seed.py. Path parameters are resolved to existing rows, the lowest IDs are used, which
+are the rows with photos, sections and applications in the seeded dataset.
+
+GET routes are always measured. With --include-writes, PUT routes with JSON bodies are measured as well: they
+send the current state of the resource back, so data doesn't change. Other routes changing data and routes
+uploading files are reported as skipped.
+
+Results are stored as JSON with the commit hash, so runs of different commits can be compared with
+benchmarks/compare.py.
+
+Usage:
+    python benchmarks/api.py --requests 500 --concurrency 10 --include-writes
+"""
+
+import argparse
+import json
+import re
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from common import API_PREFIX, get_client, get_commit, measure, print_results, run
+
+from fastapi.routing import APIRoute
+from sqlalchemy import func, select
+
+from db.sqlalchemy.models import Media, MediaCategory, MediaPhoto, Event, EventApplication, MuseumHall, \
+    MuseumSection, User
+from main import app
+from setup.sqlalchemy.session import async_session_maker
+
+RESULTS_DIRECTORY = Path(__file__).resolve().parent / "results"
+
+# Models of path parameters by the path segment preceding them
+SEGMENT_MODELS = {
+    "applications": EventApplication,
+    "events": Event,
+    "photos": MediaPhoto,
+    "categories": MediaCategory,
+    "media": Media,
+    "halls": MuseumHall,
+    "sections": MuseumSection,
+    "users": User,
+}
+
+PATH_PARAMETER_PATTERN = re.compile(r"\{(\w+)}")
+
+
+def get_api_routes() -> list:
+    return [
+        route for route in app.routes
+        if isinstance(route, APIRoute) and route.path.startswith(API_PREFIX)
+    ]
+
+
+async def get_model_ids() -> dict:
+    async with async_session_maker() as session:
+        ids = {}
+
+        for model in set(SEGMENT_MODELS.values()):
+            if model is User:
+                ids[model] = await session.scalar(select(User.id).where(User.is_superuser).limit(1))
+            else:
+                ids[model] = await session.scalar(select(func.min(model.id)))
+
+        return ids
+
+
+def resolve_path(path: str, model_ids: dict) -> str:
+    segments = path.split("/")
+
+    for index, segment in enumerate(segments):
+        if PATH_PARAMETER_PATTERN.fullmatch(segment):
+            model = SEGMENT_MODELS[segments[index - 1]]
+            segments[index] = str(model_ids[model])
+
+    return "/".join(segments)
+
+
+def get_skip_reason(route: APIRoute, method: str, include_writes: bool):
+    if method == "GET":
+        return None
+
+    if method != "PUT":
+        return "changes data"
+
+    if not include_writes:
+        return "writes are excluded, use --include-writes"
+
+    if route.body_field is None or "upload" in route.path:
+        return "uploads files"
+
+    return None
+
+
+async def get_put_body(client, url: str, route: APIRoute) -> dict:
+    response = await client.get(url)
+    response.raise_for_status()
+    current = response.json()
+    fields = route.body_field.type_.model_fields
+    return {name: current[name] for name in fields if name in current}
+
+
+async def login(client, email: str, password: str):
+    response = await client.post(f"{API_PREFIX}/auth/jwt/login", data={"username": email, "password": password})
+    response.raise_for_status()
+
+
+async def main(args):
+    model_ids = await get_model_ids()
+    results = {}
+    skipped = {}
+
+    async with get_client(app) as client:
+        await login(client, args.admin_email, args.admin_password)
+
+        for route in get_api_routes():
+            for method in sorted(route.methods):
+                name = f"{method} {route.path}"
+
+                if args.filter and not re.search(args.filter, name):
+                    continue
+
+                skip_reason = get_skip_reason(route, method, args.include_writes)
+
+                if skip_reason:
+                    skipped[name] = skip_reason
+                    continue
+
+                url = resolve_path(route.path, model_ids)
+                request_kwargs = {}
+
+                if method == "PUT":
+                    request_kwargs["json"] = await get_put_body(client, url, route)
+
+                results[name] = await measure(client, method, url, requests=args.requests,
+                                              concurrency=args.concurrency, warmup=args.warmup, **request_kwargs)
+                print(f"{name}: {results[name]['rps']} rps, p95 {results[name]['p95_ms']} ms")
+
+    commit = get_commit()
+    report = {
+        "commit": commit,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "settings": {"requests": args.requests, "concurrency": args.concurrency, "warmup": args.warmup},
+        "routes": results,
+        "skipped": skipped,
+    }
+
+    output = Path(args.output) if args.output else RESULTS_DIRECTORY / f"{int(time.time())}-{commit['hash'][:8]}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=4))
+
+    print_results({"output": str(output), "measured": len(results), "skipped": skipped})
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--include-writes", action="store_true")
+    parser.add_argument("--filter", help="Regular expression names of routes must match, e.g. 'GET /api/v1/media'")
+    parser.add_argument("--output", help="Path of the results file, benchmarks/results/<time>-<commit>.json")
+    parser.add_argument("--admin-email", default="admin@example.com")
+    parser.add_argument("--admin-password", default="admin")
+    args = parser.parse_args()
+
+    run(main, args)
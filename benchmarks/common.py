@@ -0,0 +1,158 @@
+"""
+Common helpers for benchmarks.
+
+Benchmarks run the application in-process through an ASGI transport, so they measure the application and the
+database without network and server overhead. The database configured in the environment (.env) is used.
+"""
+
+import asyncio
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+BASE_DIRECTORY = Path(__file__).resolve().parent.parent
+SRC_DIRECTORY = BASE_DIRECTORY / "src"
+
+if str(SRC_DIRECTORY) not in sys.path:
+    sys.path.insert(0, str(SRC_DIRECTORY))
+
+import httpx
+
+API_PREFIX = "/api/v1"
+
+
+def get_client(app) -> httpx.AsyncClient:
+    """
+    Create an HTTP client which sends requests directly to the ASGI application.
+
+    Args:
+        app: The ASGI application.
+
+    Returns:
+        httpx.AsyncClient: The client.
+    """
+
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    return httpx.AsyncClient(transport=transport, base_url="http://benchmark")
+
+
+def percentile(values: list, percent: float) -> float:
+    """
+    Get the percentile of the sorted list of values using the nearest-rank method.
+
+    Args:
+        values (list): The sorted list of values.
+        percent (float): The percentile in range (0, 100].
+
+    Returns:
+        float: The percentile value.
+    """
+
+    if not values:
+        return 0.0
+
+    rank = max(int(round(percent / 100 * len(values))) - 1, 0)
+    return values[min(rank, len(values) - 1)]
+
+
+async def measure(client: httpx.AsyncClient,
+                  method: str,
+                  url: str,
+                  requests: int = 1000,
+                  concurrency: int = 10,
+                  warmup: int = 20,
+                  **request_kwargs) -> Dict[str, float]:
+    """
+    Send requests to the URL and measure latency and throughput.
+
+    Args:
+        client (httpx.AsyncClient): The client to send requests with.
+        method (str): The HTTP method.
+        url (str): The URL of the endpoint.
+        requests (int): The number of measured requests.
+        concurrency (int): The number of requests in flight.
+        warmup (int): The number of requests sent before measuring.
+        **request_kwargs: Additional keyword arguments of the request.
+
+    Returns:
+        Dict[str, float]: Statistics of the run, latencies are in milliseconds.
+    """
+
+    for _ in range(warmup):
+        await client.request(method, url, **request_kwargs)
+
+    latencies = []
+    errors = 0
+    remaining = iter(range(requests))
+
+    async def worker():
+        nonlocal errors
+
+        for _ in remaining:
+            start = time.perf_counter()
+            response = await client.request(method, url, **request_kwargs)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+            if response.status_code >= 400:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+
+    return {
+        "requests": requests,
+        "errors": errors,
+        "seconds": round(elapsed, 3),
+        "rps": round(requests / elapsed, 1) if elapsed else 0.0,
+        "mean_ms": round(statistics.fmean(latencies), 3) if latencies else 0.0,
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p95_ms": round(percentile(latencies, 95), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+    }
+
+
+def compare(before: Dict[str, float], after: Dict[str, float]) -> Dict[str, Optional[float]]:
+    """
+    Compare two runs and get relative changes of their statistics in percents.
+
+    Args:
+        before (Dict[str, float]): The baseline statistics.
+        after (Dict[str, float]): The statistics to compare with the baseline.
+
+    Returns:
+        Dict[str, Optional[float]]: Relative changes by statistic names.
+    """
+
+    return {
+        key: round((after[key] - before[key]) / before[key] * 100, 1) if before[key] else None
+        for key in ("rps", "mean_ms", "p50_ms", "p95_ms", "p99_ms")
+    }
+
+
+def get_commit() -> dict:
+    """
+    Get the commit of the working tree, so results of different commits can be told apart.
+
+    Returns:
+        dict: The hash of HEAD and whether tracked files have uncommitted changes.
+    """
+
+    def git(*args) -> str:
+        return subprocess.run(["git", *args], cwd=BASE_DIRECTORY, capture_output=True, text=True).stdout.strip()
+
+    return {"hash": git("rev-parse", "HEAD"), "dirty": bool(git("status", "--porcelain", "--untracked-files=no"))}
+
+
+def print_results(results: dict) -> None:
+    print(json.dumps(results, indent=4, default=str))
+
+
+def run(coroutine_function: Callable, *args, **kwargs):
+    return asyncio.run(coroutine_function(*args, **kwargs))
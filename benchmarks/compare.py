@@ -0,0 +1,44 @@
+"""
+Compare two results files of benchmarks/api.py route by route.
+
+Usage:
+    python benchmarks/compare.py benchmarks/results/before.json benchmarks/results/after.json
+"""
+
+import argparse
+import json
+
+from common import compare, print_results
+
+
+def main(before_path: str, after_path: str):
+    with open(before_path) as file:
+        before = json.load(file)
+
+    with open(after_path) as file:
+        after = json.load(file)
+
+    routes = {
+        name: {
+            "before": {key: before["routes"][name][key] for key in ("rps", "p50_ms", "p95_ms", "p99_ms")},
+            "after": {key: stats[key] for key in ("rps", "p50_ms", "p95_ms", "p99_ms")},
+            "change_percent": compare(before["routes"][name], stats),
+        }
+        for name, stats in after["routes"].items()
+        if name in before["routes"]
+    }
+
+    print_results({
+        "before": before["commit"],
+        "after": after["commit"],
+        "routes": routes,
+    })
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("before")
+    parser.add_argument("after")
+    args = parser.parse_args()
+
+    main(args.before, args.after)
@@ -0,0 +1,554 @@
+"""
+Load test scenarios modeling real traffic against a running server.
+
+Unlike the other benchmarks, requests go over the network to uvicorn, so the server, its workers and the database
+connection pool are loaded as in production. Run the server against a local database seeded with
+benchmarks/seed.py, or pass --start-server to start uvicorn from src for the duration of the run.
+
+Scenarios:
+    browsing        Anonymous visitors browsing media, events and the museum.
+    registration    Registration opening: visitors open one of a few upcoming hot events and apply to it at once.
+    admin           Administrators triaging applications: listing pending ones, opening and accepting or rejecting.
+    opening_day     All of the above at the same time, the traffic mix of registration opening day.
+
+Each scenario reports p50/p95/p99 latencies, throughput and error rates per request, and checks them against
+benchmarks/load_thresholds.json and, with --baseline, against a previous run. The process exits with status 1
+if any check fails, so runs can gate changes.
+
+The scenarios change data: registration creates applications, admin changes their statuses. Both send emails
+in background tasks, configure SMTP of the server accordingly.
+
+Usage:
+    python benchmarks/load.py opening_day --base-url http://127.0.0.1:8000 --duration 60
+    python benchmarks/load.py registration --start-server --workers 4 --baseline benchmarks/results/load-...json
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import sys
+import time
+import uuid
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from common import API_PREFIX, SRC_DIRECTORY, get_commit, percentile, print_results, run
+
+import httpx
+
+from db.sqlalchemy.models import EventApplicationStatus
+
+RESULTS_DIRECTORY = Path(__file__).resolve().parent / "results"
+THRESHOLDS_PATH = Path(__file__).resolve().parent / "load_thresholds.json"
+
+PER_PAGE = 20
+
+
+class Stats:
+    """
+    Latencies and errors of requests grouped by request names.
+    """
+
+    def __init__(self):
+        """
+        Initialize a new Stats instance.
+        """
+
+        self._latencies: Dict[str, List[float]] = defaultdict(list)
+        self._errors: Dict[str, int] = defaultdict(int)
+        self._statuses: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+    def record(self, name: str, latency_ms: float, status: Optional[int]):
+        """
+        Record a finished request.
+
+        Args:
+            name (str): The name of the request, e.g. "GET /events/{id}".
+            latency_ms (float): The latency of the request in milliseconds.
+            status (Optional[int]): The status code of the response, None if the request failed without one.
+        """
+
+        self._latencies[name].append(latency_ms)
+        self._statuses[name][str(status)] += 1
+
+        if status is None or status >= 400:
+            self._errors[name] += 1
+
+    def summarize(self, seconds: float) -> Dict[str, dict]:
+        """
+        Summarize recorded requests, the "total" entry covers all of them.
+
+        Args:
+            seconds (float): The duration of the run.
+
+        Returns:
+            Dict[str, dict]: Statistics by request names, latencies are in milliseconds.
+        """
+
+        summary = {
+            name: self._summarize(latencies, self._errors[name], seconds, self._statuses[name])
+            for name, latencies in sorted(self._latencies.items())
+        }
+
+        statuses = defaultdict(int)
+
+        for name_statuses in self._statuses.values():
+            for status, count in name_statuses.items():
+                statuses[status] += count
+
+        summary["total"] = self._summarize([latency for latencies in self._latencies.values() for latency in latencies],
+                                           sum(self._errors.values()), seconds, statuses)
+        return summary
+
+    @staticmethod
+    def _summarize(latencies: List[float], errors: int, seconds: float, statuses: Dict[str, int]) -> dict:
+        latencies = sorted(latencies)
+        requests = len(latencies)
+
+        return {
+            "requests": requests,
+            "errors": errors,
+            "error_rate": round(errors / requests, 4) if requests else 0.0,
+            "rps": round(requests / seconds, 1) if seconds else 0.0,
+            "p50_ms": round(percentile(latencies, 50), 3),
+            "p95_ms": round(percentile(latencies, 95), 3),
+            "p99_ms": round(percentile(latencies, 99), 3),
+            "statuses": dict(statuses),
+        }
+
+
+class VirtualUser:
+    """
+    Base class of simulated users sending requests in a loop until the deadline.
+    """
+
+    def __init__(self, client: httpx.AsyncClient, stats: Stats, data: dict, rng: random.Random, think_time: float):
+        """
+        Initialize a new VirtualUser instance.
+
+        Args:
+            client (httpx.AsyncClient): The client of the user, it keeps the user's cookies.
+            stats (Stats): The statistics to record requests in.
+            data (dict): IDs of existing rows collected before the run.
+            rng (random.Random): The random generator of the user.
+            think_time (float): The mean pause between actions in seconds, 0 disables pauses.
+        """
+
+        self._client = client
+        self._stats = stats
+        self._data = data
+        self._rng = rng
+        self._think_time = think_time
+
+    async def request(self, name: str, method: str, url: str, **kwargs) -> Optional[httpx.Response]:
+        """
+        Send a request and record its latency and status.
+
+        Args:
+            name (str): The name of the request to group statistics by.
+            method (str): The HTTP method.
+            url (str): The URL relative to the API prefix.
+            **kwargs: Additional keyword arguments of the request.
+
+        Returns:
+            Optional[httpx.Response]: The response, None if the request failed without one.
+        """
+
+        start = time.perf_counter()
+
+        try:
+            response = await self._client.request(method, f"{API_PREFIX}{url}", **kwargs)
+        except httpx.HTTPError:
+            response = None
+
+        status = response.status_code if response is not None else None
+        self._stats.record(name, (time.perf_counter() - start) * 1000, status)
+        return response
+
+    async def think(self):
+        if self._think_time > 0:
+            await asyncio.sleep(self._rng.expovariate(1 / self._think_time))
+
+    async def setup(self):
+        pass
+
+    async def act(self):
+        raise NotImplementedError
+
+    async def run(self, deadline: float):
+        await self.setup()
+
+        while time.perf_counter() < deadline:
+            await self.act()
+            await self.think()
+
+
+class Visitor(VirtualUser):
+    """
+    Anonymous visitor browsing media, events and the museum.
+    """
+
+    def random_page(self, total_count: int) -> int:
+        return self._rng.randint(1, max((total_count + PER_PAGE - 1) // PER_PAGE, 1))
+
+    async def act(self):
+        data = self._data
+        action = self._rng.choices(
+            ["media_list", "media", "events_list", "event", "categories", "museum_tree", "halls", "hall_sections",
+             "section"],
+            weights=[25, 25, 15, 15, 5, 5, 2, 3, 5],
+        )[0]
+
+        if action == "media_list":
+            await self.request("GET /media/", "GET", "/media/",
+                               params={"page": self.random_page(data["media_count"]), "per_page": PER_PAGE})
+        elif action == "media":
+            await self.request("GET /media/{id}", "GET", f"/media/{self._rng.choice(data['media'])}")
+        elif action == "events_list":
+            await self.request("GET /events/", "GET", "/events/",
+                               params={"page": self.random_page(data["events_count"]), "per_page": PER_PAGE})
+        elif action == "event":
+            await self.request("GET /events/{id}", "GET", f"/events/{self._rng.choice(data['events'])}")
+        elif action == "categories":
+            await self.request("GET /media/categories/", "GET", "/media/categories/",
+                               params={"page": 1, "per_page": PER_PAGE})
+        elif action == "museum_tree":
+            await self.request("GET /museum/tree/", "GET", "/museum/tree/")
+        elif action == "halls":
+            await self.request("GET /museum/halls/", "GET", "/museum/halls/", params={"page": 1, "per_page": PER_PAGE})
+        elif action == "hall_sections":
+            await self.request("GET /museum/halls/{hall_id}/sections", "GET",
+                               f"/museum/halls/{self._rng.choice(data['halls'])}/sections",
+                               params={"page": 1, "per_page": PER_PAGE})
+        elif action == "section":
+            await self.request("GET /museum/sections/{id}", "GET",
+                               f"/museum/sections/{self._rng.choice(data['sections'])}")
+
+
+class Applicant(VirtualUser):
+    """
+    Visitor opening one of the hot events and applying to it with a unique email.
+    """
+
+    async def act(self):
+        event_id = self._rng.choice(self._data["hot_events"])
+
+        await self.request("GET /events/{id}", "GET", f"/events/{event_id}")
+        await self.think()
+
+        await self.request("POST /events/{event_id}/applications", "POST", f"/events/{event_id}/applications", json={
+            "fio": "Load Test Applicant",
+            "email": f"load-{uuid.uuid4().hex}@example.com",
+            "phone": f"+375{self._rng.randint(100000000, 999999999)}",
+            "birthdate": "2005-01-01T00:00:00",
+            "study_organisation": "Load Test School",
+        })
+
+
+class Administrator(VirtualUser):
+    """
+    Administrator listing pending applications of hot events, opening them and accepting or rejecting them.
+    """
+
+    def __init__(self, *args, email: str, password: str, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._email = email
+        self._password = password
+
+    async def setup(self):
+        response = await self.request("POST /auth/jwt/login", "POST", "/auth/jwt/login",
+                                      data={"username": self._email, "password": self._password})
+
+        if response is None or response.status_code >= 400:
+            raise RuntimeError(f"Administrator {self._email} could not log in")
+
+    async def act(self):
+        event_id = self._rng.choice(self._data["hot_events"])
+        response = await self.request("GET /events/{event_id}/applications", "GET", f"/events/{event_id}/applications",
+                                      params={"page": 1, "per_page": PER_PAGE,
+                                              "statuses": EventApplicationStatus.PENDING.value})
+
+        if response is None or response.status_code >= 400 or not response.json()["items"]:
+            return
+
+        application_id = self._rng.choice(response.json()["items"])["id"]
+        await self.think()
+
+        response = await self.request("GET /events/applications/{id}", "GET", f"/events/applications/{application_id}")
+
+        if response is None or response.status_code >= 400:
+            return
+
+        application = response.json()
+        application["status"] = self._rng.choice([EventApplicationStatus.ACCEPTED, EventApplicationStatus.REJECTED])
+        await self.think()
+
+        await self.request("PUT /events/applications/{id}", "PUT", f"/events/applications/{application_id}",
+                           json={key: application[key] for key in ("fio", "email", "phone", "comment", "birthdate",
+                                                                   "study_organisation", "status")})
+
+
+# Virtual users of each scenario as (class, share of --users)
+SCENARIOS = {
+    "browsing": [(Visitor, 1.0)],
+    "registration": [(Applicant, 1.0)],
+    "admin": [(Administrator, 1.0)],
+    "opening_day": [(Visitor, 0.6), (Applicant, 0.35), (Administrator, 0.05)],
+}
+
+
+async def collect_ids(client: httpx.AsyncClient,
+                      path: str,
+                      rng: random.Random,
+                      pages: int = 5,
+                      params: Optional[dict] = None) -> tuple:
+    """
+    Collect IDs of existing rows from random pages of the list endpoint.
+
+    Args:
+        client (httpx.AsyncClient): The client to send requests with.
+        path (str): The path of the list endpoint relative to the API prefix.
+        rng (random.Random): The random generator to pick pages with.
+        pages (int): The number of pages to collect IDs from.
+        params (Optional[dict]): Filters of the list endpoint.
+
+    Returns:
+        tuple: The collected IDs and the total number of rows.
+    """
+
+    per_page = 100
+    params = params or {}
+    response = await client.get(f"{API_PREFIX}{path}", params={**params, "page": 1, "per_page": per_page})
+    response.raise_for_status()
+    first_page = response.json()
+    ids = [item["id"] for item in first_page["items"]]
+
+    other_pages = range(2, first_page["number_of_pages"] + 1)
+
+    for page in rng.sample(other_pages, min(pages - 1, len(other_pages))):
+        response = await client.get(f"{API_PREFIX}{path}", params={**params, "page": page, "per_page": per_page})
+        response.raise_for_status()
+        ids.extend(item["id"] for item in response.json()["items"])
+
+    if not ids:
+        raise RuntimeError(f"No rows found at {path}, seed the database with benchmarks/seed.py")
+
+    return ids, first_page["total_count"]
+
+
+async def collect_data(client: httpx.AsyncClient, rng: random.Random, hot_events: int) -> dict:
+    media, media_count = await collect_ids(client, "/media/", rng)
+    events, events_count = await collect_ids(client, "/events/", rng)
+    # Applications are accepted only before events start, tomorrow allows for time zones of the client and server
+    upcoming_events, _ = await collect_ids(client, "/events/", rng,
+                                           params={"start_dt": (date.today() + timedelta(days=1)).isoformat()})
+    halls, _ = await collect_ids(client, "/museum/halls/", rng)
+    sections, _ = await collect_ids(client, f"/museum/halls/{halls[0]}/sections", rng)
+
+    return {
+        "media": media,
+        "media_count": media_count,
+        "events": events,
+        "events_count": events_count,
+        "hot_events": rng.sample(upcoming_events, min(hot_events, len(upcoming_events))),
+        "halls": halls,
+        "sections": sections,
+    }
+
+
+def check_thresholds(summary: Dict[str, dict], thresholds: dict) -> List[str]:
+    """
+    Check the summary against absolute thresholds of the scenario.
+
+    Args:
+        summary (Dict[str, dict]): Statistics by request names.
+        thresholds (dict): Limits of the "total" entry, e.g. {"p95_ms": 300, "max_error_rate": 0.01}, and limits of
+            single requests by their names under "requests".
+
+    Returns:
+        List[str]: Descriptions of exceeded thresholds.
+    """
+
+    failures = []
+    limits_by_name = {"total": thresholds, **thresholds.get("requests", {})}
+
+    for name, limits in limits_by_name.items():
+        stats = summary.get(name)
+
+        if stats is None:
+            continue
+
+        for key in ("p50_ms", "p95_ms", "p99_ms"):
+            if key in limits and stats[key] > limits[key]:
+                failures.append(f"{name}: {key} {stats[key]} > {limits[key]}")
+
+        if "max_error_rate" in limits and stats["error_rate"] > limits["max_error_rate"]:
+            failures.append(f"{name}: error rate {stats['error_rate']} > {limits['max_error_rate']}")
+
+    return failures
+
+
+def check_baseline(summary: Dict[str, dict], baseline: Dict[str, dict], max_regression: float) -> List[str]:
+    """
+    Check the summary against a previous run of the same scenario.
+
+    Args:
+        summary (Dict[str, dict]): Statistics by request names.
+        baseline (Dict[str, dict]): Statistics of the previous run by request names.
+        max_regression (float): The allowed growth of p95 and p99 latencies in percents.
+
+    Returns:
+        List[str]: Descriptions of regressions.
+    """
+
+    failures = []
+
+    for name, stats in summary.items():
+        before = baseline.get(name)
+
+        if before is None:
+            continue
+
+        for key in ("p95_ms", "p99_ms"):
+            if before[key] and (stats[key] - before[key]) / before[key] * 100 > max_regression:
+                failures.append(f"{name}: {key} {before[key]} -> {stats[key]}, more than {max_regression}% slower")
+
+        if stats["error_rate"] > before["error_rate"]:
+            failures.append(f"{name}: error rate {before['error_rate']} -> {stats['error_rate']}")
+
+    return failures
+
+
+async def wait_for_server(client: httpx.AsyncClient, timeout: float):
+    deadline = time.perf_counter() + timeout
+
+    while True:
+        try:
+            await client.get("/openapi.json")
+            return
+        except httpx.TransportError:
+            if time.perf_counter() > deadline:
+                raise RuntimeError(f"Server at {client.base_url} did not start in {timeout} seconds")
+
+            await asyncio.sleep(0.5)
+
+
+def start_server(args) -> subprocess.Popen:
+    url = httpx.URL(args.base_url)
+
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", url.host, "--port", str(url.port or 80),
+         "--workers", str(args.workers), "--no-access-log"],
+        cwd=SRC_DIRECTORY,
+    )
+
+
+async def run_scenario(args) -> dict:
+    rng = random.Random(args.seed)
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+        await wait_for_server(client, args.startup_timeout)
+        data = await collect_data(client, rng, args.hot_events)
+
+    stats = Stats()
+    clients = []
+    users = []
+
+    for user_class, share in SCENARIOS[args.scenario]:
+        for _ in range(max(round(args.users * share), 1)):
+            # Each user has its own client, so users don't share cookies and connections
+            client = httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout)
+            clients.append(client)
+            kwargs = {"email": args.admin_email, "password": args.admin_password} \
+                if user_class is Administrator else {}
+            users.append(user_class(client, stats, data, random.Random(rng.random()), args.think_time, **kwargs))
+
+    start = time.perf_counter()
+    deadline = start + args.duration
+
+    async def run_user(user: VirtualUser, delay: float):
+        await asyncio.sleep(delay)
+        await user.run(deadline)
+
+    try:
+        # Users start evenly over the ramp up, a ramp up of 0 is a burst
+        await asyncio.gather(*(run_user(user, args.ramp_up * index / len(users)) for index, user in enumerate(users)))
+    finally:
+        for client in clients:
+            await client.aclose()
+
+    return stats.summarize(time.perf_counter() - start)
+
+
+async def main(args):
+    server = start_server(args) if args.start_server else None
+
+    try:
+        summary = await run_scenario(args)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    with open(args.thresholds) as file:
+        thresholds = json.load(file).get(args.scenario, {})
+
+    failures = check_thresholds(summary, thresholds)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+
+        failures.extend(check_baseline(summary, baseline["requests"], args.max_regression))
+
+    commit = get_commit()
+    report = {
+        "commit": commit,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "scenario": args.scenario,
+        "settings": {"users": args.users, "duration": args.duration, "ramp_up": args.ramp_up,
+                     "think_time": args.think_time, "hot_events": args.hot_events,
+                     "workers": args.workers if args.start_server else None},
+        "requests": summary,
+        "failures": failures,
+    }
+
+    output = Path(args.output) if args.output \
+        else RESULTS_DIRECTORY / f"load-{args.scenario}-{int(time.time())}-{commit['hash'][:8]}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=4))
+
+    print_results({"output": str(output), "requests": summary, "failures": failures})
+
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("scenario", choices=SCENARIOS)
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=60)
+    parser.add_argument("--ramp-up", type=float, default=10)
+    parser.add_argument("--think-time", type=float, default=1)
+    parser.add_argument("--hot-events", type=int, default=3)
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--thresholds", default=str(THRESHOLDS_PATH))
+    parser.add_argument("--baseline", help="Results file of a previous run to check regressions against")
+    parser.add_argument("--max-regression", type=float, default=20, help="Allowed growth of p95 and p99 in percents")
+    parser.add_argument("--output", help="Path of the results file, benchmarks/results/load-<scenario>-<time>.json")
+    parser.add_argument("--start-server", action="store_true")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--startup-timeout", type=float, default=30)
+    parser.add_argument("--admin-email", default="admin@example.com")
+    parser.add_argument("--admin-password", default="admin")
+    args = parser.parse_args()
+
+    run(main, args)
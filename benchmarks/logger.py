@@ -0,0 +1,59 @@
+"""
+Benchmark of request throughput with logging disabled, with synchronous sinks and with enqueued sinks.
+
+Sinks are configured from the server settings of the environment with overridden level and enqueue options.
+
+Usage:
+    python benchmarks/logger.py --media-id 1 --requests 2000 --concurrency 10 --level DEBUG
+"""
+
+import argparse
+
+from common import API_PREFIX, get_client, measure, compare, print_results, run
+
+from loguru import logger
+
+from main import app
+from setup.logger import configure_logger
+from setup.settings.server import get_server_settings
+
+
+async def main(media_id: int, requests: int, concurrency: int, level: str):
+    url = f"{API_PREFIX}/media/{media_id}"
+    settings = get_server_settings()
+    results = {}
+
+    async with get_client(app) as client:
+        logger.remove()
+        results["disabled"] = await measure(client, "GET", url, requests=requests, concurrency=concurrency)
+
+        for name, enqueue in (("synchronous", False), ("enqueued", True)):
+            configure_logger(settings.model_copy(update={
+                "log_level": level,
+                "log_file_level": level,
+                "log_enqueue": enqueue,
+                "log_file": "benchmark.log",
+            }))
+            results[name] = await measure(client, "GET", url, requests=requests, concurrency=concurrency)
+            await logger.complete()
+
+    logger.remove()
+
+    print_results({
+        "endpoint": f"GET {url}",
+        "level": level,
+        **results,
+        "synchronous_change_percent": compare(results["disabled"], results["synchronous"]),
+        "enqueued_change_percent": compare(results["disabled"], results["enqueued"]),
+    })
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--media-id", type=int, default=1)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--level", default="DEBUG")
+    args = parser.parse_args()
+
+    run(main, args.media_id, args.requests, args.concurrency, args.level)
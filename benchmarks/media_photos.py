@@ -0,0 +1,56 @@
+"""
+Benchmark of GET /media/ with photos loaded by a separate query and aggregated to JSON by the page query.
+
+Needs a PostgreSQL database seeded with benchmarks/seed.py, JSON aggregation is used only by PostgreSQL. Photos of
+the seeded dataset belong to media with the lowest IDs, so the first pages have hundreds of photos with the
+default sizes.
+
+Usage:
+    python benchmarks/media_photos.py --page 1 --per-page 100 --requests 500 --concurrency 10
+"""
+
+import argparse
+
+from common import API_PREFIX, get_client, measure, compare, print_results, run
+
+from main import app
+from modules.media.repositories.sqlalchemy import SQLAlchemyMediaRepository
+
+
+async def main(page: int, per_page: int, requests: int, concurrency: int):
+    url = f"{API_PREFIX}/media/"
+    params = {"page": page, "per_page": per_page}
+
+    async with get_client(app) as client:
+        SQLAlchemyMediaRepository.json_aggregation = False
+        separate_query_body = (await client.get(url, params=params)).json()
+        separate_query = await measure(client, "GET", url, requests=requests, concurrency=concurrency, params=params)
+
+        SQLAlchemyMediaRepository.json_aggregation = True
+        json_aggregation_body = (await client.get(url, params=params)).json()
+        json_aggregation = await measure(client, "GET", url, requests=requests, concurrency=concurrency,
+                                         params=params)
+
+    if separate_query_body != json_aggregation_body:
+        raise RuntimeError("Query modes returned different responses")
+
+    print_results({
+        "endpoint": f"GET {url}",
+        "page": page,
+        "per_page": per_page,
+        "photos": sum(len(media["media_photos"]) for media in json_aggregation_body["items"]),
+        "separate_query": separate_query,
+        "json_aggregation": json_aggregation,
+        "change_percent": compare(separate_query, json_aggregation),
+    })
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--page", type=int, default=1)
+    parser.add_argument("--per-page", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+
+    run(main, args.page, args.per_page, args.requests, args.concurrency)
@@ -0,0 +1,203 @@
+"""
+Seed the database configured in the environment (.env) with a synthetic dataset for benchmarks.
+
+Volumes are configurable, data is generated from a fixed random seed, so runs with the same arguments produce
+the same dataset. With --truncate, tables are emptied and identities restarted first, so IDs start from 1.
+A superuser is created for benchmarks of admin routes.
+
+Usage:
+    python benchmarks/seed.py --truncate --media 100000 --events 10000 --applications 500000 --photos 5000
+"""
+
+import argparse
+import random
+import time
+from datetime import date, timedelta
+
+from common import print_results, run
+
+from fastapi_users.password import PasswordHelper
+from sqlalchemy import insert, select, text, func, update
+
+from db.sqlalchemy.models import Media, MediaCategory, MediaType, MediaPhoto, Event, EventApplication, \
+    EventApplicationStatus, MuseumHall, MuseumSection, MuseumTreeVersion, User
+from setup.sqlalchemy.session import async_session_maker
+
+TABLES = [
+    EventApplication.__tablename__,
+    Event.__tablename__,
+    MediaPhoto.__tablename__,
+    Media.__tablename__,
+    MediaCategory.__tablename__,
+    MuseumSection.__tablename__,
+    MuseumHall.__tablename__,
+]
+
+WORDS = ["museum", "history", "archive", "collection", "exhibition", "lecture", "document", "photo", "memory",
+         "heritage", "study", "guide", "map", "letter", "portrait", "chronicle", "report", "program"]
+
+
+def sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize()
+
+
+async def insert_rows(session, model, rows, batch_size: int) -> int:
+    for start in range(0, len(rows), batch_size):
+        await session.execute(insert(model), rows[start:start + batch_size])
+
+    return len(rows)
+
+
+async def seed(args):
+    rng = random.Random(args.seed)
+    counts = {}
+    started = time.perf_counter()
+    today = date.today()
+
+    async with async_session_maker() as session:
+        if args.truncate:
+            await session.execute(text(f"TRUNCATE {', '.join(TABLES)} RESTART IDENTITY CASCADE"))
+
+        categories = [
+            {"name": sentence(rng, 2), "type": rng.choice(list(MediaType))}
+            for _ in range(args.categories)
+        ]
+        counts["media_category"] = await insert_rows(session, MediaCategory, categories, args.batch_size)
+        category_ids = (await session.execute(select(MediaCategory.id))).scalars().all()
+
+        media = [
+            {
+                "name": sentence(rng, 4),
+                "description": sentence(rng, 30),
+                "image_url": f"https://storage.example.com/media/{index}.jpg",
+                "url": f"https://storage.example.com/media/{index}.pdf",
+                "type": rng.choice(list(MediaType)),
+                "category_id": rng.choice(category_ids) if category_ids and rng.random() < 0.8 else None,
+            }
+            for index in range(args.media)
+        ]
+        counts["media"] = await insert_rows(session, Media, media, args.batch_size)
+        media_ids = (await session.execute(select(Media.id).order_by(Media.id))).scalars().all()
+
+        # Photos are attached to the first media, so media with the lowest IDs have photos
+        photo_media_ids = media_ids[:max(len(media_ids) // 100, 1)] if media_ids else []
+        photos = [
+            {
+                "image_url": f"https://storage.example.com/photos/{index}.jpg",
+                "media_id": photo_media_ids[index % len(photo_media_ids)],
+            }
+            for index in range(args.photos if photo_media_ids else 0)
+        ]
+        counts["media_photo"] = await insert_rows(session, MediaPhoto, photos, args.batch_size)
+
+        events = []
+
+        for _ in range(args.events):
+            start_date = today + timedelta(days=rng.randint(-365, 365))
+            events.append({
+                "name": sentence(rng, 3),
+                "description": sentence(rng, 40),
+                "short_description": sentence(rng, 10),
+                "location": sentence(rng, 3),
+                "participants": sentence(rng, 5),
+                "coordinator_contact": sentence(rng, 2),
+                "created_at": start_date - timedelta(days=30),
+                "start_date": start_date,
+                "end_date": start_date + timedelta(days=rng.randint(1, 7)),
+            })
+
+        counts["events"] = await insert_rows(session, Event, events, args.batch_size)
+        event_ids = (await session.execute(select(Event.id))).scalars().all()
+
+        applications = [
+            {
+                "fio": sentence(rng, 3),
+                "email": f"user{index}@example.com",
+                "phone": f"+375{rng.randint(100000000, 999999999)}",
+                "birthdate": date(2000, 1, 1) + timedelta(days=rng.randint(0, 3650)),
+                "comment": sentence(rng, 5) if rng.random() < 0.3 else None,
+                "study_organisation": sentence(rng, 3),
+                "event_id": rng.choice(event_ids),
+                "status": rng.choice(list(EventApplicationStatus)),
+            }
+            for index in range(args.applications if event_ids else 0)
+        ]
+        counts["events_applications"] = await insert_rows(session, EventApplication, applications, args.batch_size)
+
+        # Applications are inserted directly, so counters of events are set by a single update
+        application_counts = (select(EventApplication.event_id,
+                                     func.count().label("applications_count"),
+                                     func.count().filter(EventApplication.status == EventApplicationStatus.ACCEPTED)
+                                     .label("accepted_count"))
+                              .group_by(EventApplication.event_id)
+                              .subquery())
+        await session.execute(update(Event)
+                              .where(Event.id == application_counts.c.event_id)
+                              .values(applications_count=application_counts.c.applications_count,
+                                      accepted_count=application_counts.c.accepted_count)
+                              .execution_options(synchronize_session=False))
+
+        halls = [
+            {
+                "name": sentence(rng, 2),
+                "description": sentence(rng, 10),
+                "image_url": f"https://storage.example.com/halls/{index}.jpg",
+            }
+            for index in range(args.halls)
+        ]
+        counts["museum_hall"] = await insert_rows(session, MuseumHall, halls, args.batch_size)
+        hall_ids = (await session.execute(select(MuseumHall.id))).scalars().all()
+
+        sections = [
+            {
+                "name": sentence(rng, 2),
+                "description": sentence(rng, 10),
+                "image_url": f"https://storage.example.com/sections/{hall_id}-{index}.jpg",
+                "hall_id": hall_id,
+            }
+            for hall_id in hall_ids
+            for index in range(args.sections_per_hall)
+        ]
+        counts["museum_section"] = await insert_rows(session, MuseumSection, sections, args.batch_size)
+
+        # Trees cached by running servers are read again
+        await session.execute(update(MuseumTreeVersion)
+                              .where(MuseumTreeVersion.id == 1)
+                              .values(version=MuseumTreeVersion.version + 1))
+
+        admin_exists = await session.scalar(select(User.id).where(User.email == args.admin_email))
+
+        if not admin_exists:
+            await session.execute(insert(User).values(
+                email=args.admin_email,
+                hashed_password=PasswordHelper().hash(args.admin_password),
+                is_active=True,
+                is_superuser=True,
+                is_verified=True,
+            ))
+
+        await session.commit()
+
+        await session.execute(text("ANALYZE"))
+        await session.commit()
+
+    print_results({"rows": counts, "seconds": round(time.perf_counter() - started, 1)})
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--truncate", action="store_true")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--categories", type=int, default=200)
+    parser.add_argument("--media", type=int, default=100000)
+    parser.add_argument("--photos", type=int, default=5000)
+    parser.add_argument("--events", type=int, default=10000)
+    parser.add_argument("--applications", type=int, default=500000)
+    parser.add_argument("--halls", type=int, default=20)
+    parser.add_argument("--sections-per-hall", type=int, default=20)
+    parser.add_argument("--admin-email", default="admin@example.com")
+    parser.add_argument("--admin-password", default="admin")
+    args = parser.parse_args()
+
+    run(seed, args)
@@ -0,0 +1,120 @@
+"""
+Benchmark of response serialization of a page of media returned by the service.
+
+Compares FastAPI serialization, which dumps the returned schema, validates it against the response model again
+and encodes the validated copy, with SchemaRoute serializing the schema instance straight to JSON bytes.
+No database is needed, the page is built from synthetic schema instances.
+
+Usage:
+    python benchmarks/serialization.py --items 200 --photos 3 --iterations 500
+"""
+
+import argparse
+import json
+import time
+
+from common import print_results, run
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import APIRoute, serialize_response
+
+from core.pagination.schema import PaginatedOut
+from core.routing import SchemaRoute
+from db.sqlalchemy.models import MediaType
+from modules.media.schemas import MediaRetrieveOutSchema, MediaPhotoRetrieveOutSchema
+
+RESPONSE_MODEL = PaginatedOut[MediaRetrieveOutSchema]
+
+
+def build_page(items: int, photos: int) -> PaginatedOut[MediaRetrieveOutSchema]:
+    media = [
+        MediaRetrieveOutSchema(
+            id=index,
+            name=f"Media {index}",
+            description="Description of the media " * 20,
+            type=MediaType.STUDY_MATERIAL,
+            url=f"https://storage.example.com/media/{index}.pdf",
+            image_url=f"https://storage.example.com/media/{index}.jpg",
+            media_photos=[
+                MediaPhotoRetrieveOutSchema(id=index * photos + photo,
+                                            image_url=f"https://storage.example.com/photos/{index}-{photo}.jpg",
+                                            media_id=index)
+                for photo in range(photos)
+            ],
+            category_id=index % 10,
+        )
+        for index in range(items)
+    ]
+
+    return RESPONSE_MODEL(page=1, per_page=items, number_of_pages=1, total_count=items, total_filtered_count=items,
+                          items=media)
+
+
+async def endpoint():
+    pass
+
+
+async def measure_serializer(serializer, iterations: int) -> dict:
+    body = await serializer()
+    start = time.perf_counter()
+
+    for _ in range(iterations):
+        await serializer()
+
+    elapsed = time.perf_counter() - start
+
+    return {
+        "iterations": iterations,
+        "bytes": len(body),
+        "ms_per_response": round(elapsed / iterations * 1000, 3),
+    }
+
+
+async def main(items: int, photos: int, iterations: int):
+    page = build_page(items, photos)
+    fastapi_route = APIRoute("/media", endpoint, response_model=RESPONSE_MODEL)
+    schema_route = SchemaRoute("/media", endpoint, response_model=RESPONSE_MODEL, response_class=ORJSONResponse)
+
+    def fastapi_serializer(response_class):
+        async def serializer() -> bytes:
+            content = await serialize_response(field=fastapi_route.response_field, response_content=page)
+            return response_class(content=content).body
+
+        return serializer
+
+    async def schema_serializer() -> bytes:
+        return schema_route._render(page).body
+
+    serializers = {
+        "fastapi_json": fastapi_serializer(JSONResponse),
+        "fastapi_orjson": fastapi_serializer(ORJSONResponse),
+        "schema_route": schema_serializer,
+    }
+    bodies = {name: json.loads(await serializer()) for name, serializer in serializers.items()}
+
+    if any(body != bodies["fastapi_json"] for body in bodies.values()):
+        raise RuntimeError("Serializers produced different responses")
+
+    results = {name: await measure_serializer(serializer, iterations) for name, serializer in serializers.items()}
+    baseline = results["fastapi_json"]["ms_per_response"]
+
+    print_results({
+        "response_model": RESPONSE_MODEL.__name__,
+        "items": items,
+        "photos_per_item": photos,
+        **results,
+        "change_percent": {
+            name: round((result["ms_per_response"] - baseline) / baseline * 100, 1)
+            for name, result in results.items() if name != "fastapi_json"
+        },
+    })
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=200)
+    parser.add_argument("--photos", type=int, default=3)
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    run(main, args.items, args.photos, args.iterations)
@@ -0,0 +1,61 @@
+"""
+Benchmark of statistics endpoints read from materialized views and aggregated from applications on read.
+
+Needs a PostgreSQL database seeded with benchmarks/seed.py and migrated to the stats_views revision, materialized
+views are used only by PostgreSQL. Views are refreshed before measuring, so both modes return the same statistics.
+Authentication of the admin is skipped.
+
+Usage:
+    python benchmarks/stats.py --requests 500 --concurrency 10
+"""
+
+import argparse
+
+from common import API_PREFIX, get_client, measure, compare, print_results, run
+
+from main import app
+from modules.stats.repositories.sqlalchemy import SQLAlchemyStatsRepository
+from modules.users.auth.dependencies import current_superuser
+
+ENDPOINTS = ("events", "study_organisations", "attendance")
+
+
+async def main(requests: int, concurrency: int):
+    results = {}
+    app.dependency_overrides[current_superuser] = lambda: None
+
+    async with get_client(app) as client:
+        (await client.post(f"{API_PREFIX}/stats/refresh")).raise_for_status()
+
+        for endpoint in ENDPOINTS:
+            url = f"{API_PREFIX}/stats/{endpoint}"
+
+            SQLAlchemyStatsRepository.materialized_views = False
+            aggregated_body = (await client.get(url)).json()
+            aggregated = await measure(client, "GET", url, requests=requests, concurrency=concurrency)
+
+            SQLAlchemyStatsRepository.materialized_views = True
+            materialized_body = (await client.get(url)).json()
+            materialized = await measure(client, "GET", url, requests=requests, concurrency=concurrency)
+
+            if aggregated_body["items"] != materialized_body["items"]:
+                raise RuntimeError(f"Modes returned different statistics of {endpoint}")
+
+            results[f"GET {url}"] = {
+                "items": len(materialized_body["items"]),
+                "aggregated_on_read": aggregated,
+                "materialized_views": materialized,
+                "change_percent": compare(aggregated, materialized),
+            }
+
+    app.dependency_overrides.clear()
+    print_results(results)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+
+    run(main, args.requests, args.concurrency)
@@ -0,0 +1,41 @@
+"""
+Benchmark of GET /media/{id} served with the read-only unit of work and with the transactional one.
+
+Usage:
+    python benchmarks/uow.py --media-id 1 --requests 2000 --concurrency 10
+"""
+
+import argparse
+
+from common import API_PREFIX, get_client, measure, compare, print_results, run
+
+from core.dependencies.uow.sqlalchemy import get_read_only_uow, get_uow
+from main import app
+
+
+async def main(media_id: int, requests: int, concurrency: int):
+    url = f"{API_PREFIX}/media/{media_id}"
+
+    async with get_client(app) as client:
+        app.dependency_overrides[get_read_only_uow] = get_uow
+        transactional = await measure(client, "GET", url, requests=requests, concurrency=concurrency)
+
+        app.dependency_overrides.clear()
+        read_only = await measure(client, "GET", url, requests=requests, concurrency=concurrency)
+
+    print_results({
+        "endpoint": f"GET {url}",
+        "transactional": transactional,
+        "read_only": read_only,
+        "change_percent": compare(transactional, read_only),
+    })
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--media-id", type=int, default=1)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+
+    run(main, args.media_id, args.requests, args.concurrency)
@@ -0,0 +1,78 @@
+"""
+Benchmark of the per-request cost of entering and exiting the SQLAlchemy unit of work.
+
+Compares eager construction of every registered repository with lazy construction of the repositories a request
+actually uses. Sessions are created but never connect, so no database is needed.
+
+Usage:
+    python benchmarks/uow_construction.py --iterations 100000 --accessed 1
+"""
+
+import argparse
+import time
+
+from common import print_results, run
+
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+from core.uow.sqlalchemy import SqlAlchemyUnitOfWork
+from setup.sqlalchemy.uow import sqlalchemy_repositories
+
+
+class EagerSqlAlchemyUnitOfWork(SqlAlchemyUnitOfWork):
+    """
+    Unit of work constructing all repositories when the context is entered.
+    """
+
+    async def __aenter__(self):
+        uow = await super().__aenter__()
+
+        for name in self.repositories:
+            getattr(self, name)
+
+        return uow
+
+
+async def measure_uow(uow_class, session_maker, names: list, iterations: int) -> dict:
+    start = time.perf_counter()
+
+    for _ in range(iterations):
+        async with uow_class(session_maker) as uow:
+            for name in names:
+                getattr(uow, name)
+
+    elapsed = time.perf_counter() - start
+
+    return {
+        "iterations": iterations,
+        "seconds": round(elapsed, 3),
+        "us_per_request": round(elapsed / iterations * 1_000_000, 3),
+    }
+
+
+async def main(iterations: int, accessed: int):
+    engine = create_async_engine("postgresql+asyncpg://benchmark@localhost/benchmark")
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    names = list(sqlalchemy_repositories)[:accessed]
+
+    eager = await measure_uow(EagerSqlAlchemyUnitOfWork, session_maker, names, iterations)
+    lazy = await measure_uow(SqlAlchemyUnitOfWork, session_maker, names, iterations)
+
+    print_results({
+        "registered_repositories": len(sqlalchemy_repositories),
+        "accessed_repositories": names,
+        "eager": eager,
+        "lazy": lazy,
+        "change_percent": round((lazy["us_per_request"] - eager["us_per_request"]) / eager["us_per_request"] * 100, 1),
+    })
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=100000)
+    parser.add_argument("--accessed", type=int, default=1)
+    args = parser.parse_args()
+
+    run(main, args.iterations, args.accessed)
@@ -8,4 +8,10 @@ done;
 sleep 5
 
 alembic upgrade head
+
+# Metrics of worker processes are shared through files, stale files of previous runs are removed
+export PROMETHEUS_MULTIPROC_DIR="${PROMETHEUS_MULTIPROC_DIR:-/tmp/prometheus}"
+rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+
 python src/main.py
\ No newline at end of file
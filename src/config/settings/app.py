@@ -4,7 +4,7 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from config.directories import BASE_DIRECTORY
 from core.uow.generic import GenericUnitOfWork
-from setup.sqlalchemy.uow import get_sqlalchemy_uow
+from setup.sqlalchemy.uow import get_sqlalchemy_uow, get_sqlalchemy_read_only_uow
 
 
 class AppSettings(BaseSettings):
@@ -12,6 +12,12 @@ class AppSettings(BaseSettings):
     firebase_storage_bucket: str
     cors_origins: List[str]
 
-    get_uow: Callable[[], GenericUnitOfWork] = get_sqlalchemy_uow
+    auth_user_cache_ttl_seconds: float = 30.0
+    auth_user_cache_max_size: int = 1024
+
+    stats_refresh_interval_seconds: float = 300.0
+
+    get_uow: Callable[..., GenericUnitOfWork] = get_sqlalchemy_uow
+    get_read_only_uow: Callable[..., GenericUnitOfWork] = get_sqlalchemy_read_only_uow
 
     model_config = SettingsConfigDict(env_file=BASE_DIRECTORY / ".env", extra="allow")
@@ -1,4 +1,5 @@
 from abc import ABC
+from typing import List
 
 from pydantic_settings import BaseSettings
 
@@ -10,6 +11,11 @@ class PostgresSqlSettings(BaseSettings, ABC):
     pg_user: str
     pg_password: str
 
+    pg_replica_urls: List[str] = []
+    pg_replica_max_lag_seconds: float = 5.0
+    pg_replica_health_check_seconds: float = 5.0
+    pg_primary_sticky_seconds: float = 5.0
+
 
 class SqliteSettings(BaseSettings, ABC):
     sqlite_db_file: str
@@ -1,5 +1,5 @@
 from abc import ABC
-from typing import Optional, List
+from typing import Literal, Optional, List
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from config.directories import BASE_DIRECTORY
@@ -21,24 +21,93 @@ class ServerSettings(BaseSettings, ABC):
 
     origins: List[str]
     reload: bool
+    debug: bool
+
+    # Worker processes, the number of CPU cores if not set
+    server_workers: Optional[int] = None
+    server_supervisor: Literal["uvicorn", "gunicorn"] = "uvicorn"
+    server_loop: Literal["auto", "asyncio", "uvloop"] = "auto"
+    server_http: Literal["auto", "h11", "httptools"] = "auto"
+    server_keep_alive_seconds: int = 5
+    server_backlog: int = 2048
+    server_graceful_shutdown_seconds: int = 30
+    # Workers are restarted after serving this number of requests, which bounds memory growth. Ignored by
+    # the uvicorn supervisor with a single worker, which isn't restarted
+    server_limit_max_requests: Optional[int] = None
+    # Spread of worker restarts, supported by gunicorn only, uvicorn workers are restarted after the same number
+    server_max_requests_jitter: int = 0
+
+    db_slow_query_seconds: float = 0.5
+
+    # Responses smaller than the minimum size in bytes aren't compressed
+    compression_enabled: bool = True
+    compression_minimum_size: int = 1000
+    compression_gzip_level: int = 6
+    compression_brotli_quality: int = 4
+
+    metrics_enabled: bool = True
+
+    profiler_enabled: bool = True
+    profiler_max_seconds: float = 60.0
+
+    otel_enabled: bool = False
+    otel_service_name: str = "ideological-center-backend"
+    otel_exporter_otlp_endpoint: Optional[str] = None
+
+    log_level: str
+    log_file_level: str
+    log_diagnose: bool
+    log_enqueue: bool = True
+    log_access: bool = True
+    log_file: Optional[str] = "logs.log"
+    log_rotation: str = "50 MB"
+    log_retention: str = "14 days"
+    log_compression: str = "gz"
 
 
 class DevelopServerSettings(ServerSettings, PostgresSqlSettings):
     reload: bool = True
+    debug: bool = True
     origins: List[str] = ["http://localhost:3000"]
 
+    server_workers: Optional[int] = 1
+
+    log_level: str = "DEBUG"
+    log_file_level: str = "DEBUG"
+    log_diagnose: bool = True
+
     model_config = SettingsConfigDict(env_file=BASE_DIRECTORY / ".env", extra="allow")
 
 
 class TestServerSettings(ServerSettings, SqliteSettings):
     reload: bool = False
+    debug: bool = True
     origins: List[str] = ["http://localhost:3000"]
 
+    server_workers: Optional[int] = 1
+
+    log_level: str = "WARNING"
+    log_file_level: str = "WARNING"
+    log_diagnose: bool = True
+    log_file: Optional[str] = None
+
     model_config = SettingsConfigDict(env_file=BASE_DIRECTORY / ".env", extra="allow")
 
 
 class ProductionServerSettings(ServerSettings, PostgresSqlSettings):
     reload: bool = False
+    debug: bool = False
     origins: List[str] = ["http://localhost:3000"]
 
+    server_loop: Literal["auto", "asyncio", "uvloop"] = "uvloop"
+    server_http: Literal["auto", "h11", "httptools"] = "httptools"
+    # Longer than idle timeouts of reverse proxies, so they don't reuse connections the server is closing
+    server_keep_alive_seconds: int = 65
+    server_limit_max_requests: Optional[int] = 10000
+    server_max_requests_jitter: int = 1000
+
+    log_level: str = "INFO"
+    log_file_level: str = "INFO"
+    log_diagnose: bool = False
+
     model_config = SettingsConfigDict(env_file=BASE_DIRECTORY / ".env", extra="allow")
@@ -0,0 +1,44 @@
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Optional
+
+__all__ = [
+    "RequestContext",
+    "request_context",
+    "get_request_context",
+]
+
+
+@dataclass
+class RequestContext:
+    """
+    State of the request shared with code which has no access to the request, e.g. database event hooks and
+    log patchers.
+
+    Attributes:
+        request_id (str): The ID of the request.
+        db_queries (int): The number of executed database queries.
+        db_time (float): The total execution time of database queries in seconds.
+    """
+
+    request_id: str
+    db_queries: int = 0
+    db_time: float = 0.0
+
+    def add_query(self, duration: float):
+        self.db_queries += 1
+        self.db_time += duration
+
+
+request_context: ContextVar[Optional[RequestContext]] = ContextVar("request_context", default=None)
+
+
+def get_request_context() -> Optional[RequestContext]:
+    """
+    Get the context of the current request.
+
+    Returns:
+        Optional[RequestContext]: The context, or None if the code doesn't run within a request.
+    """
+
+    return request_context.get()
@@ -0,0 +1,23 @@
+from typing import List, Optional
+
+from fastapi import Query
+
+
+def get_fields(fields: Optional[str] = Query(None,
+                                             description="Comma separated names of item fields to return, "
+                                                         "all fields if not set, e.g. id,name,image_url")
+               ) -> Optional[List[str]]:
+    """
+    Dependency for getting item fields requested by the client.
+
+    Args:
+        fields (Optional[str]): The comma separated field names from the query.
+
+    Returns:
+        Optional[List[str]]: The requested field names, or None if all fields are requested.
+    """
+
+    if not fields:
+        return None
+
+    return [name.strip() for name in fields.split(",") if name.strip()] or None
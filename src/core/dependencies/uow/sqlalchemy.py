@@ -1,36 +1,83 @@
+from fastapi import Request, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.middlewares.read_your_writes import mark_primary_write, is_primary_sticky
 from core.uow.generic import GenericUnitOfWork
 from core.uow.transactions import uow_transaction, uow_transaction_with_commit
 from setup.settings.app import get_app_settings
+from setup.sqlalchemy.session import get_async_session
 
 __all__ = [
     "get_uow",
     "get_uow_with_commit",
+    "get_read_only_uow",
+    "get_primary_read_only_uow",
 ]
 
 settings = get_app_settings()
 
 
-async def get_uow() -> GenericUnitOfWork:
+async def get_uow(session: AsyncSession = Depends(get_async_session)) -> GenericUnitOfWork:
     """
     Dependency for retrieving the unit of work.
 
+    The unit of work uses the session of the request, which is shared with other dependencies, e.g. the user
+    database of authentication, so the request holds a single connection.
+
     Yields:
         GenericUnitOfWork: An instance of the GenericUnitOfWork class.
     """
 
-    uow = settings.get_uow()
+    uow = settings.get_uow(session=session)
     async with uow_transaction(uow) as uow:
         yield uow
 
 
-async def get_uow_with_commit() -> GenericUnitOfWork:
+async def get_uow_with_commit(request: Request,
+                              session: AsyncSession = Depends(get_async_session)) -> GenericUnitOfWork:
     """
     Dependency for retrieving the unit of work and committing the changes.
 
+    The unit of work uses the session of the request, which is shared with other dependencies, e.g. the user
+    database of authentication, so the request holds a single connection. The client is marked as a writer,
+    so its following reads are served by the primary database.
+
     Yields:
         GenericUnitOfWork: An instance of the GenericUnitOfWork class.
     """
 
-    uow = settings.get_uow()
+    mark_primary_write(request)
+
+    uow = settings.get_uow(session=session)
     async with uow_transaction_with_commit(uow) as uow:
         yield uow
+
+
+async def get_read_only_uow(request: Request) -> GenericUnitOfWork:
+    """
+    Dependency for retrieving the read-only unit of work.
+
+    The unit of work reads from a replica unless the client has recently written to the primary database.
+
+    Yields:
+        GenericUnitOfWork: An instance of the GenericUnitOfWork class which can't commit changes.
+    """
+
+    uow = settings.get_read_only_uow(use_primary=is_primary_sticky(request))
+    async with uow_transaction(uow) as uow:
+        yield uow
+
+
+async def get_primary_read_only_uow() -> GenericUnitOfWork:
+    """
+    Dependency for retrieving the read-only unit of work of the primary database.
+
+    Intended for reads whose results are cached, so data of a lagging replica isn't cached after an invalidation.
+
+    Yields:
+        GenericUnitOfWork: An instance of the GenericUnitOfWork class which can't commit changes.
+    """
+
+    uow = settings.get_read_only_uow(use_primary=True)
+    async with uow_transaction(uow) as uow:
+        yield uow
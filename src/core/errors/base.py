@@ -1,11 +1,12 @@
 from abc import abstractmethod, ABC
-from typing import Any, Type
+from typing import Any, Iterable, Type
 
 
 __all__ = [
     "AppError",
     "DatabaseInstanceNotFoundError",
     "DatabaseInstanceAlreadyExistsError",
+    "UnknownFieldsError",
 ]
 
 from db.sqlalchemy.models.base import Base
@@ -98,3 +99,30 @@ class DatabaseInstanceAlreadyExistsError(AppError):
     @property
     def message(self) -> str:
         return f"{self._model_class.__name__} with {self._field_name}={self._field_value} already exists"
+
+
+class UnknownFieldsError(AppError):
+    """
+    Exception class for requested fields which the schema doesn't have.
+    """
+
+    def __init__(self, fields: Iterable[str], schema_class: Type):
+        """
+        Initialize the UnknownFieldsError exception.
+
+        Args:
+            fields (Iterable[str]): The unknown field names.
+            schema_class (Type): The class of the schema.
+        """
+
+        self._fields = list(fields)
+        self._schema_class = schema_class
+        super().__init__()
+
+    @property
+    def status_code(self) -> int:
+        return 400
+
+    @property
+    def message(self) -> str:
+        return f"{self._schema_class.__name__} has no fields {', '.join(self._fields)}"
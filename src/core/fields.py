@@ -0,0 +1,92 @@
+from functools import lru_cache
+from typing import Iterable, Tuple, Type
+
+from pydantic import BaseModel, create_model
+
+from core.errors.base import UnknownFieldsError
+from core.pagination.schema import PaginatedOut
+
+__all__ = [
+    "validate_fields",
+    "get_sparse_schema",
+    "get_sparse_page_schema",
+    "is_sparse_schema_of",
+]
+
+
+def validate_fields(schema: Type[BaseModel], fields: Iterable[str]) -> Tuple[str, ...]:
+    """
+    Check that the schema has the requested fields.
+
+    Args:
+        schema (Type[BaseModel]): The schema to select fields of.
+        fields (Iterable[str]): The requested field names.
+
+    Returns:
+        Tuple[str, ...]: The requested field names without duplicates in the order of the schema fields.
+
+    Raises:
+        UnknownFieldsError: If the schema doesn't have some of the fields.
+    """
+
+    fields = set(fields)
+    unknown_fields = fields - schema.model_fields.keys()
+
+    if unknown_fields:
+        raise UnknownFieldsError(fields=sorted(unknown_fields), schema_class=schema)
+
+    return tuple(name for name in schema.model_fields if name in fields)
+
+
+@lru_cache(maxsize=256)
+def get_sparse_schema(schema: Type[BaseModel], fields: Tuple[str, ...]) -> Type[BaseModel]:
+    """
+    Create a schema with only the fields of the schema, field definitions and configuration are kept.
+
+    Args:
+        schema (Type[BaseModel]): The full schema.
+        fields (Tuple[str, ...]): The validated field names, see validate_fields.
+
+    Returns:
+        Type[BaseModel]: The sparse schema, the same class for the same fields.
+    """
+
+    sparse_schema = create_model(
+        f"Sparse{schema.__name__}",
+        __config__=schema.model_config,
+        **{name: (schema.model_fields[name].annotation, schema.model_fields[name]) for name in fields},
+    )
+    sparse_schema.__sparse_origin__ = schema
+    return sparse_schema
+
+
+def get_sparse_page_schema(schema: Type[BaseModel], fields: Tuple[str, ...]) -> Type[PaginatedOut]:
+    """
+    Get the page schema with items having only the fields of the item schema.
+
+    Args:
+        schema (Type[BaseModel]): The full schema of items.
+        fields (Tuple[str, ...]): The validated field names, see validate_fields.
+
+    Returns:
+        Type[PaginatedOut]: The page schema of sparse items.
+    """
+
+    page_schema = PaginatedOut[get_sparse_schema(schema, fields)]
+    page_schema.__sparse_origin__ = PaginatedOut[schema]
+    return page_schema
+
+
+def is_sparse_schema_of(model: Type[BaseModel], schema: Type[BaseModel]) -> bool:
+    """
+    Check whether the model is a sparse version of the schema, so its instances are valid responses of the schema.
+
+    Args:
+        model (Type[BaseModel]): The model to check.
+        schema (Type[BaseModel]): The full schema.
+
+    Returns:
+        bool: True if the model was created from the schema by get_sparse_schema or get_sparse_page_schema.
+    """
+
+    return model.__dict__.get("__sparse_origin__") is schema
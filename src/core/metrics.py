@@ -0,0 +1,69 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+__all__ = [
+    "HTTP_REQUEST_DURATION",
+    "DB_CONNECTION_CHECKOUT_DURATION",
+    "DB_CONNECTIONS_IN_USE",
+    "DB_CONNECTION_USAGE_DURATION",
+    "REPOSITORY_METHOD_DURATION",
+    "CACHE_REQUESTS",
+    "STORAGE_UPLOAD_DURATION",
+    "EMAILS_IN_FLIGHT",
+    "EMAILS_SENT",
+]
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Duration of HTTP requests by route template.",
+    ["method", "route", "status"],
+)
+
+DB_CONNECTION_CHECKOUT_DURATION = Histogram(
+    "db_connection_checkout_duration_seconds",
+    "Time spent waiting for a database connection to be established.",
+    ["engine"],
+)
+
+DB_CONNECTIONS_IN_USE = Gauge(
+    "db_connections_in_use",
+    "Number of database connections checked out from engines.",
+    ["engine"],
+    multiprocess_mode="livesum",
+)
+
+DB_CONNECTION_USAGE_DURATION = Histogram(
+    "db_connection_usage_duration_seconds",
+    "Time database connections are held between checkout and checkin.",
+    ["engine"],
+)
+
+REPOSITORY_METHOD_DURATION = Histogram(
+    "repository_method_duration_seconds",
+    "Duration of repository method calls, including their queries.",
+    ["repository", "method"],
+)
+
+CACHE_REQUESTS = Counter(
+    "cache_requests_total",
+    "Lookups of application caches by result (hit or miss).",
+    ["cache", "result"],
+)
+
+STORAGE_UPLOAD_DURATION = Histogram(
+    "storage_upload_duration_seconds",
+    "Duration of uploads to the storage bucket.",
+    ["kind"],
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+
+EMAILS_IN_FLIGHT = Gauge(
+    "emails_in_flight",
+    "Number of emails currently being sent.",
+    multiprocess_mode="livesum",
+)
+
+EMAILS_SENT = Counter(
+    "emails_sent_total",
+    "Sent emails by result (success or failure).",
+    ["result"],
+)
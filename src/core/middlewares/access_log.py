@@ -0,0 +1,96 @@
+import json
+import time
+import uuid
+
+from loguru import logger
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Scope, Receive, Send, Message
+
+from core.context.request import RequestContext, request_context
+
+__all__ = [
+    "REQUEST_ID_HEADER",
+    "DB_QUERIES_HEADER",
+    "DB_TIME_HEADER",
+    "AccessLogMiddleware",
+]
+
+REQUEST_ID_HEADER = "X-Request-ID"
+
+DB_QUERIES_HEADER = "X-DB-Queries"
+
+DB_TIME_HEADER = "X-DB-Time"
+
+MAX_REQUEST_ID_LENGTH = 128
+
+
+class AccessLogMiddleware:
+    """
+    Middleware logging one structured JSON record per request.
+
+    The middleware sets the context of the request, so the request ID is available to every log record and
+    database queries are counted and timed. The request ID is taken from the X-Request-ID header of the request
+    when present and is returned in the header of the response.
+
+    Records are logged with the `access` extra, so sinks can route them separately. With `expose_db_stats`
+    enabled, the number of queries and their total time in milliseconds are returned in X-DB-Queries and X-DB-Time
+    headers of the response, which is meant for debug mode only.
+    """
+
+    def __init__(self, app: ASGIApp, expose_db_stats: bool = False):
+        self.app = app
+        self.expose_db_stats = expose_db_stats
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = Headers(scope=scope).get(REQUEST_ID_HEADER)
+
+        if not request_id or len(request_id) > MAX_REQUEST_ID_LENGTH:
+            request_id = uuid.uuid4().hex
+
+        context = RequestContext(request_id=request_id)
+        token = request_context.set(context)
+
+        status_code = 500
+        response_size = 0
+        start = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, response_size
+
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers[REQUEST_ID_HEADER] = request_id
+
+                if self.expose_db_stats:
+                    headers[DB_QUERIES_HEADER] = str(context.db_queries)
+                    headers[DB_TIME_HEADER] = f"{context.db_time * 1000:.3f}"
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - start
+            route = scope.get("route")
+
+            record = {
+                "request_id": request_id,
+                "method": scope["method"],
+                "route": getattr(route, "path", None),
+                "path": scope["path"],
+                "status": status_code,
+                "duration_ms": round(duration * 1000, 3),
+                "db_time_ms": round(context.db_time * 1000, 3),
+                "db_queries": context.db_queries,
+                "response_size": response_size,
+            }
+
+            logger.bind(access=True).info(json.dumps(record))
+            request_context.reset(token)
@@ -0,0 +1,84 @@
+from typing import Set
+
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipResponder
+from starlette.types import ASGIApp, Scope, Receive, Send
+
+try:
+    import brotli
+    from brotli_asgi import BrotliResponder
+except ImportError:
+    brotli = None
+    BrotliResponder = None
+
+__all__ = [
+    "is_brotli_available",
+    "CompressionMiddleware",
+]
+
+
+def is_brotli_available() -> bool:
+    return BrotliResponder is not None
+
+
+def get_accepted_encodings(headers: Headers) -> Set[str]:
+    """
+    Get content encodings accepted by the client, encodings with zero quality are excluded.
+
+    Args:
+        headers (Headers): Headers of the request.
+
+    Returns:
+        Set[str]: Names of accepted encodings in lower case.
+    """
+
+    encodings = set()
+
+    for value in headers.get("Accept-Encoding", "").split(","):
+        name, _, parameters = value.partition(";")
+        quality = parameters.strip().removeprefix("q=")
+
+        if name.strip() and quality not in ("0", "0.0", "0.00", "0.000"):
+            encodings.add(name.strip().lower())
+
+    return encodings
+
+
+class CompressionMiddleware:
+    """
+    Middleware compressing responses larger than the minimum size with brotli or gzip, whichever the client accepts.
+
+    Brotli is preferred, it's used only if the optional brotli-asgi package is installed.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1000, gzip_level: int = 6, brotli_quality: int = 4):
+        """
+        Initialize a new CompressionMiddleware instance.
+
+        Args:
+            app (ASGIApp): The ASGI application.
+            minimum_size (int): The minimum size of response bodies in bytes to compress.
+            gzip_level (int): The gzip compression level from 1 to 9.
+            brotli_quality (int): The brotli quality from 0 to 11.
+        """
+
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encodings = get_accepted_encodings(Headers(scope=scope))
+
+        if "br" in encodings and is_brotli_available():
+            responder = BrotliResponder(self.app, self.brotli_quality, brotli.MODE_TEXT, 22, 0, self.minimum_size)
+        elif "gzip" in encodings:
+            responder = GZipResponder(self.app, self.minimum_size, compresslevel=self.gzip_level)
+        else:
+            responder = self.app
+
+        await responder(scope, receive, send)
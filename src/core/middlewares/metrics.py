@@ -0,0 +1,43 @@
+import time
+
+from starlette.types import ASGIApp, Scope, Receive, Send, Message
+
+from core.metrics import HTTP_REQUEST_DURATION
+
+__all__ = [
+    "MetricsMiddleware",
+]
+
+
+class MetricsMiddleware:
+    """
+    Middleware observing durations of HTTP requests by method, route template and status.
+
+    Requests which didn't match any route are observed with the "unmatched" route, so arbitrary paths don't
+    increase the cardinality of the metric.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = getattr(scope.get("route"), "path", "unmatched")
+            HTTP_REQUEST_DURATION.labels(scope["method"], route, str(status_code)).observe(time.perf_counter() - start)
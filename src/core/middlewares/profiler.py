@@ -0,0 +1,66 @@
+import asyncio
+from typing import Awaitable, Callable
+
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.types import ASGIApp, Scope, Receive, Send, Message
+
+from core.utils.profiler import SamplingProfiler
+
+__all__ = [
+    "ProfilerMiddleware",
+]
+
+
+class ProfilerMiddleware:
+    """
+    Middleware profiling requests with the `profile=1` query parameter.
+
+    Only the task of the request is sampled, so other requests served concurrently don't show up in the profile.
+    The response of the endpoint is discarded and the profile in the collapsed stack format is returned instead,
+    with the status of the endpoint and the name of its unhandled exception, if any, in headers.
+    Profiling is allowed only to requests passing the `authorize` check, other requests are served as usual.
+    """
+
+    def __init__(self, app: ASGIApp, authorize: Callable[[Request], Awaitable[bool]], interval: float = 0.001):
+        self.app = app
+        self.authorize = authorize
+        self.interval = interval
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or b"profile=1" not in scope.get("query_string", b""):
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+
+        if request.query_params.get("profile") != "1" or not await self.authorize(request):
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        error = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+
+        with SamplingProfiler(interval=self.interval, task=asyncio.current_task()) as profiler:
+            try:
+                await self.app(scope, receive, send_wrapper)
+            except Exception as e:
+                error = e
+
+        headers = {
+            "X-Profile-Duration": f"{profiler.duration:.6f}",
+            "X-Profile-Samples": str(profiler.samples.total()),
+            "X-Profile-Status": str(status_code),
+        }
+
+        if error is not None:
+            headers["X-Profile-Error"] = type(error).__name__
+
+        response = PlainTextResponse(profiler.get_collapsed_stacks(), headers=headers)
+        await response(scope, receive, send)
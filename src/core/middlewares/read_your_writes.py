@@ -0,0 +1,85 @@
+import time
+from http.cookies import SimpleCookie
+
+from starlette.datastructures import MutableHeaders
+from starlette.requests import Request
+from starlette.types import ASGIApp, Scope, Receive, Send, Message
+
+__all__ = [
+    "PRIMARY_STICKY_COOKIE",
+    "ReadYourWritesMiddleware",
+    "mark_primary_write",
+    "is_primary_sticky",
+]
+
+PRIMARY_STICKY_COOKIE = "db_primary_until"
+
+PRIMARY_WRITE_STATE_KEY = "db_primary_write"
+
+
+def mark_primary_write(request: Request) -> None:
+    """
+    Mark the request as writing to the primary database, so the client reads from the primary for a while.
+
+    Args:
+        request (Request): The request.
+    """
+
+    request.state.db_primary_write = True
+
+
+def is_primary_sticky(request: Request) -> bool:
+    """
+    Check whether the client has recently written to the primary database and must read from it.
+
+    Args:
+        request (Request): The request.
+
+    Returns:
+        bool: True if reads of the client must go to the primary database, False otherwise.
+    """
+
+    value = request.cookies.get(PRIMARY_STICKY_COOKIE)
+
+    try:
+        return value is not None and float(value) > time.time()
+    except ValueError:
+        return False
+
+
+class ReadYourWritesMiddleware:
+    """
+    Middleware setting a cookie which pins reads of the client to the primary database after a write.
+
+    Replicas may lag behind the primary, so a client reading right after its own write could miss it. Responses
+    to requests marked with `mark_primary_write` set a short-lived cookie checked with `is_primary_sticky`.
+    """
+
+    def __init__(self, app: ASGIApp, sticky_seconds: float):
+        self.app = app
+        self.sticky_seconds = sticky_seconds
+
+    def _get_cookie(self) -> str:
+        cookie = SimpleCookie()
+        cookie[PRIMARY_STICKY_COOKIE] = str(time.time() + self.sticky_seconds)
+        cookie[PRIMARY_STICKY_COOKIE]["max-age"] = int(self.sticky_seconds) + 1
+        cookie[PRIMARY_STICKY_COOKIE]["path"] = "/"
+        cookie[PRIMARY_STICKY_COOKIE]["httponly"] = True
+        cookie[PRIMARY_STICKY_COOKIE]["samesite"] = "lax"
+        return cookie.output(header="").strip()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        state = scope.setdefault("state", {})
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and state.get(PRIMARY_WRITE_STATE_KEY):
+                headers = MutableHeaders(scope=message)
+                headers.append("set-cookie", self._get_cookie())
+
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
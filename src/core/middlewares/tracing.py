@@ -0,0 +1,44 @@
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Scope, Receive, Send, Message
+
+from core.tracing import extract_context, start_span
+
+__all__ = [
+    "TracingMiddleware",
+]
+
+
+class TracingMiddleware:
+    """
+    Middleware tracing HTTP requests with server spans named after the method and the route template.
+
+    The trace context propagated by the caller in request headers (e.g. traceparent) is used as the parent.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        context = extract_context(Headers(scope=scope))
+
+        with start_span(f"{scope['method']} {scope['path']}", context=context, kind="SERVER",
+                        **{"http.request.method": scope["method"], "url.path": scope["path"]}) as span:
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start" and span is not None:
+                    span.set_attribute("http.response.status_code", message["status"])
+
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                route = getattr(scope.get("route"), "path", None)
+
+                if route is not None and span is not None:
+                    span.update_name(f"{scope['method']} {route}")
+                    span.set_attribute("http.route", route)
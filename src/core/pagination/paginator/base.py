@@ -8,7 +8,7 @@ class BasePaginator[Model](ABC):
     def __init__(self, page: int = 1, per_page: int = None):
         self._page = page
         self._per_page = per_page
-        self._limit = per_page * page if per_page else None
+        self._limit = per_page if per_page else None
         self._offset = (page - 1) * per_page if per_page else None
 
     @abstractmethod
@@ -1,6 +1,6 @@
-from typing import List
+from typing import List, Sequence
 
-from sqlalchemy import Select, select, func
+from sqlalchemy import Select, select, func, RowMapping, ColumnElement
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.pagination.model import PaginatedModel
@@ -8,11 +8,23 @@ from core.pagination.paginator.base import BasePaginator
 
 
 class SQLAlchemyPaginator[Model](BasePaginator):
-
-    def __init__(self, session: AsyncSession, query: Select, page: int = 1, per_page: int = None):
+    """
+    Paginator of a SELECT statement of columns, items are rows of the page as mappings of column labels to values.
+
+    Item columns are selected for rows of the page only, so costly columns (e.g. aggregates of related rows) aren't
+    calculated by count queries.
+    """
+
+    def __init__(self,
+                 session: AsyncSession,
+                 query: Select,
+                 page: int = 1,
+                 per_page: int = None,
+                 item_columns: Sequence[ColumnElement] = ()):
         super().__init__(page, per_page)
         self._session = session
         self._query = query
+        self._item_columns = item_columns
 
     async def get_response(self) -> PaginatedModel[Model]:
         total_count = await self._get_total_count()
@@ -27,8 +39,10 @@ class SQLAlchemyPaginator[Model](BasePaginator):
             items=await self.get_items(),
         )
 
-    async def get_items(self) -> List[Model]:
-        return [instance for instance in await self._session.scalars(self._query.limit(self._limit).offset(self._offset))]
+    async def get_items(self) -> List[RowMapping]:
+        query = self._query.add_columns(*self._item_columns) if self._item_columns else self._query
+        result = await self._session.execute(query.limit(self._limit).offset(self._offset))
+        return result.mappings().all()
 
     async def _get_total_count(self) -> int:
         stmt = select(self._query.selected_columns)
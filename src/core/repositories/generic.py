@@ -95,14 +95,17 @@ class GenericRepository[Model](ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def delete(self, id: int, *args, **kwargs):
+    async def delete(self, id: int, *args, **kwargs) -> Optional[int]:
         """
-        Delete a record by its ID and returns it.
+        Delete a record by its ID and return the ID of the deleted record.
 
         Args:
             id (int): The ID of the record to delete.
             *args: Additional positional arguments.
             **kwargs: Additional keyword arguments.
+
+        Returns:
+            Optional[int]: The ID of the deleted record or None if not found.
         """
 
         raise NotImplementedError
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Sequence, Mapping, Any
 
 from core.pagination.model import PaginatedModel
 
@@ -47,16 +47,20 @@ class IRetrieveAllMixin[Model](ABC):
     """
 
     @abstractmethod
-    async def retrieve_all(self, page: int, per_page: int, ) -> PaginatedModel[Model]:
+    async def retrieve_all(self,
+                           page: int,
+                           per_page: int,
+                           fields: Optional[Sequence[str]] = None) -> PaginatedModel[Mapping[str, Any]]:
         """
         Retrieve a page list of records .
 
         Args:
             page (int): The page number.
             per_page (int): The number of records per page.
+            fields (Optional[Sequence[str]]): The attributes to select, all attributes if None.
 
         Returns:
-            PaginatedModel[Model]: The retrieved page of records.
+            PaginatedModel[Mapping[str, Any]]: The retrieved page of records as rows of values by attribute names.
         """
 
         raise NotImplementedError
@@ -109,12 +113,35 @@ class IDeleteMixin(ABC):
     """
 
     @abstractmethod
-    async def delete(self, id: int) -> None:
+    async def delete(self, id: int) -> Optional[int]:
         """
         Delete a record by its ID.
 
         Args:
             id (int): The ID of the record to delete.
+
+        Returns:
+            Optional[int]: The ID of the deleted record or None if not found.
+        """
+
+        raise NotImplementedError
+
+
+class IExistsMixin(ABC):
+    """
+    Interface for exists mixin.
+    """
+
+    @abstractmethod
+    async def exists(self, id: int) -> bool:
+        """
+        Check if a record exists by its ID.
+
+        Args:
+            id (int): The ID of the record to check.
+
+        Returns:
+            bool: True if the record exists, False otherwise.
         """
 
         raise NotImplementedError
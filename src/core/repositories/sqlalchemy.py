@@ -1,22 +1,61 @@
+import inspect
+import time
 from abc import ABC
-from typing import Optional, List
+from collections import defaultdict
+from functools import wraps
+from typing import Optional, List, Callable, Sequence, Mapping, Any
 
 from loguru import logger
-from sqlalchemy import Select, Insert, insert, Update, update, select, Delete, delete, exists
+from sqlalchemy import Select, Insert, insert, Update, update, select, Delete, delete, exists, ColumnElement, func, \
+    literal_column, type_coerce, JSON, Label
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.hybrid import HybridExtensionType
+from sqlalchemy.orm import InstrumentedAttribute
 
+from core.metrics import REPOSITORY_METHOD_DURATION
 from core.pagination.model import PaginatedModel
 from core.pagination.paginator.sqlalchemy import SQLAlchemyPaginator
 from core.repositories.generic import GenericRepository
+from core.tracing import trace_method
+
+
+def _observe_duration(method: Callable) -> Callable:
+    traced_method = trace_method(method)
+
+    @wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        start = time.perf_counter()
+
+        try:
+            return await traced_method(self, *args, **kwargs)
+        finally:
+            REPOSITORY_METHOD_DURATION.labels(type(self).__name__, method.__name__).observe(time.perf_counter() - start)
+
+    wrapper.__observed__ = True
+    return wrapper
 
 
 class SQLAlchemyRepository[Model](GenericRepository, ABC):
     """
     An abstract base class for repository operations using SQLAlchemy.
+
+    Durations of public asynchronous methods of subclasses, including inherited ones, are observed by
+    the repository_method_duration_seconds metric and traced by spans.
     """
 
     model: Model = None
 
+    # Whether rows of relationships are aggregated to JSON by the query of records if the database supports it
+    json_aggregation: bool = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        for name, method in inspect.getmembers(cls, inspect.iscoroutinefunction):
+            if not name.startswith("_") and not getattr(method, "__observed__", False):
+                setattr(cls, name, _observe_duration(method))
+
     def __init__(self, session: AsyncSession):
         """
         Initialize a new SQLAlchemyRepository instance.
@@ -41,18 +80,119 @@ class SQLAlchemyRepository[Model](GenericRepository, ABC):
 
         return select(self.model).where(self.model.id == id)
 
-    def _get_list_stmt(self, **kwargs) -> Select:
+    def _get_list_columns(self, fields: Optional[Sequence[str]] = None) -> List[ColumnElement]:
         """
-        Create a SELECT statement to retrieve a list of records.
+        Get the columns to select for the attributes: mapped columns and SQL expressions of hybrid properties
+        labeled by attribute names. The ID is always selected.
+
+        Names which aren't columns, e.g. relationships, are skipped, they are loaded by their own queries.
 
         Args:
+            fields (Optional[Sequence[str]]): The names of attributes to select, all attributes if None.
+
+        Returns:
+            List[ColumnElement]: The columns to select.
+        """
+
+        columns = []
+
+        for name, descriptor in self.model.__mapper__.all_orm_descriptors.items():
+            if fields is not None and name not in fields and name != "id":
+                continue
+
+            if name in self.model.__mapper__.column_attrs:
+                columns.append(getattr(self.model, name))
+            elif descriptor.extension_type is HybridExtensionType.HYBRID_PROPERTY:
+                columns.append(getattr(self.model, name).label(name))
+
+        return columns
+
+    def _get_list_stmt(self, fields: Optional[Sequence[str]] = None, **kwargs) -> Select:
+        """
+        Create a SELECT statement to retrieve a list of records as rows.
+
+        Columns are selected instead of the model, so the rows aren't hydrated into instances tracked by the session.
+
+        Args:
+            fields (Optional[Sequence[str]]): The attributes to select, all attributes if None.
             **kwargs: Additional keyword arguments.
 
         Returns:
             Select: The SELECT statement to retrieve the list of records.
         """
 
-        return select(self.model)
+        return select(*self._get_list_columns(fields))
+
+    async def _add_related_rows(self,
+                                rows: Sequence[Mapping[str, Any]],
+                                relationship: InstrumentedAttribute) -> List[dict]:
+        """
+        Load rows of a one-to-many relationship of the rows by a single query.
+
+        Args:
+            rows (Sequence[Mapping[str, Any]]): The rows of records selected with their IDs.
+            relationship (InstrumentedAttribute): The relationship of the model, e.g. MuseumHall.sections.
+
+        Returns:
+            List[dict]: Copies of the rows with lists of related rows under the name of the relationship.
+        """
+
+        if not rows:
+            return []
+
+        related_mapper = relationship.property.mapper
+        [(column, related_column)] = relationship.property.local_remote_pairs
+
+        stmt = (select(*related_mapper.columns)
+                .where(related_column.in_({row[column.key] for row in rows}))
+                .order_by(*related_mapper.primary_key))
+        result = await self._session.execute(stmt)
+
+        related_rows = defaultdict(list)
+
+        for related_row in result.mappings():
+            related_rows[related_row[related_column.key]].append(related_row)
+
+        return [{**row, relationship.key: related_rows[row[column.key]]} for row in rows]
+
+    def _aggregates_json(self) -> bool:
+        """
+        Check whether rows of relationships are aggregated to JSON, only PostgreSQL databases are supported.
+
+        Returns:
+            bool: True if JSON aggregation is enabled and the session is bound to a PostgreSQL database.
+        """
+
+        return self.json_aggregation and self._session.bind.dialect.name == "postgresql"
+
+    def _get_related_json_column(self, relationship: InstrumentedAttribute) -> Label:
+        """
+        Create a column aggregating rows of a one-to-many relationship of the record to a JSON array with json_agg,
+        so records are selected with their related rows by a single query. Only PostgreSQL supports it.
+
+        Args:
+            relationship (InstrumentedAttribute): The relationship of the model, e.g. MuseumHall.sections.
+
+        Returns:
+            Label: The column of related rows ordered by ID, labeled by the name of the relationship.
+        """
+
+        related_mapper = relationship.property.mapper
+        [(column, related_column)] = relationship.property.local_remote_pairs
+
+        related_row = func.json_build_object(*[
+            argument
+            for related_mapper_column in related_mapper.columns
+            for argument in (literal_column(f"'{related_mapper_column.key}'"), related_mapper_column)
+        ])
+        related_rows = func.json_agg(aggregate_order_by(related_row, *related_mapper.primary_key))
+
+        stmt = (select(func.coalesce(related_rows, literal_column("'[]'::json")))
+                .where(related_column == column)
+                .correlate(self.model)
+                .scalar_subquery())
+
+        return type_coerce(stmt, JSON).label(relationship.key)
 
     def _get_create_stmt(self, data: dict, **kwargs) -> Insert:
         """
@@ -92,10 +232,10 @@ class SQLAlchemyRepository[Model](GenericRepository, ABC):
             **kwargs: Additional keyword arguments.
 
         Returns:
-            Delete: The DELETE statement to remove the record.
+            Delete: The DELETE statement to remove the record and return its ID.
         """
 
-        return delete(self.model).where(self.model.id == id)
+        return delete(self.model).where(self.model.id == id).returning(self.model.id)
 
     def _get_exists_stmt(self, id: int, **kwargs) -> Select:
         """
@@ -118,10 +258,10 @@ class SQLAlchemyRepository[Model](GenericRepository, ABC):
         result = result.scalar_one_or_none()
 
         if result:
-            logger.debug(f"Retrieved {self.model.__name__} with id={id}")
+            logger.debug("Retrieved {} with id={}", self.model.__name__, id)
             return result
 
-        logger.warning(f"Requested {self.model.__name__} with id={id} but it not found")
+        logger.warning("Requested {} with id={} but it not found", self.model.__name__, id)
 
     # async def retrieve_all(self, **kwargs) -> List[Model]:
     #     stmt = self._get_list_stmt(**kwargs)
@@ -132,12 +272,12 @@ class SQLAlchemyRepository[Model](GenericRepository, ABC):
     #
     #     return result
 
-    async def retrieve_all(self, page: int, per_page: int, *args, **kwargs) -> PaginatedModel[Model]:
+    async def retrieve_all(self, page: int, per_page: int, *args, **kwargs) -> PaginatedModel[Mapping[str, Any]]:
         paginator = SQLAlchemyPaginator(session=self._session,
                                         query=self._get_list_stmt(**kwargs),
                                         page=page,
                                         per_page=per_page)
-        logger.debug(f"Retrieved page {page} of {per_page} of {self.model.__name__}")
+        logger.debug("Retrieved page {} of {} of {}", page, per_page, self.model.__name__)
         return await paginator.get_response()
 
     async def create(self, data: dict, **kwargs) -> Model:
@@ -145,7 +285,7 @@ class SQLAlchemyRepository[Model](GenericRepository, ABC):
         result = await self._session.execute(stmt)
         result = result.scalar_one()
 
-        logger.debug(f"Created {self.model.__name__} with id={result.id}")
+        logger.debug("Created {} with id={}", self.model.__name__, result.id)
 
         return result
 
@@ -155,21 +295,27 @@ class SQLAlchemyRepository[Model](GenericRepository, ABC):
         result = result.scalar_one_or_none()
 
         if result:
-            logger.debug(f"Updated {self.model.__name__} with id={id}")
+            logger.debug("Updated {} with id={}", self.model.__name__, id)
             return result
 
-        logger.warning(f"Requested to update {self.model.__name__} with id={id} but it not found")
+        logger.warning("Requested to update {} with id={} but it not found", self.model.__name__, id)
 
-    async def delete(self, id: int, **kwargs):
+    async def delete(self, id: int, **kwargs) -> Optional[int]:
         stmt = self._get_delete_stmt(id=id, **kwargs)
-        await self._session.execute(stmt)
-        logger.debug(f"Deleted {self.model.__name__} with id={id}")
+        result = await self._session.execute(stmt)
+        result = result.scalar_one_or_none()
+
+        if result is not None:
+            logger.debug("Deleted {} with id={}", self.model.__name__, id)
+            return result
+
+        logger.warning("Requested to delete {} with id={} but it not found", self.model.__name__, id)
 
     async def exists(self, id: int, **kwargs) -> bool:
         stmt = self._get_exists_stmt(id, **kwargs)
         result = await self._session.execute(stmt)
         result = result.scalar()
 
-        logger.debug(f"Checked for existence {self.model.__name__} with id={id}")
+        logger.debug("Checked for existence {} with id={}", self.model.__name__, id)
 
         return result
@@ -0,0 +1,95 @@
+import inspect
+from functools import lru_cache, wraps
+from typing import Any, Callable, Type
+
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, TypeAdapter
+from starlette.responses import Response
+
+from core.fields import is_sparse_schema_of
+
+__all__ = [
+    "get_type_adapter",
+    "serialize_schema",
+    "SchemaRoute",
+]
+
+
+@lru_cache(maxsize=None)
+def get_type_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(model)
+
+
+def serialize_schema(content: BaseModel) -> bytes:
+    """
+    Serialize the schema instance to JSON bytes without validating it.
+
+    Args:
+        content (BaseModel): The schema instance.
+
+    Returns:
+        bytes: The JSON representation of the instance using field aliases.
+    """
+
+    return get_type_adapter(type(content)).dump_json(content, by_alias=True)
+
+
+class SchemaRoute(APIRoute):
+    """
+    Route serializing response schema instances returned by the endpoint without validating them again.
+
+    FastAPI dumps a returned model to a dictionary, validates the dictionary against the response model and
+    serializes the validated copy. Services already return instances of response schemas, which are valid, so
+    such instances are serialized straight to JSON bytes by the schema serializer. The same goes for sparse
+    versions of response schemas returned for requested fields, see core.fields. Other return values are handled
+    by FastAPI as usual. The response model is still declared, so OpenAPI documents the schema.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs):
+        super().__init__(path, self._wrap_endpoint(endpoint), **kwargs)
+
+        # Routers including this route create their own copies from the original endpoint
+        self.endpoint = endpoint
+
+        # Options changing the serialized content and headers set on an injected Response need FastAPI serialization
+        self._serializes_schemas = (
+            self.response_model is not None
+            and self.response_model_include is None
+            and self.response_model_exclude is None
+            and self.response_model_by_alias
+            and not self.response_model_exclude_unset
+            and not self.response_model_exclude_defaults
+            and not self.response_model_exclude_none
+            and self.dependant.response_param_name is None
+        )
+
+    def _wrap_endpoint(self, endpoint: Callable[..., Any]) -> Callable[..., Any]:
+        if not inspect.iscoroutinefunction(endpoint):
+            return endpoint
+
+        @wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            content = await endpoint(*args, **kwargs)
+
+            if self._serializes_schemas and self._is_response_schema(type(content)):
+                return self._render(content)
+
+            return content
+
+        return wrapper
+
+    def _is_response_schema(self, model: type) -> bool:
+        # Sparse schemas are subsets of the response model with requested fields only
+        return model is self.response_model or is_sparse_schema_of(model, self.response_model)
+
+    def _render(self, content: BaseModel) -> Response:
+        response_class = self.response_class
+
+        if isinstance(response_class, DefaultPlaceholder):
+            response_class = response_class.value
+
+        # The body is already JSON, so it's sent as is with the media type of the response class
+        return Response(content=serialize_schema(content),
+                        status_code=self.status_code or 200,
+                        media_type=response_class.media_type)
@@ -1,8 +1,8 @@
 from abc import ABC, abstractmethod
-from dataclasses import asdict
-from typing import List
+from typing import List, Optional, Sequence, Tuple, Mapping, Any
 
 __all__ = [
+    "ServiceMixin",
     "RetrieveMixin",
     "RetrieveAllMixin",
     "CreateMixin",
@@ -12,12 +12,26 @@ __all__ = [
 
 from pydantic import BaseModel
 
+from core.fields import validate_fields, get_sparse_page_schema
 from core.pagination.model import PaginatedModel
 from core.pagination.schema import PaginatedOut
+from core.tracing import trace_async_methods
 from core.uow.generic import GenericUnitOfWork
 
 
-class RetrieveMixin[Model, RetrieveOut: BaseModel](ABC):
+class ServiceMixin(ABC):
+    """
+    Base class of service mixins.
+
+    Public asynchronous methods of services, including inherited ones, are traced by spans named after the service.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        trace_async_methods(cls)
+
+
+class RetrieveMixin[Model, RetrieveOut: BaseModel](ServiceMixin):
     """
     Mixin class for retrieving instances by ID.
 
@@ -129,7 +143,7 @@ class RetrieveMixin[Model, RetrieveOut: BaseModel](ABC):
 #         return self.get_list_schema(instance_list)
 
 
-class RetrieveAllMixin[Model, RetrieveOut: BaseModel](ABC):
+class RetrieveAllMixin[Model, RetrieveOut: BaseModel](ServiceMixin):
     """
     Mixin class for listing instances.
 
@@ -147,35 +161,51 @@ class RetrieveAllMixin[Model, RetrieveOut: BaseModel](ABC):
                                      page: int,
                                      per_page: int,
                                      uow: GenericUnitOfWork,
-                                     **kwargs) -> PaginatedModel[Model]:
+                                     fields: Optional[Tuple[str, ...]] = None,
+                                     **kwargs) -> PaginatedModel[Mapping[str, Any]]:
         """
-        List all database instances from the repository.
+        List all database records from the repository as rows.
 
         Args:
             uow (GenericUnitOfWork): The unit of work instance.
             page (int): The page number.
             per_page (int): The number of records per page.
+            fields (Optional[Tuple[str, ...]]): The fields of the retrieve schema to load, all fields if None.
 
         Returns:
-            List[Model]: List of instances.
+            PaginatedModel[Mapping[str, Any]]: The page of rows of values by attribute names.
         """
 
         raise NotImplementedError
 
-    def get_page_schema(self, paginated_model: PaginatedModel) -> PaginatedOut[RetrieveOut]:
+    def get_page_schema(self,
+                        paginated_model: PaginatedModel,
+                        fields: Optional[Tuple[str, ...]] = None) -> PaginatedOut[RetrieveOut]:
         """
         Get the output schema for the list of instances.
 
         Args:
-            paginated_model (PaginatedModel): The paginated model.
+            paginated_model (PaginatedModel): The paginated model of rows.
+            fields (Optional[Tuple[str, ...]]): The fields of the retrieve schema to include, all fields if None.
 
         Returns:
             PaginatedOut: The validated schema for output representation of the paginated model.
         """
 
-        return self.schema_paginated_out.model_validate(asdict(paginated_model))
+        if fields is None:
+            schema = self.schema_paginated_out
+        else:
+            schema = get_sparse_page_schema(self.schema_retrieve_out, fields)
+
+        # Rows are validated straight into item schemas, the page isn't copied to a dictionary first
+        return schema.model_validate(paginated_model, from_attributes=True)
 
-    async def retrieve_all(self, uow: GenericUnitOfWork, page: int, per_page: int, **kwargs) -> PaginatedOut[RetrieveOut]:
+    async def retrieve_all(self,
+                           uow: GenericUnitOfWork,
+                           page: int,
+                           per_page: int,
+                           fields: Optional[Sequence[str]] = None,
+                           **kwargs) -> PaginatedOut[RetrieveOut]:
         """
         List all instances.
 
@@ -183,17 +213,26 @@ class RetrieveAllMixin[Model, RetrieveOut: BaseModel](ABC):
             uow (GenericUnitOfWork): The unit of work instance.
             page (int): The page number.
             per_page (int): The number of records per page.
+            fields (Optional[Sequence[str]]): The fields of the retrieve schema to return, all fields if None.
+                Only the columns and relationships the fields need are loaded.
 
         Returns:
             List[RetrieveOut]: List of instances.
+
+        Raises:
+            UnknownFieldsError: If the retrieve schema doesn't have some of the fields.
         """
 
-        paginated_model = await self.retrieve_all_instances(uow=uow, page=page, per_page=per_page, **kwargs)
+        if fields is not None:
+            fields = validate_fields(self.schema_retrieve_out, fields)
+
+        paginated_model = await self.retrieve_all_instances(uow=uow, page=page, per_page=per_page, fields=fields,
+                                                            **kwargs)
 
-        return self.get_page_schema(paginated_model)
+        return self.get_page_schema(paginated_model, fields)
 
 
-class CreateMixin[Model, CreateIn: BaseModel, CreateOut: BaseModel](ABC):
+class CreateMixin[Model, CreateIn: BaseModel, CreateOut: BaseModel](ServiceMixin):
     """
     Mixin class for creating instances.
 
@@ -250,7 +289,7 @@ class CreateMixin[Model, CreateIn: BaseModel, CreateOut: BaseModel](ABC):
         return self.get_create_schema(created_instance)
 
 
-class UpdateMixin[Model, UpdateIn: BaseModel, UpdateOut: BaseModel](ABC):
+class UpdateMixin[Model, UpdateIn: BaseModel, UpdateOut: BaseModel](ServiceMixin):
     """
     Mixin class for updating instances.
 
@@ -310,7 +349,7 @@ class UpdateMixin[Model, UpdateIn: BaseModel, UpdateOut: BaseModel](ABC):
         return self.get_update_schema(updated_instance)
 
 
-class DeleteMixin[Model](ABC):
+class DeleteMixin[Model](ServiceMixin):
     """
     Mixin class for deleting instances.
 
@@ -0,0 +1,111 @@
+import inspect
+from contextlib import nullcontext
+from functools import wraps
+from typing import Any, Callable, Mapping, Optional
+
+try:
+    from opentelemetry import propagate, trace
+except ImportError:
+    propagate = None
+    trace = None
+
+__all__ = [
+    "is_tracing_available",
+    "set_tracer",
+    "start_span",
+    "extract_context",
+    "trace_method",
+    "trace_async_methods",
+]
+
+_tracer = None
+
+
+def is_tracing_available() -> bool:
+    return trace is not None
+
+
+def set_tracer(tracer) -> None:
+    """
+    Set the tracer spans are started with. Until it's set, spans aren't created at all.
+
+    Args:
+        tracer: The OpenTelemetry tracer, or None to disable tracing.
+    """
+
+    global _tracer
+    _tracer = tracer
+
+
+def extract_context(headers: Mapping[str, str]):
+    """
+    Extract the trace context propagated by the caller from request headers.
+
+    Args:
+        headers (Mapping[str, str]): Headers of the request.
+
+    Returns:
+        The OpenTelemetry context, or None if tracing is disabled.
+    """
+
+    if _tracer is None:
+        return None
+
+    return propagate.extract(headers)
+
+
+def start_span(name: str, context=None, kind: Optional[str] = None, **attributes: Any):
+    """
+    Start a span as the current one, or do nothing if tracing is disabled.
+
+    Args:
+        name (str): The name of the span.
+        context: The parent context, the current one by default.
+        kind (Optional[str]): The name of the span kind, e.g. "SERVER" or "CLIENT". INTERNAL by default.
+        **attributes (Any): Attributes of the span.
+
+    Returns:
+        A context manager yielding the span, or None if tracing is disabled.
+    """
+
+    if _tracer is None:
+        return nullcontext()
+
+    span_kind = getattr(trace.SpanKind, kind) if kind else trace.SpanKind.INTERNAL
+    return _tracer.start_as_current_span(name, context=context, kind=span_kind, attributes=attributes)
+
+
+def trace_method(method: Callable) -> Callable:
+    """
+    Wrap the asynchronous method, so its calls are traced by spans named after the class of the instance.
+
+    Args:
+        method (Callable): The method.
+
+    Returns:
+        Callable: The wrapped method.
+    """
+
+    @wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        if _tracer is None:
+            return await method(self, *args, **kwargs)
+
+        with _tracer.start_as_current_span(f"{type(self).__name__}.{method.__name__}"):
+            return await method(self, *args, **kwargs)
+
+    wrapper.__traced__ = True
+    return wrapper
+
+
+def trace_async_methods(cls: type) -> None:
+    """
+    Trace public asynchronous methods of the class, including inherited ones, which aren't traced yet.
+
+    Args:
+        cls (type): The class.
+    """
+
+    for name, method in inspect.getmembers(cls, inspect.iscoroutinefunction):
+        if not name.startswith("_") and not getattr(method, "__traced__", False):
+            setattr(cls, name, trace_method(method))
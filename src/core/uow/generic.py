@@ -1,8 +1,14 @@
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Callable, List
 
-from modules.events.repositories.interfaces import IEventsRepository, IEventApplicationsRepository
-from modules.media.repositories.interfaces import IMediaRepository, IMediaCategoryRepository, IMediaPhotoRepository
-from modules.museum.repositories.interfaces import IMuseumSectionRepository, IMuseumHallRepository
+from loguru import logger
+
+if TYPE_CHECKING:
+    from modules.events.repositories.interfaces import IEventsRepository, IEventApplicationsRepository
+    from modules.media.repositories.interfaces import IMediaRepository, IMediaCategoryRepository, \
+        IMediaPhotoRepository
+    from modules.museum.repositories.interfaces import IMuseumSectionRepository, IMuseumHallRepository
+    from modules.stats.repositories.interfaces import IStatsRepository
 
 
 class GenericUnitOfWork(ABC):
@@ -11,22 +17,54 @@ class GenericUnitOfWork(ABC):
 
     This class defines the basic structure of a unit of work context manager. Subclasses should implement the
     `commit` and `rollback` methods to provide transaction control logic specific to the data store.
+
+    Repositories are provided by modules, the annotations below only describe the ones services rely on.
+
+    Callbacks registered with `on_commit` run after the transaction is committed, e.g. to invalidate caches of
+    the changed data, and are discarded if it's rolled back.
     """
 
-    museum_hall: IMuseumHallRepository = None
-    museum_section: IMuseumSectionRepository = None
-    media: IMediaRepository = None
-    media_category: IMediaCategoryRepository = None
-    media_photo: IMediaPhotoRepository = None
-    events: IEventsRepository = None
-    events_applications: IEventApplicationsRepository = None
+    museum_hall: "IMuseumHallRepository"
+    museum_section: "IMuseumSectionRepository"
+    media: "IMediaRepository"
+    media_category: "IMediaCategoryRepository"
+    media_photo: "IMediaPhotoRepository"
+    events: "IEventsRepository"
+    events_applications: "IEventApplicationsRepository"
+    stats: "IStatsRepository"
 
     async def __aenter__(self):
+        self._commit_callbacks: List[Callable[[], None]] = []
         return self
 
     async def __aexit__(self, exc_type, exc_value, traceback):
         await self.rollback()
 
+    def on_commit(self, callback: Callable[[], None]):
+        """
+        Register a callback to run after the transaction is committed.
+
+        Args:
+            callback (Callable[[], None]): The function to call without arguments.
+        """
+
+        self._commit_callbacks.append(callback)
+
+    def _run_commit_callbacks(self):
+        """
+        Run and discard callbacks registered for the committed transaction.
+
+        Errors of callbacks are logged, the transaction is already committed, so they aren't raised.
+        """
+
+        callbacks, self._commit_callbacks = self._commit_callbacks, []
+
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                logger.exception("Commit callback {} failed", callback)
+
     @abstractmethod
     async def commit(self):
         """
@@ -0,0 +1,88 @@
+import importlib
+import pkgutil
+from types import ModuleType
+from typing import Callable, Dict, Optional, Type
+
+from loguru import logger
+
+__all__ = [
+    "RepositoryRegistry",
+    "sqlalchemy_repositories",
+]
+
+
+class RepositoryRegistry:
+    """
+    Registry of repository classes by unit of work attribute names.
+
+    Modules register their repositories, so units of work can expose them without importing modules directly.
+    """
+
+    def __init__(self, module_name: str):
+        """
+        Initialize a new RepositoryRegistry instance.
+
+        Args:
+            module_name (str): The name of the submodule of each application module which registers repositories,
+                e.g. "repositories.sqlalchemy".
+        """
+
+        self._module_name = module_name
+        self._repositories: Dict[str, Type] = {}
+
+    def register(self, name: str) -> Callable[[Type], Type]:
+        """
+        Decorator registering the repository class under the name.
+
+        Args:
+            name (str): The name of the unit of work attribute to expose the repository as.
+
+        Returns:
+            Callable[[Type], Type]: The decorator returning the repository class unchanged.
+
+        Raises:
+            ValueError: If another repository class is already registered under the name.
+        """
+
+        def decorator(repository_class: Type) -> Type:
+            registered_class = self._repositories.get(name)
+
+            if registered_class is not None and registered_class is not repository_class:
+                raise ValueError(f"Repository '{name}' is already registered as {registered_class.__name__}")
+
+            self._repositories[name] = repository_class
+            return repository_class
+
+        return decorator
+
+    def get(self, name: str) -> Optional[Type]:
+        return self._repositories.get(name)
+
+    def __iter__(self):
+        return iter(self._repositories)
+
+    def __len__(self) -> int:
+        return len(self._repositories)
+
+    def autodiscover(self, package: ModuleType):
+        """
+        Import the registering submodule of each module of the package, so their repositories get registered.
+
+        Args:
+            package (ModuleType): The package containing application modules.
+        """
+
+        for module in pkgutil.iter_modules(package.__path__):
+            module_name = f"{package.__name__}.{module.name}.{self._module_name}"
+
+            try:
+                importlib.import_module(module_name)
+            except ModuleNotFoundError as e:
+                if e.name is None or not module_name.startswith(e.name):
+                    raise
+                continue
+
+            logger.debug(f"Registered repositories of {module_name}")
+
+
+sqlalchemy_repositories = RepositoryRegistry("repositories.sqlalchemy")
@@ -1,11 +1,10 @@
-from typing import Callable
+from typing import Callable, Optional
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from modules.events.repositories.sqlalchemy import SQLAlchemyEventsRepository, SQLAlchemyEventApplicationsRepository
-from modules.media.repositories.sqlalchemy import SQLAlchemyMediaRepository, SQLAlchemyMediaCategoryRepository, \
-    SQLAlchemyMediaPhotoRepository
-from modules.museum.repositories.sqlalchemy import SQLAlchemyMuseumSectionRepository, SQLAlchemyMuseumHallRepository
+from core.repositories.sqlalchemy import SQLAlchemyRepository
 from core.uow.generic import GenericUnitOfWork
+from core.uow.registry import RepositoryRegistry, sqlalchemy_repositories
 
 
 class SqlAlchemyUnitOfWork(GenericUnitOfWork):
@@ -13,44 +12,100 @@ class SqlAlchemyUnitOfWork(GenericUnitOfWork):
     Unit of work context manager for SQLAlchemy.
 
     This class provides a context manager for managing transactions with SQLAlchemy. It initializes the
-    necessary repositories and session for database operations. It should be used in conjunction with the
-    `uow_transaction` or `uow_transaction_with_commit` context managers.
+    necessary session for database operations, repositories are created on first access. It should be used in
+    conjunction with the `uow_transaction` or `uow_transaction_with_commit` context managers.
+
+    The unit of work either creates its own session with the session factory and closes it on exit, or uses the
+    given session (e.g. the one shared by dependencies of the request), whose owner is responsible for closing it.
 
     Attributes:
+        repositories (RepositoryRegistry): Registry of repository classes by unit of work attribute names.
     """
 
-    def __init__(self, session_factory: Callable[[], AsyncSession]):
+    repositories: RepositoryRegistry = sqlalchemy_repositories
+
+    def __init__(self,
+                 session_factory: Optional[Callable[[], AsyncSession]] = None,
+                 session: Optional[AsyncSession] = None):
+        """
+        Initialize a new SqlAlchemyUnitOfWork instance.
+
+        Args:
+            session_factory (Optional[Callable[[], AsyncSession]]): Factory of sessions owned by the unit of work.
+            session (Optional[AsyncSession]): The session to use instead of creating one.
+        """
+
+        if session_factory is None and session is None:
+            raise ValueError("Either session factory or session must be provided")
+
         self._session_factory = session_factory
+        self._shared_session = session
         super().__init__()
 
-    def _init_repositories(self, session: AsyncSession):
-        self.media = SQLAlchemyMediaRepository(session)
-        self.media_category = SQLAlchemyMediaCategoryRepository(session)
-        self.media_photo = SQLAlchemyMediaPhotoRepository(session)
-        self.events = SQLAlchemyEventsRepository(session)
-        self.events_applications = SQLAlchemyEventApplicationsRepository(session)
-        self.museum_hall = SQLAlchemyMuseumHallRepository(session)
-        self.museum_section = SQLAlchemyMuseumSectionRepository(session)
+    def __getattr__(self, name: str) -> SQLAlchemyRepository:
+        repository_class = self.repositories.get(name)
+
+        if repository_class is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        repository = repository_class(self._session)
+        setattr(self, name, repository)
+        return repository
 
     async def __aenter__(self):
-        self._session = self._session_factory()
-        self._init_repositories(self._session)
+        self._session = self._shared_session or self._session_factory()
+
+        for name in self.repositories:
+            self.__dict__.pop(name, None)
+
         return await super().__aenter__()
 
     async def __aexit__(self, *args):
         await super().__aexit__(*args)
-        await self._session.close()
+
+        if self._shared_session is None:
+            await self._session.close()
 
     async def commit(self):
         """
-        Commit the transaction.
+        Commit the transaction and run callbacks registered with `on_commit`.
         """
 
         await self._session.commit()
+        self._run_commit_callbacks()
 
     async def rollback(self):
         """
-        Rollback the transaction.
+        Rollback the transaction and discard callbacks registered with `on_commit`.
         """
 
+        self._commit_callbacks.clear()
         await self._session.rollback()
+
+
+class SqlAlchemyReadOnlyUnitOfWork(SqlAlchemyUnitOfWork):
+    """
+    Read-only unit of work context manager for SQLAlchemy.
+
+    Sessions of this unit of work are expected to be bound to a read-only engine with AUTOCOMMIT isolation level,
+    so no transaction is started and there is nothing to roll back when the context is exited.
+    """
+
+    async def commit(self):
+        """
+        Commit the transaction.
+
+        Raises:
+            RuntimeError: Always, since the read-only unit of work can't persist changes.
+        """
+
+        raise RuntimeError("Read-only unit of work can't be committed")
+
+    async def rollback(self):
+        """
+        Rollback the transaction.
+
+        Does nothing, since no transaction is started by the read-only unit of work.
+        """
+
+        pass
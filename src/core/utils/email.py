@@ -1,4 +1,10 @@
+from typing import Any, Awaitable, Callable
+
+from fastapi import BackgroundTasks
 from fastapi_mail import MessageSchema
+
+from core.metrics import EMAILS_IN_FLIGHT, EMAILS_SENT
+from core.tracing import start_span
 from setup.email import fm
 
 
@@ -10,4 +16,32 @@ async def send_email(receiver_email: str, subject: str, body: str):
         subtype="html",
     )
 
-    await fm.send_message(message)
+    with start_span("smtp.send", kind="CLIENT"):
+        await fm.send_message(message)
+
+
+async def _send_scheduled_email(send_func: Callable[..., Awaitable[Any]], *args, **kwargs):
+    EMAILS_IN_FLIGHT.inc()
+
+    try:
+        await send_func(*args, **kwargs)
+        EMAILS_SENT.labels("success").inc()
+    except Exception:
+        EMAILS_SENT.labels("failure").inc()
+        raise
+    finally:
+        EMAILS_IN_FLIGHT.dec()
+
+
+def schedule_email(background_tasks: BackgroundTasks, send_func: Callable[..., Awaitable[Any]], *args, **kwargs):
+    """
+    Schedule sending an email after the response, tracking the number of emails in flight.
+
+    Args:
+        background_tasks (BackgroundTasks): Background tasks of the request.
+        send_func (Callable[..., Awaitable[Any]]): The coroutine function sending the email.
+        *args: Positional arguments of the function.
+        **kwargs: Keyword arguments of the function.
+    """
+
+    background_tasks.add_task(_send_scheduled_email, send_func, *args, **kwargs)
@@ -3,6 +3,9 @@ from typing import Any
 
 from firebase_admin import storage
 
+from core.metrics import STORAGE_UPLOAD_DURATION
+from core.tracing import start_span
+
 
 def upload_image_to_firebase(folder_path: str, id: int, image_url: str, image_filename: str, image: Any) -> str:
     bucket = storage.bucket()
@@ -16,11 +19,19 @@ def upload_image_to_firebase(folder_path: str, id: int, image_url: str, image_fi
         image_url = '/'.join(image_url.split('/')[2:-1])
         image_url = f'{image_url}/{uid}.{blob_image_ext}'
         blob = bucket.blob(image_url)
-        blob.delete()
+
+        with start_span("storage.delete", kind="CLIENT", **{"storage.blob": image_url}):
+            blob.delete()
 
     blob = bucket.blob(f'{folder_path}/{uid}.{image_ext}')
-    blob.upload_from_file(image)
-    blob.make_public()
+
+    with start_span("storage.upload", kind="CLIENT", **{"storage.blob": blob.name}), \
+            STORAGE_UPLOAD_DURATION.labels("image").time():
+        blob.upload_from_file(image)
+
+    with start_span("storage.make_public", kind="CLIENT", **{"storage.blob": blob.name}):
+        blob.make_public()
+
     return blob.public_url
 
 
@@ -36,9 +47,17 @@ def upload_file_to_firebase(folder_path: str, id: int, url: str, filename: str,
         url = '/'.join(url.split('/')[2:-1])
         url = f'{url}/{uid}.{blob_file_ext}'
         blob = bucket.blob(url)
-        blob.delete()
+
+        with start_span("storage.delete", kind="CLIENT", **{"storage.blob": url}):
+            blob.delete()
 
     blob = bucket.blob(f'{folder_path}/{uid}.{file_ext}')
-    blob.upload_from_file(file)
-    blob.make_public()
+
+    with start_span("storage.upload", kind="CLIENT", **{"storage.blob": blob.name}), \
+            STORAGE_UPLOAD_DURATION.labels("file").time():
+        blob.upload_from_file(file)
+
+    with start_span("storage.make_public", kind="CLIENT", **{"storage.blob": blob.name}):
+        blob.make_public()
+
     return blob.public_url
@@ -0,0 +1,151 @@
+import asyncio
+import sys
+import threading
+import time
+from collections import Counter
+from types import FrameType
+from typing import List, Optional
+
+__all__ = [
+    "SamplingProfiler",
+]
+
+
+def _format_frame(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{code.co_qualname} ({code.co_filename}:{code.co_firstlineno})"
+
+
+def _get_thread_stack(frame: Optional[FrameType]) -> List[str]:
+    stack = []
+
+    while frame is not None:
+        stack.append(_format_frame(frame))
+        frame = frame.f_back
+
+    stack.reverse()
+    return stack
+
+
+def _get_task_stack(task: asyncio.Task, thread_frame: Optional[FrameType]) -> List[str]:
+    coroutine = task.get_coro()
+
+    # The running task has no await chain, its frames are on the stack of the event loop thread
+    if getattr(coroutine, "cr_running", False):
+        stack = []
+        frame = thread_frame
+
+        while frame is not None:
+            stack.append(_format_frame(frame))
+
+            if frame is coroutine.cr_frame:
+                stack.reverse()
+                return stack
+
+            frame = frame.f_back
+
+        return []
+
+    stack = []
+    awaitable = coroutine
+
+    while awaitable is not None:
+        frame = getattr(awaitable, "cr_frame", None) or getattr(awaitable, "gi_frame", None) \
+                or getattr(awaitable, "ag_frame", None)
+
+        if frame is None:
+            # The innermost awaitable is e.g. a future the task is waiting for
+            stack.append(f"<await {type(awaitable).__name__}>")
+            break
+
+        stack.append(_format_frame(frame))
+        awaitable = getattr(awaitable, "cr_await", None) or getattr(awaitable, "gi_yieldfrom", None) \
+                    or getattr(awaitable, "ag_await", None)
+
+    return stack
+
+
+class SamplingProfiler:
+    """
+    Statistical profiler sampling stacks from a background thread.
+
+    It samples either the stack of a thread (what the thread is executing, e.g. CPU-bound code on the event loop),
+    or the await chain of an asyncio task (where the task is executing or waiting, e.g. on database queries), which
+    profiles a single request without other requests running on the same event loop.
+
+    Samples are reported in the collapsed stack format ("root;child;leaf count" per line), which flame graph
+    tools like flamegraph.pl and speedscope accept.
+    """
+
+    def __init__(self,
+                 interval: float = 0.005,
+                 thread_id: Optional[int] = None,
+                 task: Optional[asyncio.Task] = None):
+        """
+        Initialize a new SamplingProfiler instance.
+
+        Args:
+            interval (float): The interval between samples in seconds.
+            thread_id (Optional[int]): The ID of the thread to sample. The current thread by default.
+            task (Optional[asyncio.Task]): The task to sample instead of the thread. It must run on the thread.
+        """
+
+        self.interval = interval
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.task = task
+        self.samples: Counter[str] = Counter()
+        self.duration = 0.0
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._start_time = 0.0
+
+    def _sample(self):
+        thread_frame = sys._current_frames().get(self.thread_id)
+
+        if self.task is not None:
+            stack = _get_task_stack(self.task, thread_frame)
+        else:
+            stack = _get_thread_stack(thread_frame)
+
+        if stack:
+            self.samples[";".join(stack)] += 1
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            try:
+                self._sample()
+            except (RuntimeError, ValueError):
+                # The sampled stack changed while it was being walked, the sample is skipped
+                continue
+
+    def start(self):
+        self._start_time = time.perf_counter()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+        self.duration = time.perf_counter() - self._start_time
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def get_collapsed_stacks(self) -> str:
+        """
+        Get samples in the collapsed stack format, the most frequent stacks first.
+
+        Returns:
+            str: The collapsed stacks.
+        """
+
+        return "\n".join(f"{stack} {count}" for stack, count in self.samples.most_common())
@@ -0,0 +1,82 @@
+"""stats views
+
+Revision ID: d41f8c6b2e57
+Revises: b82e4c7f9a13
+Create Date: 2026-10-19 19:48:21.730416
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd41f8c6b2e57'
+down_revision: Union[str, None] = 'b82e4c7f9a13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Views are refreshed concurrently, which requires a unique index covering all rows of each view
+
+VIEWS = {
+    "event_application_stats": (
+        """
+        SELECT event_id, status, count(*) AS applications_count
+        FROM events_applications
+        GROUP BY event_id, status
+        """,
+        ["event_id", "status"],
+    ),
+    "study_organisation_stats": (
+        """
+        SELECT study_organisation,
+               count(DISTINCT lower(email)) AS applicants_count,
+               count(*) AS applications_count,
+               count(*) FILTER (WHERE status = 'ACCEPTED') AS accepted_count
+        FROM events_applications
+        GROUP BY study_organisation
+        """,
+        ["study_organisation"],
+    ),
+    "event_attendance_stats": (
+        """
+        SELECT date_trunc('month', events.start_date)::date AS month,
+               count(*) AS events_count,
+               coalesce(sum(applications.applications_count), 0)::bigint AS applications_count,
+               coalesce(sum(applications.accepted_count), 0)::bigint AS accepted_count
+        FROM events
+        LEFT JOIN (
+            SELECT event_id,
+                   count(*) AS applications_count,
+                   count(*) FILTER (WHERE status = 'ACCEPTED') AS accepted_count
+            FROM events_applications
+            GROUP BY event_id
+        ) AS applications ON applications.event_id = events.id
+        GROUP BY 1
+        """,
+        ["month"],
+    ),
+}
+
+
+def upgrade() -> None:
+    op.create_table('stats_refreshes',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('refreshed_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+    for name, (query, unique_columns) in VIEWS.items():
+        op.execute(f"CREATE MATERIALIZED VIEW {name} AS {query}")
+        op.execute(f"CREATE UNIQUE INDEX ix_{name}_unique ON {name} ({', '.join(unique_columns)})")
+
+    op.execute("INSERT INTO stats_refreshes (id, refreshed_at) VALUES (1, localtimestamp)")
+
+
+def downgrade() -> None:
+    for name in reversed(list(VIEWS)):
+        op.execute(f"DROP MATERIALIZED VIEW {name}")
+
+    op.drop_table('stats_refreshes')
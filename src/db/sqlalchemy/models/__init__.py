@@ -1,5 +1,6 @@
 from .user import User
-from .museum import MuseumHall, MuseumSection
+from .museum import MuseumHall, MuseumSection, MuseumTreeVersion
 from .media import Media, MediaCategory, MediaType, MediaPhoto
 from .events import EventType, Event
 from .application import EventApplicationStatus, EventApplication
+from .stats import StatsRefresh
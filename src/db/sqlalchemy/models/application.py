@@ -1,6 +1,6 @@
 import enum
 
-from sqlalchemy import Column, Integer, String, Date, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, Date, ForeignKey, Enum, Index, func
 
 from db.sqlalchemy.models.base import Base
 
@@ -25,3 +25,8 @@ class EventApplication(Base):
 
     event_id = Column(Integer, ForeignKey("events.id", ondelete="CASCADE"), nullable=False)
     status = Column(Enum(EventApplicationStatus), nullable=False, default=EventApplicationStatus.PENDING)
+
+    # An email applies to an event once, repeated submissions are resolved by the index
+    __table_args__ = (
+        Index("ix_events_applications_event_id_lower_email", event_id, func.lower(email), unique=True),
+    )
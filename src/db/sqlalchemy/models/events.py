@@ -29,6 +29,11 @@ class Event(Base):
     start_date = Column(Date(), nullable=False)
     end_date = Column(Date(), nullable=False)
 
+    # Maximum number of applications, unlimited if not set. Counters are updated with applications by services
+    capacity = Column(Integer, nullable=True)
+    applications_count = Column(Integer, nullable=False, default=0, server_default="0")
+    accepted_count = Column(Integer, nullable=False, default=0, server_default="0")
+
     @hybrid_property
     def status(self):
         if datetime.now().date() < self.start_date:
@@ -40,8 +45,10 @@ class Event(Base):
 
     @status.expression
     def status(cls):
+        # Values are selected, enum members can't be bound as parameters
         return case(
-            (datetime.now().date() < cls.start_date, EventType.PLANNED),
-            (and_(cls.start_date <= datetime.now().date(), datetime.now().date() < cls.end_date), EventType.PASSING),
-            else_=EventType.PASSED,
+            (datetime.now().date() < cls.start_date, EventType.PLANNED.value),
+            (and_(cls.start_date <= datetime.now().date(), datetime.now().date() < cls.end_date),
+             EventType.PASSING.value),
+            else_=EventType.PASSED.value,
         )
@@ -33,6 +33,7 @@ class Media(Base):
         Integer,
         ForeignKey("media_category.id", name="fk_media_category", ondelete="SET NULL"),
         nullable=True,
+        index=True,
     )
 
     category = relationship("MediaCategory",
@@ -68,4 +69,5 @@ class MediaPhoto(Base):
         Integer,
         ForeignKey("media.id", name="fk_media_photo_media", ondelete="CASCADE"),
         nullable=False,
+        index=True,
     )
@@ -32,3 +32,14 @@ class MuseumSection(Base):
         ForeignKey("museum_hall.id", name="fk_museum_section_hall", ondelete="CASCADE"),
         nullable=False,
     )
+
+
+class MuseumTreeVersion(Base):
+    """
+    The version of the tree of halls and sections, a single row with id=1 incremented by each change of the tree.
+    """
+
+    __tablename__ = "museum_tree_versions"
+
+    id = Column(Integer, primary_key=True)
+    version = Column(Integer, nullable=False)
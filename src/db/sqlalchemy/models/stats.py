@@ -0,0 +1,14 @@
+from sqlalchemy import Column, Integer, DateTime
+
+from db.sqlalchemy.models.base import Base
+
+
+class StatsRefresh(Base):
+    """
+    The time of the last refresh of statistics materialized views, a single row with id=1.
+    """
+
+    __tablename__ = "stats_refreshes"
+
+    id = Column(Integer, primary_key=True)
+    refreshed_at = Column(DateTime(), nullable=False)
@@ -1,18 +1,35 @@
 from fastapi import FastAPI, APIRouter
+from fastapi.responses import ORJSONResponse
 
 from setup.app.cores import register_cors
 from setup.app.lifespan import lifespan
+from setup.app.metrics import register_metrics
+from setup.app.middlewares import register_middlewares
+from setup.app.profiler import register_profiler
 from setup.app.routes import register_routes
 from setup.app.run import start_app
+from setup.logger import configure_logger
 from setup.settings.app import get_app_settings
+from setup.settings.server import get_server_settings
+from setup.tracing import configure_tracing
 
-app = FastAPI(title="Resource Center", lifespan=lifespan, root_path='/server')
+app = FastAPI(title="Resource Center", lifespan=lifespan, root_path='/server', default_response_class=ORJSONResponse)
 api_router = APIRouter(prefix="/api/v1")
 settings = get_app_settings()
+server_settings = get_server_settings()
 
+configure_logger(server_settings)
+configure_tracing(server_settings)
 register_cors(app, settings.cors_origins)
+register_middlewares(app)
 register_routes(app, api_router)
 
+if server_settings.metrics_enabled:
+    register_metrics(app)
+
+if server_settings.profiler_enabled:
+    register_profiler(app)
+
 
 if __name__ == "__main__":
     start_app("main:app")
@@ -1,23 +1,26 @@
 from fastapi import APIRouter, Depends
 
-from core.dependencies.uow.sqlalchemy import get_uow, get_uow_with_commit
+from core.dependencies.uow.sqlalchemy import get_read_only_uow, get_uow_with_commit
 from core.errors.handler import handle_app_errors
 from core.uow.generic import GenericUnitOfWork
-from db.sqlalchemy.models import User
+from core.routing import SchemaRoute
 from modules.events.dependencies.services import get_event_application_service
 from modules.events.schemas import EventApplicationRetrieveOutSchema, EventApplicationUpdateOutSchema, \
     EventApplicationUpdateInSchema
 from modules.events.services import EventApplicationService
-from modules.users.auth import fastapi_users
+from modules.users.auth.cache import AuthUser
+from modules.users.auth.dependencies import current_superuser
 
-events_applications_router = APIRouter(prefix="/events/applications", tags=["events_applications"])
+events_applications_router = APIRouter(prefix="/events/applications",
+                                       tags=["events_applications"],
+                                       route_class=SchemaRoute)
 
 
 @events_applications_router.get("/{id}", response_model=EventApplicationRetrieveOutSchema)
 @handle_app_errors
 async def retrieve(id: int,
                    service: EventApplicationService = Depends(get_event_application_service),
-                   uow: GenericUnitOfWork = Depends(get_uow)):
+                   uow: GenericUnitOfWork = Depends(get_read_only_uow)):
     return await service.retrieve(id=id, uow=uow)
 
 
@@ -25,7 +28,7 @@ async def retrieve(id: int,
 @handle_app_errors
 async def update(id: int,
                  item: EventApplicationUpdateInSchema,
-                 admin: User = Depends(fastapi_users.current_user(superuser=True)),
+                 admin: AuthUser = Depends(current_superuser),
                  service: EventApplicationService = Depends(get_event_application_service),
                  uow: GenericUnitOfWork = Depends(get_uow_with_commit)):
     return await service.update(id=id, item=item, uow=uow)
@@ -34,7 +37,7 @@ async def update(id: int,
 @events_applications_router.delete("/{id}")
 @handle_app_errors
 async def delete(id: int,
-                 admin: User = Depends(fastapi_users.current_user(superuser=True)),
+                 admin: AuthUser = Depends(current_superuser),
                  service: EventApplicationService = Depends(get_event_application_service),
                  uow: GenericUnitOfWork = Depends(get_uow_with_commit)):
     await service.delete(id=id, uow=uow)
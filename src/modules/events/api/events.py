@@ -3,19 +3,22 @@ from typing import Optional, List
 
 from fastapi import APIRouter, Query, Depends, UploadFile, File, HTTPException
 
-from core.dependencies.uow.sqlalchemy import get_uow, get_uow_with_commit
+from core.dependencies.fields import get_fields
+from core.dependencies.uow.sqlalchemy import get_read_only_uow, get_uow_with_commit
 from core.errors.handler import handle_app_errors
 from core.pagination.schema import PaginatedOut
 from core.uow.generic import GenericUnitOfWork
-from db.sqlalchemy.models import EventApplicationStatus, User
+from core.routing import SchemaRoute
+from db.sqlalchemy.models import EventApplicationStatus
 from modules.events.dependencies.services import get_event_service, get_event_application_service
 from modules.events.schemas import EventRetrieveOutSchema, EventCreateOutSchema, EventCreateInSchema, \
     EventUpdateInSchema, EventUpdateOutSchema, EventApplicationRetrieveOutSchema, EventApplicationCreateOutSchema, \
     EventApplicationCreateInSchema
 from modules.events.services import EventService, EventApplicationService
-from modules.users.auth import fastapi_users
+from modules.users.auth.cache import AuthUser
+from modules.users.auth.dependencies import current_superuser
 
-events_router = APIRouter(prefix="/events", tags=["events"])
+events_router = APIRouter(prefix="/events", tags=["events"], route_class=SchemaRoute)
 
 
 @events_router.get("/", response_model=PaginatedOut[EventRetrieveOutSchema])
@@ -25,13 +28,15 @@ async def retrieve_all(page: int = Query(None),
                        name_contains: Optional[str] = Query(None),
                        start_dt: Optional[datetime.date] = Query(None),
                        end_dt: Optional[datetime.date] = Query(None),
+                       fields: Optional[List[str]] = Depends(get_fields),
                        service: EventService = Depends(get_event_service),
-                       uow: GenericUnitOfWork = Depends(get_uow)):
+                       uow: GenericUnitOfWork = Depends(get_read_only_uow)):
     return await service.retrieve_all(page=page,
                                       per_page=per_page,
                                       name_contains=name_contains,
                                       start_dt=start_dt,
                                       end_dt=end_dt,
+                                      fields=fields,
                                       uow=uow)
 
 
@@ -39,14 +44,14 @@ async def retrieve_all(page: int = Query(None),
 @handle_app_errors
 async def retrieve(id: int,
                    service: EventService = Depends(get_event_service),
-                   uow: GenericUnitOfWork = Depends(get_uow)):
+                   uow: GenericUnitOfWork = Depends(get_read_only_uow)):
     return await service.retrieve(id=id, uow=uow)
 
 
 @events_router.post("/", response_model=EventCreateOutSchema)
 @handle_app_errors
 async def create(event: EventCreateInSchema,
-                 admin: User = Depends(fastapi_users.current_user(superuser=True)),
+                 admin: AuthUser = Depends(current_superuser),
                  service: EventService = Depends(get_event_service),
                  uow: GenericUnitOfWork = Depends(get_uow_with_commit)):
     return await service.create(item=event, uow=uow)
@@ -56,7 +61,7 @@ async def create(event: EventCreateInSchema,
 @handle_app_errors
 async def update(id: int,
                  event: EventUpdateInSchema,
-                 admin: User = Depends(fastapi_users.current_user(superuser=True)),
+                 admin: AuthUser = Depends(current_superuser),
                  service: EventService = Depends(get_event_service),
                  uow: GenericUnitOfWork = Depends(get_uow_with_commit)):
     return await service.update(id=id, item=event, uow=uow)
@@ -65,7 +70,7 @@ async def update(id: int,
 @events_router.delete("/{id}")
 @handle_app_errors
 async def delete(id: int,
-                 admin: User = Depends(fastapi_users.current_user(superuser=True)),
+                 admin: AuthUser = Depends(current_superuser),
                  service: EventService = Depends(get_event_service),
                  uow: GenericUnitOfWork = Depends(get_uow_with_commit)):
     await service.delete(id=id, uow=uow)
@@ -76,7 +81,7 @@ async def delete(id: int,
 @handle_app_errors
 async def upload_image(id: int,
                        image: UploadFile = File(...),
-                       admin: User = Depends(fastapi_users.current_user(superuser=True)),
+                       admin: AuthUser = Depends(current_superuser),
                        service: EventService = Depends(get_event_service),
                        uow: GenericUnitOfWork = Depends(get_uow_with_commit)):
     if not image.content_type.startswith('image'):
@@ -92,13 +97,15 @@ async def retrieve_event_applications(event_id: int,
                                       per_page: int = Query(None),
                                       fio_contains: Optional[str] = Query(None),
                                       statuses: Optional[List[EventApplicationStatus]] = Query(None),
+                                      fields: Optional[List[str]] = Depends(get_fields),
                                       service: EventApplicationService = Depends(get_event_application_service),
-                                      uow: GenericUnitOfWork = Depends(get_uow)):
+                                      uow: GenericUnitOfWork = Depends(get_read_only_uow)):
     return await service.retrieve_all(page=page,
                                       per_page=per_page,
                                       fio_contains=fio_contains,
                                       statuses=statuses,
                                       event_id=event_id,
+                                      fields=fields,
                                       uow=uow)
 
 
@@ -1,4 +1,4 @@
-from core.errors.base import DatabaseInstanceNotFoundError, AppError
+from core.errors.base import DatabaseInstanceNotFoundError, DatabaseInstanceAlreadyExistsError, AppError
 from db.sqlalchemy.models import Event, EventApplication
 
 
@@ -39,7 +39,32 @@ class EventAlreadyFinishedError(AppError):
         return f"Event with id={self._id} already finished"
 
 
+class EventCapacityExceededError(AppError):
+
+    def __init__(self, id: int):
+        self._id = id
+        super().__init__()
+
+    @property
+    def status_code(self) -> int:
+        return 409
+
+    @property
+    def message(self) -> str:
+        return f"Event with id={self._id} has no places left"
+
+
 class EventApplicationNotFoundError(DatabaseInstanceNotFoundError):
 
     def __init__(self, id: int):
         super().__init__(field_name="id", field_value=id, model_class=EventApplication)
+
+
+class EventApplicationAlreadyExistsError(DatabaseInstanceAlreadyExistsError):
+
+    def __init__(self, email: str):
+        super().__init__(field_name="email", field_value=email, model_class=EventApplication)
+
+    @property
+    def status_code(self) -> int:
+        return 409
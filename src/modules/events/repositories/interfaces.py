@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Sequence, Mapping, Any, Tuple
 
 from core.pagination.model import PaginatedModel
 from core.repositories.interfaces import IRetrieveMixin, ICreateMixin, IUpdateMixin, IDeleteMixin
@@ -20,8 +20,39 @@ class IEventsRepository(IRetrieveMixin[Event],
     async def retrieve_all(self, page: int,
                            per_page: int,
                            name_contains: Optional[str] = None,
+                           fields: Optional[Sequence[str]] = None,
                            *args,
-                           **kwargs) -> PaginatedModel[Event]:
+                           **kwargs) -> PaginatedModel[Mapping[str, Any]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def increment_applications_count(self, id: int) -> Optional[Mapping[str, Any]]:
+        """
+        Count a new application of the event unless the event is full.
+
+        The check and the increment are a single statement, so concurrent applications can't exceed the capacity.
+
+        Args:
+            id (int): The ID of the event.
+
+        Returns:
+            Optional[Mapping[str, Any]]: The id, name, start_date and end_date of the event, or None if the event
+                is not found or full.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update_counters(self, id: int, applications_delta: int = 0, accepted_delta: int = 0):
+        """
+        Change numbers of applications and accepted applications of the event.
+
+        Args:
+            id (int): The ID of the event.
+            applications_delta (int): The change of the number of applications.
+            accepted_delta (int): The change of the number of accepted applications.
+        """
+
         raise NotImplementedError
 
 
@@ -41,6 +72,54 @@ class IEventApplicationsRepository(IRetrieveMixin[EventApplication],
                            fio_contains: Optional[str] = None,
                            event_id: Optional[int] = None,
                            statuses: Optional[List[int]] = None,
+                           fields: Optional[Sequence[str]] = None,
                            *args,
-                           **kwargs) -> PaginatedModel[EventApplication]:
+                           **kwargs) -> PaginatedModel[Mapping[str, Any]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update(self, id: int, data: dict) -> Optional[EventApplication]:
+        """
+        Update an application by its ID.
+
+        Args:
+            id (int): The ID of the application to update.
+            data (dict): The data to update the application.
+
+        Returns:
+            Optional[EventApplication]: The updated application or None if not found.
+
+        Raises:
+            EventApplicationAlreadyExistsError: If another application of the event has the email.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_returning(self, id: int) -> Optional[Mapping[str, Any]]:
+        """
+        Delete an application by its ID.
+
+        Args:
+            id (int): The ID of the application to delete.
+
+        Returns:
+            Optional[Mapping[str, Any]]: The event_id and status of the deleted application, or None if not found.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def create_or_retrieve(self, data: dict) -> Optional[Tuple[EventApplication, bool]]:
+        """
+        Create an application unless the email has already applied to the event, emails are compared ignoring case.
+
+        Args:
+            data (dict): The data of the application.
+
+        Returns:
+            Optional[Tuple[EventApplication, bool]]: The created or the existing application and whether it was
+                created, or None if the event is not found.
+        """
+
         raise NotImplementedError
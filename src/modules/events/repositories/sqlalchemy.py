@@ -1,16 +1,26 @@
 import datetime
-from typing import Optional, List
+from typing import Optional, List, Sequence, Mapping, Any, Tuple
 
 from loguru import logger
-from sqlalchemy import func
+from sqlalchemy import func, update, delete, or_, Select, Boolean, literal_column
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
 
 from core.pagination.model import PaginatedModel
 from core.pagination.paginator.sqlalchemy import SQLAlchemyPaginator
 from core.repositories.sqlalchemy import SQLAlchemyRepository
+from core.uow.registry import sqlalchemy_repositories
 from db.sqlalchemy.models import Event, EventApplication, EventApplicationStatus
-from modules.events.repositories.interfaces import IEventsRepository
+from modules.events.errors import EventApplicationAlreadyExistsError
+from modules.events.repositories.interfaces import IEventsRepository, IEventApplicationsRepository
 
+# SQLSTATE of errors of inserted rows referencing missing rows
+FOREIGN_KEY_VIOLATION = "23503"
+# SQLSTATE of errors of rows duplicating values of unique indexes
+UNIQUE_VIOLATION = "23505"
 
+
+@sqlalchemy_repositories.register("events")
 class SQLAlchemyEventsRepository(SQLAlchemyRepository[Event], IEventsRepository):
     model = Event
 
@@ -19,8 +29,9 @@ class SQLAlchemyEventsRepository(SQLAlchemyRepository[Event], IEventsRepository)
                            per_page: int,
                            name_contains: Optional[str] = None,
                            start_dt: Optional[datetime.date] = None,
-                           end_dt: Optional[datetime.date] = None) -> PaginatedModel[Event]:
-        stmt = self._get_list_stmt()
+                           end_dt: Optional[datetime.date] = None,
+                           fields: Optional[Sequence[str]] = None) -> PaginatedModel[Mapping[str, Any]]:
+        stmt = self._get_list_stmt(fields=fields)
 
         if name_contains:
             stmt = stmt.where(Event.name.contains(name_contains))
@@ -37,20 +48,58 @@ class SQLAlchemyEventsRepository(SQLAlchemyRepository[Event], IEventsRepository)
                                         query=stmt,
                                         page=page,
                                         per_page=per_page)
-        logger.debug(f"Retrieved page {page} of {per_page} of {self.model.__name__}")
+        logger.debug("Retrieved page {} of {} of {}", page, per_page, self.model.__name__)
 
         return await paginator.get_response()
 
-
-class SQLAlchemyEventApplicationsRepository(SQLAlchemyRepository[EventApplication], IEventsRepository):
+    async def increment_applications_count(self, id: int) -> Optional[Mapping[str, Any]]:
+        stmt = (update(Event)
+                .where(Event.id == id,
+                       or_(Event.capacity.is_(None), Event.applications_count < Event.capacity))
+                .values(applications_count=Event.applications_count + 1)
+                .returning(Event.id, Event.name, Event.start_date, Event.end_date)
+                .execution_options(synchronize_session=False))
+        result = await self._session.execute(stmt)
+        result = result.mappings().one_or_none()
+
+        if result:
+            logger.debug("Incremented applications count of {} with id={}", self.model.__name__, id)
+            return result
+
+        logger.warning("Requested to increment applications count of {} with id={} but it not found or full",
+                       self.model.__name__, id)
+
+    async def update_counters(self, id: int, applications_delta: int = 0, accepted_delta: int = 0):
+        stmt = (update(Event)
+                .where(Event.id == id)
+                .values(applications_count=Event.applications_count + applications_delta,
+                        accepted_count=Event.accepted_count + accepted_delta)
+                .execution_options(synchronize_session=False))
+        await self._session.execute(stmt)
+
+        logger.debug("Updated counters of {} with id={} by {} applications and {} accepted", self.model.__name__, id,
+                     applications_delta, accepted_delta)
+
+
+@sqlalchemy_repositories.register("events_applications")
+class SQLAlchemyEventApplicationsRepository(SQLAlchemyRepository[EventApplication], IEventApplicationsRepository):
     model = EventApplication
 
+    def _get_retrieve_stmt(self, id: int, for_update: bool = False, **kwargs) -> Select:
+        stmt = super()._get_retrieve_stmt(id=id, **kwargs)
+
+        if for_update:
+            stmt = stmt.with_for_update()
+
+        return stmt
+
     async def retrieve_all(self, page: int,
                            per_page: int,
                            fio_contains: Optional[str] = None,
                            statuses: Optional[List[int]] = None,
-                           event_id: Optional[int] = None) -> PaginatedModel[EventApplication]:
-        stmt = self._get_list_stmt()
+                           event_id: Optional[int] = None,
+                           fields: Optional[Sequence[str]] = None) -> PaginatedModel[Mapping[str, Any]]:
+        stmt = self._get_list_stmt(fields=fields)
 
         if fio_contains:
             stmt = stmt.where(func.lower(EventApplication.fio).like(f'%{fio_contains.lower()}%'))
@@ -65,6 +114,55 @@ class SQLAlchemyEventApplicationsRepository(SQLAlchemyRepository[EventApplicatio
                                         query=stmt,
                                         page=page,
                                         per_page=per_page)
-        logger.debug(f"Retrieved page {page} of {per_page} of {self.model.__name__}")
+        logger.debug("Retrieved page {} of {} of {}", page, per_page, self.model.__name__)
 
         return await paginator.get_response()
+
+    async def update(self, id: int, data: dict, **kwargs) -> Optional[EventApplication]:
+        try:
+            return await super().update(id=id, data=data, **kwargs)
+        except IntegrityError as e:
+            if getattr(e.orig, "sqlstate", None) != UNIQUE_VIOLATION:
+                raise
+
+            raise EventApplicationAlreadyExistsError(email=data["email"])
+
+    async def delete_returning(self, id: int) -> Optional[Mapping[str, Any]]:
+        stmt = (delete(EventApplication)
+                .where(EventApplication.id == id)
+                .returning(EventApplication.event_id, EventApplication.status))
+        result = await self._session.execute(stmt)
+        result = result.mappings().one_or_none()
+
+        if result:
+            logger.debug("Deleted {} with id={}", self.model.__name__, id)
+            return result
+
+        logger.warning("Requested to delete {} with id={} but it not found", self.model.__name__, id)
+
+    async def create_or_retrieve(self, data: dict) -> Optional[Tuple[EventApplication, bool]]:
+        # The existing row is returned by a no-op update, it was inserted by the statement if it has no xmax
+        stmt = (insert(EventApplication)
+                .values(**data)
+                .on_conflict_do_update(index_elements=[EventApplication.event_id, func.lower(EventApplication.email)],
+                                       set_={"email": EventApplication.email})
+                .returning(EventApplication, literal_column("events_applications.xmax = 0", Boolean)))
+
+        try:
+            result = await self._session.execute(stmt)
+        except IntegrityError as e:
+            if getattr(e.orig, "sqlstate", None) != FOREIGN_KEY_VIOLATION:
+                raise
+
+            logger.warning("Requested to create {} of event with id={} but it not found", self.model.__name__,
+                           data["event_id"])
+            return None
+
+        instance, created = result.one()
+
+        if created:
+            logger.debug("Created {} with id={}", self.model.__name__, instance.id)
+        else:
+            logger.debug("Retrieved existing {} with id={}", self.model.__name__, instance.id)
+
+        return instance, created
@@ -18,6 +18,7 @@ class EventBaseSchema(BaseModel):
 
     start_date: datetime = Field(examples=[datetime.now()])
     end_date: datetime = Field(examples=[datetime.now()])
+    capacity: Optional[int] = Field(ge=1, examples=[30, 100], default=None)
 
 
 class EventRetrieveOutSchema(EventBaseSchema):
@@ -27,6 +28,8 @@ class EventRetrieveOutSchema(EventBaseSchema):
     status: EventType = Field(examples=[EventType.PLANNED,
                                         EventType.PASSING,
                                         EventType.PASSED])
+    applications_count: int = Field(ge=0, examples=[1, 2, 3, 4, 5])
+    accepted_count: int = Field(ge=0, examples=[1, 2, 3, 4, 5])
 
     model_config = {
         "from_attributes": True,
@@ -45,6 +48,8 @@ class EventCreateOutSchema(EventBaseSchema):
     status: EventType = Field(examples=[EventType.PLANNED,
                                         EventType.PASSING,
                                         EventType.PASSED])
+    applications_count: int = Field(ge=0, examples=[1, 2, 3, 4, 5])
+    accepted_count: int = Field(ge=0, examples=[1, 2, 3, 4, 5])
     model_config = {
         "from_attributes": True,
         "use_enum_values": True
@@ -62,6 +67,8 @@ class EventUpdateOutSchema(EventBaseSchema):
     status: EventType = Field(examples=[EventType.PLANNED,
                                         EventType.PASSING,
                                         EventType.PASSED])
+    applications_count: int = Field(ge=0, examples=[1, 2, 3, 4, 5])
+    accepted_count: int = Field(ge=0, examples=[1, 2, 3, 4, 5])
     model_config = {
         "from_attributes": True,
         "use_enum_values": True
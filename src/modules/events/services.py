@@ -1,6 +1,5 @@
-from dataclasses import asdict
-from datetime import datetime
-from typing import Optional, List
+from datetime import datetime, date
+from typing import Optional, List, Sequence, Tuple, Mapping, Any
 
 from fastapi import UploadFile, BackgroundTasks
 from loguru import logger
@@ -9,9 +8,10 @@ from core.pagination.model import PaginatedModel
 from core.pagination.schema import PaginatedOut
 from core.services.mixins import RetrieveMixin, RetrieveAllMixin, CreateMixin, UpdateMixin, DeleteMixin
 from core.uow.generic import GenericUnitOfWork
+from core.utils.email import schedule_email
 from db.sqlalchemy.models import Event, EventApplication, EventApplicationStatus
 from modules.events.errors import EventNotFoundError, EventApplicationNotFoundError, EventAlreadyStartedError, \
-    EventAlreadyFinishedError
+    EventAlreadyFinishedError, EventCapacityExceededError
 from modules.events.schemas import EventRetrieveOutSchema, EventCreateOutSchema, EventCreateInSchema, \
     EventUpdateOutSchema, EventUpdateInSchema, EventApplicationCreateOutSchema, EventApplicationUpdateOutSchema, \
     EventApplicationUpdateInSchema, EventApplicationCreateInSchema, EventApplicationRetrieveOutSchema
@@ -21,7 +21,7 @@ from modules.events.utils.firebase import upload_event_image_to_firebase
 
 
 class EventService(RetrieveMixin[Event, EventRetrieveOutSchema],
-                   # RetrieveAllMixin[Event, EventRetrieveOutSchema],
+                   RetrieveAllMixin[Event, EventRetrieveOutSchema],
                    CreateMixin[Event, EventCreateInSchema, EventCreateOutSchema],
                    UpdateMixin[Event, EventUpdateInSchema, EventUpdateOutSchema],
                    DeleteMixin[Event]):
@@ -45,8 +45,10 @@ class EventService(RetrieveMixin[Event, EventRetrieveOutSchema],
                                      name_contains: Optional[str] = None,
                                      start_dt: Optional[datetime.date] = None,
                                      end_dt: Optional[datetime.date] = None,
-                                     **kwargs) -> PaginatedModel[Event]:
-        return await uow.events.retrieve_all(page=page, per_page=per_page, name_contains=name_contains, start_dt=start_dt, end_dt=end_dt)
+                                     fields: Optional[Tuple[str, ...]] = None,
+                                     **kwargs) -> PaginatedModel[Mapping[str, Any]]:
+        return await uow.events.retrieve_all(page=page, per_page=per_page, name_contains=name_contains,
+                                             start_dt=start_dt, end_dt=end_dt, fields=fields)
 
     async def create_instance(self, item: EventCreateInSchema, uow: GenericUnitOfWork, **kwargs) -> Event:
         data = item.model_dump()
@@ -54,15 +56,18 @@ class EventService(RetrieveMixin[Event, EventRetrieveOutSchema],
 
     async def update_instance(self, id: int, item: EventUpdateInSchema, uow: GenericUnitOfWork, **kwargs) -> Event:
         data = item.model_dump()
-        return await uow.events.update(id=id, data=data)
-
-    async def delete_instance(self, id: int, uow: GenericUnitOfWork, **kwargs):
-        instance = await uow.events.retrieve(id=id)
+        instance = await uow.events.update(id=id, data=data)
 
         if not instance:
             raise EventNotFoundError(id=id)
 
-        await uow.events.delete(id=id)
+        return instance
+
+    async def delete_instance(self, id: int, uow: GenericUnitOfWork, **kwargs):
+        deleted_id = await uow.events.delete(id=id)
+
+        if deleted_id is None:
+            raise EventNotFoundError(id=id)
 
     async def retrieve_all(self,
                            page: int,
@@ -71,15 +76,15 @@ class EventService(RetrieveMixin[Event, EventRetrieveOutSchema],
                            name_contains: Optional[str] = None,
                            start_dt: Optional[datetime.date] = None,
                            end_dt: Optional[datetime.date] = None,
+                           fields: Optional[Sequence[str]] = None,
                            ) -> PaginatedOut[EventRetrieveOutSchema]:
-        paginated_model = await self.retrieve_all_instances(page=page,
-                                                            per_page=per_page,
-                                                            uow=uow,
-                                                            name_contains=name_contains,
-                                                            start_dt=start_dt,
-                                                            end_dt=end_dt)
-
-        return self.schema_paginated_out.model_validate(asdict(paginated_model))
+        return await super().retrieve_all(page=page,
+                                          per_page=per_page,
+                                          uow=uow,
+                                          name_contains=name_contains,
+                                          start_dt=start_dt,
+                                          end_dt=end_dt,
+                                          fields=fields)
 
     async def upload_image(self, id: int, image: UploadFile, uow: GenericUnitOfWork, **kwargs) -> EventUpdateOutSchema:
         instance = await uow.events.retrieve(id=id)
@@ -100,6 +105,7 @@ class EventService(RetrieveMixin[Event, EventRetrieveOutSchema],
 
 
 class EventApplicationService(RetrieveMixin[EventApplication, EventApplicationRetrieveOutSchema],
+                              RetrieveAllMixin[EventApplication, EventApplicationRetrieveOutSchema],
                               UpdateMixin[EventApplication,
                               EventApplicationUpdateInSchema,
                               EventApplicationUpdateOutSchema],
@@ -127,64 +133,102 @@ class EventApplicationService(RetrieveMixin[EventApplication, EventApplicationRe
                                      fio_contains: Optional[str] = None,
                                      statuses: Optional[List[int]] = None,
                                      event_id: Optional[int] = None,
-                                     **kwargs) -> PaginatedModel[EventApplication]:
+                                     fields: Optional[Tuple[str, ...]] = None,
+                                     **kwargs) -> PaginatedModel[Mapping[str, Any]]:
         return await uow.events_applications.retrieve_all(page=page, per_page=per_page, fio_contains=fio_contains,
-                                                          statuses=statuses, event_id=event_id)
+                                                          statuses=statuses, event_id=event_id, fields=fields)
 
     async def create_instance(self, event_id: int, item: EventApplicationCreateInSchema, uow: GenericUnitOfWork,
                               **kwargs) -> EventApplication:
-        event_instance = await uow.events.retrieve(id=event_id)
+        data = item.model_dump()
+        data["event_id"] = event_id
 
-        if not event_instance:
+        # Repeated submissions get the existing application, it's neither counted nor notified again
+        result = await uow.events_applications.create_or_retrieve(data=data)
+
+        if not result:
             raise EventNotFoundError(id=event_id)
 
-        # Check if event in time
-        if event_instance.start_date < datetime.now().date() < event_instance.end_date:
-            raise EventAlreadyStartedError(id=event_id)
+        instance, created = result
 
-        if event_instance.end_date < datetime.now().date():
-            raise EventAlreadyFinishedError(id=event_id)
+        if not created:
+            return instance
 
-        data = item.model_dump()
-        data["event_id"] = event_id
+        # The transaction is rolled back with the created application if it's refused
+        event = await uow.events.increment_applications_count(id=event_id)
+
+        if not event:
+            event_instance = await uow.events.retrieve(id=event_id)
+
+            if not event_instance:
+                raise EventNotFoundError(id=event_id)
 
-        instance = await uow.events_applications.create(data=data)
+            self._check_event_in_time(event_id=event_id,
+                                      start_date=event_instance.start_date,
+                                      end_date=event_instance.end_date)
 
-        self._job_scheduler.add_task(send_application_created_email, instance.email, event_instance.name)
+            raise EventCapacityExceededError(id=event_id)
+
+        self._check_event_in_time(event_id=event_id, start_date=event["start_date"], end_date=event["end_date"])
+
+        schedule_email(self._job_scheduler, send_application_created_email, instance.email, event["name"])
 
         return instance
 
+    @staticmethod
+    def _check_event_in_time(event_id: int, start_date: date, end_date: date):
+        if start_date < datetime.now().date() < end_date:
+            raise EventAlreadyStartedError(id=event_id)
+
+        if end_date < datetime.now().date():
+            raise EventAlreadyFinishedError(id=event_id)
+
     async def update_instance(self, id: int, item: EventApplicationUpdateInSchema, uow: GenericUnitOfWork,
                               **kwargs) -> EventApplication:
-        instance = await uow.events_applications.retrieve(id=id)
+        data = item.model_dump()
+
+        # The application is locked, so concurrent changes of its status are counted once
+        instance = await uow.events_applications.retrieve(id=id, for_update=True)
 
         if not instance:
             raise EventApplicationNotFoundError(id=id)
 
-        event_instance = await uow.events.retrieve(id=instance.event_id)
+        was_accepted = instance.status == EventApplicationStatus.ACCEPTED
 
-        if not event_instance:
-            raise EventNotFoundError(id=instance.event_id)
+        updated_instance = await uow.events_applications.update(id=id, data=data)
+        is_accepted = updated_instance.status == EventApplicationStatus.ACCEPTED
 
-        data = item.model_dump()
+        if was_accepted != is_accepted:
+            await uow.events.update_counters(id=updated_instance.event_id, accepted_delta=1 if is_accepted else -1)
 
-        updated_instance = await uow.events_applications.update(id=id, data=data)
+        if updated_instance.status not in (EventApplicationStatus.ACCEPTED, EventApplicationStatus.REJECTED):
+            return updated_instance
+
+        # Event name is needed only for notification emails
+        event_instance = await uow.events.retrieve(id=updated_instance.event_id)
+
+        if not event_instance:
+            raise EventNotFoundError(id=updated_instance.event_id)
 
         if updated_instance.status == EventApplicationStatus.ACCEPTED:
-            self._job_scheduler.add_task(send_application_accepted_email, updated_instance.email, event_instance.name)
+            schedule_email(self._job_scheduler, send_application_accepted_email,
+                           updated_instance.email, event_instance.name)
 
         if updated_instance.status == EventApplicationStatus.REJECTED:
-            self._job_scheduler.add_task(send_application_rejected_email, updated_instance.email, event_instance.name)
+            schedule_email(self._job_scheduler, send_application_rejected_email,
+                           updated_instance.email, event_instance.name)
 
         return updated_instance
 
     async def delete_instance(self, id: int, uow: GenericUnitOfWork, **kwargs):
-        instance = await uow.events_applications.retrieve(id=id)
+        deleted = await uow.events_applications.delete_returning(id=id)
 
-        if not instance:
+        if not deleted:
             raise EventApplicationNotFoundError(id=id)
 
-        await uow.events_applications.delete(id=id)
+        await uow.events.update_counters(id=deleted["event_id"],
+                                         applications_delta=-1,
+                                         accepted_delta=-int(deleted["status"] == EventApplicationStatus.ACCEPTED))
 
     async def retrieve_all(self,
                            page: int,
@@ -192,15 +236,15 @@ class EventApplicationService(RetrieveMixin[EventApplication, EventApplicationRe
                            uow: GenericUnitOfWork,
                            fio_contains: Optional[str] = None,
                            statuses: Optional[List[int]] = None,
-                           event_id: Optional[int] = None, ):
-        paginated_model = await self.retrieve_all_instances(page=page,
-                                                            per_page=per_page,
-                                                            uow=uow,
-                                                            fio_contains=fio_contains,
-                                                            statuses=statuses,
-                                                            event_id=event_id)
-
-        return self.schema_paginated_out.model_validate(asdict(paginated_model))
+                           event_id: Optional[int] = None,
+                           fields: Optional[Sequence[str]] = None, ):
+        return await super().retrieve_all(page=page,
+                                          per_page=per_page,
+                                          uow=uow,
+                                          fio_contains=fio_contains,
+                                          statuses=statuses,
+                                          event_id=event_id,
+                                          fields=fields)
 
     async def create(self, event_id: int, item: EventApplicationCreateInSchema, uow: GenericUnitOfWork, **kwargs):
         instance = await self.create_instance(event_id=event_id, item=item, uow=uow)
@@ -2,18 +2,21 @@ from typing import Optional, List
 
 from fastapi import APIRouter, Query, Depends, UploadFile, File, HTTPException, Form
 
-from core.dependencies.uow.sqlalchemy import get_uow, get_uow_with_commit
+from core.dependencies.fields import get_fields
+from core.dependencies.uow.sqlalchemy import get_read_only_uow, get_uow_with_commit
 from core.errors.handler import handle_app_errors
 from core.pagination.schema import PaginatedOut
 from core.uow.generic import GenericUnitOfWork
-from db.sqlalchemy.models import MediaType, User
+from core.routing import SchemaRoute
+from db.sqlalchemy.models import MediaType
 from modules.media.dependencies.services import get_media_service, get_media_photo_service
 from modules.media.schemas import MediaRetrieveOutSchema, MediaCreateInSchema, MediaCreateOutSchema, \
     MediaUpdateInSchema, MediaUpdateOutSchema, MediaPhotoRetrieveOutSchema
 from modules.media.services import MediaService, MediaPhotoService
-from modules.users.auth import fastapi_users
+from modules.users.auth.cache import AuthUser
+from modules.users.auth.dependencies import current_superuser
 
-media_router = APIRouter(prefix="/media", tags=["media"])
+media_router = APIRouter(prefix="/media", tags=["media"], route_class=SchemaRoute)
 
 
 @media_router.get("/", response_model=PaginatedOut[MediaRetrieveOutSchema])
@@ -23,13 +26,15 @@ async def retrieve_all(page: Optional[int] = Query(None),
                        name_contains: Optional[str] = Query(None),
                        types: Optional[List[MediaType]] = Query(None),
                        category_id: Optional[int] = Query(None),
+                       fields: Optional[List[str]] = Depends(get_fields),
                        service: MediaService = Depends(get_media_service),
-                       uow: GenericUnitOfWork = Depends(get_uow)):
+                       uow: GenericUnitOfWork = Depends(get_read_only_uow)):
     return await service.retrieve_all(page=page,
                                       per_page=per_page,
                                       name_contains=name_contains,
                                       types=types,
                                       category_id=category_id,
+                                      fields=fields,
                                       uow=uow)
 
 
@@ -37,14 +42,14 @@ async def retrieve_all(page: Optional[int] = Query(None),
 @handle_app_errors
 async def retrieve(id: int,
                    service: MediaService = Depends(get_media_service),
-                   uow: GenericUnitOfWork = Depends(get_uow)):
+                   uow: GenericUnitOfWork = Depends(get_read_only_uow)):
     return await service.retrieve(id=id, uow=uow)
 
 
 @media_router.post("/", response_model=MediaCreateOutSchema)
 @handle_app_errors
 async def create(media: MediaCreateInSchema,
-                 admin: User = Depends(fastapi_users.current_user(superuser=True)),
+                 admin: AuthUser = Depends(current_superuser),
                  service: MediaService = Depends(get_media_service),
                  uow: GenericUnitOfWork = Depends(get_uow_with_commit)):
     return await service.create(item=media, uow=uow)
@@ -54,7 +59,7 @@ async def create(media: MediaCreateInSchema,
 @handle_app_errors
 async def update(id: int,
                  media: MediaUpdateInSchema,
-                 admin: User = Depends(fastapi_users.current_user(superuser=True)),
+                 admin: AuthUser = Depends(current_superuser),
                  service: MediaService = Depends(get_media_service),
                  uow: GenericUnitOfWork = Depends(get_uow_with_commit)):
     return await service.update(id=id, item=media, uow=uow)
@@ -63,7 +68,7 @@ async def update(id: int,
 @media_router.delete("/{id}")
 @handle_app_errors
 async def delete(id: int,
-                 admin: User = Depends(fastapi_users.current_user(superuser=True)),
+                 admin: AuthUser = Depends(current_superuser),
                  service: MediaService = Depends(get_media_service),
                  uow: GenericUnitOfWork = Depends(get_uow_with_commit)):
     await service.delete(id=id, uow=uow)
@@ -74,7 +79,7 @@ async def delete(id: int,
 @handle_app_errors
 async def upload_image(id: int,
                        image: UploadFile = File(...),
-                       admin: User = Depends(fastapi_users.current_user(superuser=True)),
+                       admin: AuthUser = Depends(current_superuser),
                        service: MediaService = Depends(get_media_service),
                        uow: GenericUnitOfWork = Depends(get_uow_with_commit)):
     if not image.content_type.startswith('image'):
@@ -87,7 +92,7 @@ async def upload_image(id: int,
 @handle_app_errors
 async def upload_file(id: int,
                       file: UploadFile = File(...),
-                      admin: User = Depends(fastapi_users.current_user(superuser=True)),
+                      admin: AuthUser = Depends(current_superuser),
                       service: MediaService = Depends(get_media_service),
                       uow: GenericUnitOfWork = Depends(get_uow_with_commit)):
     return await service.upload_file(id=id, file=file, uow=uow)
@@ -97,7 +102,7 @@ async def upload_file(id: int,
 @handle_app_errors
 async def create_photo(media_id: int,
                        image: UploadFile = File(...),
-                       admin: User = Depends(fastapi_users.current_user(superuser=True)),
+                       admin: AuthUser = Depends(current_superuser),
                        service: MediaPhotoService = Depends(get_media_photo_service),
                        uow: GenericUnitOfWork = Depends(get_uow_with_commit)):
     if not image.content_type.startswith('image'):
@@ -109,7 +114,7 @@ async def create_photo(media_id: int,
 @media_router.delete("/photos/{photo_id}")
 @handle_app_errors
 async def delete_photo(photo_id: int,
-                       admin: User = Depends(fastapi_users.current_user(superuser=True)),
+                       admin: AuthUser = Depends(current_superuser),
                        service: MediaPhotoService = Depends(get_media_photo_service),
                        uow: GenericUnitOfWork = Depends(get_uow_with_commit)):
     await service.delete(id=photo_id, uow=uow)
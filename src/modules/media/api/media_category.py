@@ -2,18 +2,21 @@ from typing import Optional, List
 
 from fastapi import APIRouter, Query, Depends
 
-from core.dependencies.uow.sqlalchemy import get_uow, get_uow_with_commit
+from core.dependencies.fields import get_fields
+from core.dependencies.uow.sqlalchemy import get_read_only_uow, get_uow_with_commit
 from core.errors.handler import handle_app_errors
 from core.pagination.schema import PaginatedOut
 from core.uow.generic import GenericUnitOfWork
-from db.sqlalchemy.models import User, MediaType
+from core.routing import SchemaRoute
+from db.sqlalchemy.models import MediaType
 from modules.media.dependencies.services import get_media_category_service
 from modules.media.schemas import MediaCategoryRetrieveOutSchema, MediaCategoryCreateOutSchema, \
     MediaCategoryUpdateOutSchema, MediaCategoryCreateInSchema, MediaCategoryUpdateInSchema
 from modules.media.services import MediaCategoryService
-from modules.users.auth import fastapi_users
+from modules.users.auth.cache import AuthUser
+from modules.users.auth.dependencies import current_superuser
 
-media_category_router = APIRouter(prefix="/media/categories", tags=["media_category"])
+media_category_router = APIRouter(prefix="/media/categories", tags=["media_category"], route_class=SchemaRoute)
 
 
 @media_category_router.get("/", response_model=PaginatedOut[MediaCategoryRetrieveOutSchema])
@@ -21,23 +24,27 @@ media_category_router = APIRouter(prefix="/media/categories", tags=["media_categ
 async def retrieve_all(page: Optional[int] = Query(None),
                        per_page: Optional[int] = Query(None),
                        types: Optional[List[MediaType]] = Query(None),
+                       include_counts: bool = Query(False, description="Include numbers of media by types"),
+                       previews: int = Query(0, ge=0, le=20, description="Number of the first media to include"),
+                       fields: Optional[List[str]] = Depends(get_fields),
                        service: MediaCategoryService = Depends(get_media_category_service),
-                       uow: GenericUnitOfWork = Depends(get_uow)):
-    return await service.retrieve_all(page=page, per_page=per_page, types=types, uow=uow)
+                       uow: GenericUnitOfWork = Depends(get_read_only_uow)):
+    return await service.retrieve_all(page=page, per_page=per_page, types=types, include_counts=include_counts,
+                                      previews=previews, fields=fields, uow=uow)
 
 
 @media_category_router.get("/{id}", response_model=MediaCategoryRetrieveOutSchema)
 @handle_app_errors
 async def retrieve(id: int,
                    service: MediaCategoryService = Depends(get_media_category_service),
-                   uow: GenericUnitOfWork = Depends(get_uow)):
+                   uow: GenericUnitOfWork = Depends(get_read_only_uow)):
     return await service.retrieve(id=id, uow=uow)
 
 
 @media_category_router.post("/", response_model=MediaCategoryCreateOutSchema)
 @handle_app_errors
 async def create(media_category: MediaCategoryCreateInSchema,
-                 admin: User = Depends(fastapi_users.current_user(superuser=True)),
+                 admin: AuthUser = Depends(current_superuser),
                  service: MediaCategoryService = Depends(get_media_category_service),
                  uow: GenericUnitOfWork = Depends(get_uow_with_commit)):
     return await service.create(item=media_category, uow=uow)
@@ -47,7 +54,7 @@ async def create(media_category: MediaCategoryCreateInSchema,
 @handle_app_errors
 async def update(id: int,
                  media_category: MediaCategoryUpdateInSchema,
-                 admin: User = Depends(fastapi_users.current_user(superuser=True)),
+                 admin: AuthUser = Depends(current_superuser),
                  service: MediaCategoryService = Depends(get_media_category_service),
                  uow: GenericUnitOfWork = Depends(get_uow_with_commit)):
     return await service.update(id=id, item=media_category, uow=uow)
@@ -56,7 +63,7 @@ async def update(id: int,
 @media_category_router.delete("/{id}")
 @handle_app_errors
 async def delete(id: int,
-                 admin: User = Depends(fastapi_users.current_user(superuser=True)),
+                 admin: AuthUser = Depends(current_superuser),
                  service: MediaCategoryService = Depends(get_media_category_service),
                  uow: GenericUnitOfWork = Depends(get_uow_with_commit)):
     await service.delete(id=id, uow=uow)
@@ -67,7 +74,7 @@ async def delete(id: int,
 @handle_app_errors
 async def add_media_to_category(category_id: int,
                                 media_id: int,
-                                admin: User = Depends(fastapi_users.current_user(superuser=True)),
+                                admin: AuthUser = Depends(current_superuser),
                                 service: MediaCategoryService = Depends(get_media_category_service),
                                 uow: GenericUnitOfWork = Depends(get_uow_with_commit)):
     await service.add_media_to_category(category_id=category_id, media_id=media_id, uow=uow)
@@ -78,7 +85,7 @@ async def add_media_to_category(category_id: int,
 @handle_app_errors
 async def remove_media_from_category(category_id: int,
                                      media_id: int,
-                                     admin: User = Depends(fastapi_users.current_user(superuser=True)),
+                                     admin: AuthUser = Depends(current_superuser),
                                      service: MediaCategoryService = Depends(get_media_category_service),
                                      uow: GenericUnitOfWork = Depends(get_uow_with_commit)):
     await service.remove_media_from_category(category_id=category_id, media_id=media_id, uow=uow)
@@ -1,9 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Sequence, Mapping, Any
 
 from core.pagination.model import PaginatedModel
 from core.repositories.interfaces import IRetrieveMixin, ICreateMixin, IUpdateMixin, IDeleteMixin, \
-    IRetrieveAllMixin
+    IRetrieveAllMixin, IExistsMixin
 from db.sqlalchemy.models import Media, MediaCategory
 from db.sqlalchemy.models.media import MediaPhoto
 
@@ -27,7 +27,38 @@ class IMediaRepository(ICreateMixin[Media],
                            name_contains: Optional[str] = None,
                            types: Optional[List[int]] = None,
                            category_id: Optional[int] = None,
-                           include_photos: bool = False) -> PaginatedModel[Media]:
+                           include_photos: bool = False,
+                           fields: Optional[Sequence[str]] = None) -> PaginatedModel[Mapping[str, Any]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def add_to_category(self, id: int, category_id: int) -> Optional[Media]:
+        """
+        Set the category of the media if both the media and the category exist.
+
+        Args:
+            id (int): The ID of the media.
+            category_id (int): The ID of the category.
+
+        Returns:
+            Optional[Media]: The updated media or None if the media or the category not found.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def remove_from_category(self, id: int, category_id: int) -> Optional[Media]:
+        """
+        Unset the category of the media if both the media and the category exist.
+
+        Args:
+            id (int): The ID of the media.
+            category_id (int): The ID of the category.
+
+        Returns:
+            Optional[Media]: The updated media or None if the media or the category not found.
+        """
+
         raise NotImplementedError
 
 
@@ -36,6 +67,7 @@ class IMediaCategoryRepository(IRetrieveMixin[MediaCategory],
                                ICreateMixin[MediaCategory],
                                IUpdateMixin[MediaCategory],
                                IDeleteMixin,
+                               IExistsMixin,
                                ABC):
     """
     Interface for media category repository.
@@ -45,7 +77,25 @@ class IMediaCategoryRepository(IRetrieveMixin[MediaCategory],
     async def retrieve_all(self,
                            page: int,
                            per_page: int,
-                           types: Optional[List[int]] = None) -> PaginatedModel[Media]:
+                           types: Optional[List[int]] = None,
+                           fields: Optional[Sequence[str]] = None,
+                           include_counts: bool = False,
+                           previews: int = 0) -> PaginatedModel[Mapping[str, Any]]:
+        """
+        Retrieve a page of categories.
+
+        Args:
+            page (int): The page number.
+            per_page (int): The number of records per page.
+            types (Optional[List[int]]): The types of categories to retrieve, all types if None.
+            fields (Optional[Sequence[str]]): The attributes to select, all attributes if None.
+            include_counts (bool): Whether to count media of the categories by types.
+            previews (int): The number of the first media of the categories to include.
+
+        Returns:
+            PaginatedModel[Mapping[str, Any]]: The retrieved page of rows of categories.
+        """
+
         raise NotImplementedError
 
 
@@ -1,17 +1,20 @@
-from typing import Optional, List
+from collections import defaultdict
+from typing import Optional, List, Sequence, Mapping, Any
 
 from loguru import logger
-from sqlalchemy import select, func
+from sqlalchemy import select, func, Update
 from sqlalchemy.orm import selectinload
 
 from core.pagination.model import PaginatedModel
 from core.pagination.paginator.sqlalchemy import SQLAlchemyPaginator
 from core.repositories.sqlalchemy import SQLAlchemyRepository
+from core.uow.registry import sqlalchemy_repositories
 from db.sqlalchemy.models import Event, MediaCategory, Media
 from db.sqlalchemy.models.media import MediaPhoto, MediaType
 from modules.media.repositories.interfaces import IMediaRepository, IMediaCategoryRepository, IMediaPhotoRepository
 
 
+@sqlalchemy_repositories.register("media")
 class SQLAlchemyMediaRepository(SQLAlchemyRepository[Event], IMediaRepository):
     model = Media
 
@@ -25,10 +28,10 @@ class SQLAlchemyMediaRepository(SQLAlchemyRepository[Event], IMediaRepository):
         result = result.scalar_one_or_none()
 
         if result:
-            logger.debug(f"Retrieved {self.model.__name__} with id={id}")
+            logger.debug("Retrieved {} with id={}", self.model.__name__, id)
             return result
 
-        logger.warning(f"Requested {self.model.__name__} with id={id} but it not found")
+        logger.warning("Requested {} with id={} but it not found", self.model.__name__, id)
 
     async def retrieve_all(self,
                            page: int,
@@ -36,38 +39,91 @@ class SQLAlchemyMediaRepository(SQLAlchemyRepository[Event], IMediaRepository):
                            name_contains: Optional[str] = None,
                            types: Optional[List[int]] = None,
                            category_id: Optional[int] = None,
-                           include_photos: bool = False) -> PaginatedModel[Media]:
-        stmt = super()._get_list_stmt()
+                           include_photos: bool = False,
+                           fields: Optional[Sequence[str]] = None) -> PaginatedModel[Mapping[str, Any]]:
+        stmt = super()._get_list_stmt(fields=fields)
         if types:
             stmt = stmt.where(Media.type.in_([MediaType(t) for t in types]))
 
         if category_id:
-            stmt = stmt.join(MediaCategory).where(MediaCategory.id == category_id)
-
-        if include_photos:
-            stmt = stmt.options(selectinload(Media.media_photos))
+            stmt = stmt.where(Media.category_id == category_id)
 
         if name_contains:
             stmt = stmt.where(func.lower(Media.name).like(f'%{name_contains.lower()}%'))
 
+        # Photos are nested into rows of media by the page query on PostgreSQL, otherwise they're queried separately
+        item_columns = []
+
+        if include_photos and self._aggregates_json():
+            item_columns.append(self._get_related_json_column(Media.media_photos))
+
         paginator = SQLAlchemyPaginator(session=self._session,
                                         query=stmt,
                                         page=page,
-                                        per_page=per_page)
+                                        per_page=per_page,
+                                        item_columns=item_columns)
+        response = await paginator.get_response()
+
+        if include_photos and not item_columns:
+            response.items = await self._add_related_rows(response.items, Media.media_photos)
+
+        logger.debug("Retrieved page {} of {} of {}", page, per_page, self.model.__name__)
+
+        return response
+
+    def _get_update_category_stmt(self, id: int, category_id: int, value: Optional[int]) -> Update:
+        """
+        Create an UPDATE statement to change the category of the media only if the category exists.
+
+        Args:
+            id (int): The ID of the media.
+            category_id (int): The ID of the category which must exist.
+            value (Optional[int]): The new value of the media category ID.
+
+        Returns:
+            Update: The UPDATE statement to change the category of the media.
+        """
 
-        logger.debug(f"Retrieved page {page} of {per_page} of {self.model.__name__}")
+        category_exists = select(MediaCategory.id).where(MediaCategory.id == category_id).exists()
+        return self._get_update_stmt(id=id, data={'category_id': value}).where(category_exists)
 
-        return await paginator.get_response()
+    async def add_to_category(self, id: int, category_id: int) -> Optional[Media]:
+        stmt = self._get_update_category_stmt(id=id, category_id=category_id, value=category_id)
+        result = await self._session.execute(stmt)
+        result = result.scalar_one_or_none()
+
+        if result:
+            logger.debug("Added {} with id={} to category with id={}", self.model.__name__, id, category_id)
+            return result
+
+        logger.warning("Requested to add {} with id={} to category with id={} but one of them not found",
+                       self.model.__name__, id, category_id)
+
+    async def remove_from_category(self, id: int, category_id: int) -> Optional[Media]:
+        stmt = self._get_update_category_stmt(id=id, category_id=category_id, value=None)
+        result = await self._session.execute(stmt)
+        result = result.scalar_one_or_none()
+
+        if result:
+            logger.debug("Removed {} with id={} from category with id={}", self.model.__name__, id, category_id)
+            return result
 
+        logger.warning("Requested to remove {} with id={} from category with id={} but one of them not found",
+                       self.model.__name__, id, category_id)
 
+
+@sqlalchemy_repositories.register("media_category")
 class SQLAlchemyMediaCategoryRepository(SQLAlchemyRepository[MediaCategory], IMediaCategoryRepository):
     model = MediaCategory
 
     async def retrieve_all(self,
                            page: int,
                            per_page: int,
-                           types: Optional[List[int]] = None) -> PaginatedModel[Media]:
-        stmt = super()._get_list_stmt()
+                           types: Optional[List[int]] = None,
+                           fields: Optional[Sequence[str]] = None,
+                           include_counts: bool = False,
+                           previews: int = 0) -> PaginatedModel[Mapping[str, Any]]:
+        stmt = super()._get_list_stmt(fields=fields)
 
         if types:
             stmt = stmt.where(MediaCategory.type.in_([MediaType(t) for t in types]))
@@ -76,11 +132,78 @@ class SQLAlchemyMediaCategoryRepository(SQLAlchemyRepository[MediaCategory], IMe
                                         query=stmt,
                                         page=page,
                                         per_page=per_page)
+        response = await paginator.get_response()
+
+        if include_counts:
+            response.items = await self._add_media_counts(response.items)
+
+        if previews:
+            response.items = await self._add_media_previews(response.items, previews)
+
+        logger.debug("Retrieved page {} of {} of {}", page, per_page, self.model.__name__)
+
+        return response
+
+    async def _add_media_counts(self, rows: Sequence[Mapping[str, Any]]) -> List[dict]:
+        """
+        Count media of the categories by types with a single grouped query.
+
+        Args:
+            rows (Sequence[Mapping[str, Any]]): The rows of categories.
+
+        Returns:
+            List[dict]: Copies of the rows with lists of types and numbers of media under the media_counts key.
+        """
+
+        if not rows:
+            return []
+
+        stmt = (select(Media.category_id, Media.type, func.count().label("count"))
+                .where(Media.category_id.in_({row["id"] for row in rows}))
+                .group_by(Media.category_id, Media.type)
+                .order_by(Media.category_id, Media.type))
+        result = await self._session.execute(stmt)
+
+        counts = defaultdict(list)
+
+        for count in result.mappings():
+            counts[count["category_id"]].append({"type": count["type"], "count": count["count"]})
+
+        return [{**row, "media_counts": counts[row["id"]]} for row in rows]
+
+    async def _add_media_previews(self, rows: Sequence[Mapping[str, Any]], limit: int) -> List[dict]:
+        """
+        Select the first media of the categories by ID with a single window query.
+
+        Args:
+            rows (Sequence[Mapping[str, Any]]): The rows of categories.
+            limit (int): The maximum number of media of each category.
+
+        Returns:
+            List[dict]: Copies of the rows with lists of rows of media under the previews key.
+        """
+
+        if not rows:
+            return []
+
+        position = func.row_number().over(partition_by=Media.category_id, order_by=Media.id).label("position")
+        ranked_media = (select(Media.id, Media.name, Media.type, Media.image_url, Media.category_id, position)
+                        .where(Media.category_id.in_({row["id"] for row in rows}))
+                        .subquery())
+
+        stmt = (select(ranked_media)
+                .where(ranked_media.c.position <= limit)
+                .order_by(ranked_media.c.category_id, ranked_media.c.position))
+        result = await self._session.execute(stmt)
+
+        previews = defaultdict(list)
 
-        logger.debug(f"Retrieved page {page} of {per_page} of {self.model.__name__}")
+        for media in result.mappings():
+            previews[media["category_id"]].append(media)
 
-        return await paginator.get_response()
+        return [{**row, "previews": previews[row["id"]]} for row in rows]
 
 
+@sqlalchemy_repositories.register("media_photo")
 class SQLAlchemyMediaPhotoRepository(SQLAlchemyRepository[MediaPhoto], IMediaPhotoRepository):
     model = MediaPhoto
@@ -118,8 +118,38 @@ class MediaCategoryBaseSchema(BaseModel):
                                       MediaType.PRESENTATION])
 
 
+class MediaTypeCountOutSchema(BaseModel):
+    type: MediaType = Field(examples=[MediaType.PHOTO])
+    count: int = Field(ge=0, examples=[1, 2, 3, 4, 5])
+
+    model_config = {
+        "from_attributes": True,
+        "use_enum_values": True
+    }
+
+
+class MediaPreviewOutSchema(BaseModel):
+    id: int = Field(ge=0, examples=[1, 2, 3, 4, 5])
+    name: str = Field(max_length=500, examples=["Lunch", "Dinner"])
+    type: MediaType = Field(examples=[MediaType.PHOTO])
+    image_url: Optional[str] = Field(max_length=255, examples=["https://example.com/image.jpg"], default=None)
+
+    model_config = {
+        "from_attributes": True,
+        "use_enum_values": True
+    }
+
+
 class MediaCategoryRetrieveOutSchema(MediaCategoryBaseSchema):
     id: int = Field(ge=0, examples=[1, 2, 3, 4, 5])
+    media_counts: Optional[List[MediaTypeCountOutSchema]] = Field(
+        default=None,
+        description='Numbers of media of the category by types, listings include them if requested',
+    )
+    previews: Optional[List[MediaPreviewOutSchema]] = Field(
+        default=None,
+        description='First media of the category by ID, listings include them if requested',
+    )
 
     model_config = {
         "from_attributes": True,
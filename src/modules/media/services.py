@@ -1,5 +1,4 @@
-from dataclasses import asdict
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple, Mapping, Any
 
 from fastapi import UploadFile
 from loguru import logger
@@ -21,7 +20,7 @@ from modules.media.utils.firebase import upload_media_image_to_firebase, upload_
 
 
 class MediaService(RetrieveMixin[Media, MediaRetrieveOutSchema],
-                   # RetrieveAllMixin[Media, MediaRetrieveOutSchema],
+                   RetrieveAllMixin[Media, MediaRetrieveOutSchema],
                    CreateMixin[Media, MediaCreateInSchema, MediaCreateOutSchema],
                    UpdateMixin[Media, MediaUpdateInSchema, MediaUpdateOutSchema],
                    DeleteMixin[Media]):
@@ -45,13 +44,15 @@ class MediaService(RetrieveMixin[Media, MediaRetrieveOutSchema],
                                      name_contains: Optional[str] = None,
                                      types: Optional[List[int]] = None,
                                      category_id: Optional[int] = None,
-                                     **kwargs) -> PaginatedModel[Media]:
+                                     fields: Optional[Tuple[str, ...]] = None,
+                                     **kwargs) -> PaginatedModel[Mapping[str, Any]]:
         return await uow.media.retrieve_all(page=page,
                                             per_page=per_page,
                                             name_contains=name_contains,
                                             types=types,
                                             category_id=category_id,
-                                            include_photos=True)
+                                            include_photos=fields is None or "media_photos" in fields,
+                                            fields=fields)
 
     # async def retrieve_instances_by_category(self,
     #                                          category_id: int,
@@ -79,28 +80,31 @@ class MediaService(RetrieveMixin[Media, MediaRetrieveOutSchema],
         #         raise MediaCategoryNotFoundError(id=item.category_id)
 
         data = item.model_dump()
-        return await uow.media.update(id=id, data=data)
-
-    async def delete_instance(self, id: int, uow: GenericUnitOfWork, **kwargs):
-        instance = await uow.media.retrieve(id=id)
+        instance = await uow.media.update(id=id, data=data)
 
         if not instance:
             raise MediaNotFoundError(id=id)
 
-        await uow.media.delete(id=id)
+        return instance
+
+    async def delete_instance(self, id: int, uow: GenericUnitOfWork, **kwargs):
+        deleted_id = await uow.media.delete(id=id)
+
+        if deleted_id is None:
+            raise MediaNotFoundError(id=id)
 
     async def retrieve_all(self, page: int,
                            per_page: int,
                            uow: GenericUnitOfWork,
                            name_contains: Optional[str] = None,
                            types: Optional[List[int]] = None,
-                           category_id: Optional[int] = None) -> PaginatedOut[MediaRetrieveOutSchema]:
-        paginated_model = await self.retrieve_all_instances(page=page, per_page=per_page, uow=uow,
-                                                            name_contains=name_contains,
-                                                            types=types,
-                                                            category_id=category_id)
-
-        return self.schema_paginated_out.model_validate(asdict(paginated_model))
+                           category_id: Optional[int] = None,
+                           fields: Optional[Sequence[str]] = None) -> PaginatedOut[MediaRetrieveOutSchema]:
+        return await super().retrieve_all(page=page, per_page=per_page, uow=uow,
+                                          name_contains=name_contains,
+                                          types=types,
+                                          category_id=category_id,
+                                          fields=fields)
 
     async def upload_image(self, id: int, image: UploadFile, uow: GenericUnitOfWork) -> MediaUpdateOutSchema:
         instance = await uow.media.retrieve(id=id)
@@ -136,7 +140,7 @@ class MediaService(RetrieveMixin[Media, MediaRetrieveOutSchema],
 
 
 class MediaCategoryService(RetrieveMixin[MediaCategory, MediaCategoryRetrieveOutSchema],
-                           # RetrieveAllMixin[MediaCategory, MediaCategoryRetrieveOutSchema],
+                           RetrieveAllMixin[MediaCategory, MediaCategoryRetrieveOutSchema],
                            CreateMixin[MediaCategory, MediaCategoryCreateInSchema, MediaCategoryCreateOutSchema],
                            UpdateMixin[MediaCategory, MediaCategoryUpdateInSchema, MediaCategoryUpdateOutSchema],
                            DeleteMixin[MediaCategory]):
@@ -158,8 +162,18 @@ class MediaCategoryService(RetrieveMixin[MediaCategory, MediaCategoryRetrieveOut
                                      per_page: int,
                                      uow: GenericUnitOfWork,
                                      types: Optional[List[int]] = None,
-                                     **kwargs) -> PaginatedModel[MediaCategory]:
-        return await uow.media_category.retrieve_all(page=page, per_page=per_page, types=types)
+                                     fields: Optional[Tuple[str, ...]] = None,
+                                     include_counts: bool = False,
+                                     previews: int = 0,
+                                     **kwargs) -> PaginatedModel[Mapping[str, Any]]:
+        return await uow.media_category.retrieve_all(
+            page=page,
+            per_page=per_page,
+            types=types,
+            fields=fields,
+            include_counts=include_counts and (fields is None or "media_counts" in fields),
+            previews=previews if fields is None or "previews" in fields else 0,
+        )
 
     async def create_instance(self, item: MediaCategoryCreateInSchema, uow: GenericUnitOfWork,
                               **kwargs) -> MediaCategory:
@@ -169,49 +183,55 @@ class MediaCategoryService(RetrieveMixin[MediaCategory, MediaCategoryRetrieveOut
     async def update_instance(self, id: int, item: MediaCategoryUpdateInSchema, uow: GenericUnitOfWork,
                               **kwargs) -> MediaCategory:
         data = item.model_dump()
-        return await uow.media_category.update(id=id, data=data)
-
-    async def delete_instance(self, id: int, uow: GenericUnitOfWork, **kwargs):
-        instance = await uow.media_category.retrieve(id=id)
+        instance = await uow.media_category.update(id=id, data=data)
 
         if not instance:
             raise MediaCategoryNotFoundError(id=id)
 
-        await uow.media_category.delete(id=id)
+        return instance
+
+    async def delete_instance(self, id: int, uow: GenericUnitOfWork, **kwargs):
+        deleted_id = await uow.media_category.delete(id=id)
+
+        if deleted_id is None:
+            raise MediaCategoryNotFoundError(id=id)
 
     async def retrieve_all(self, page: int,
                            per_page: int,
                            uow: GenericUnitOfWork,
-                           types: Optional[List[int]] = None) -> PaginatedOut[MediaCategoryRetrieveOutSchema]:
-        paginated_model = await self.retrieve_all_instances(page=page, per_page=per_page, uow=uow, types=types)
-
-        return self.schema_paginated_out.model_validate(asdict(paginated_model))
+                           types: Optional[List[int]] = None,
+                           fields: Optional[Sequence[str]] = None,
+                           include_counts: bool = False,
+                           previews: int = 0) -> PaginatedOut[MediaCategoryRetrieveOutSchema]:
+        return await super().retrieve_all(page=page, per_page=per_page, uow=uow, types=types, fields=fields,
+                                          include_counts=include_counts, previews=previews)
 
     async def add_media_to_category(self, category_id: int, media_id: int, uow: GenericUnitOfWork):
-        category_instance = await uow.media_category.retrieve(id=category_id)
+        media_instance = await uow.media.add_to_category(id=media_id, category_id=category_id)
 
-        if not category_instance:
-            raise MediaCategoryNotFoundError(id=category_id)
+        if not media_instance:
+            await self._raise_not_found_error(category_id=category_id, media_id=media_id, uow=uow)
 
-        media_instance = await uow.media.retrieve(id=media_id)
+    async def remove_media_from_category(self, category_id: int, media_id: int, uow: GenericUnitOfWork):
+        media_instance = await uow.media.remove_from_category(id=media_id, category_id=category_id)
 
         if not media_instance:
-            raise MediaNotFoundError(id=media_id)
+            await self._raise_not_found_error(category_id=category_id, media_id=media_id, uow=uow)
 
-        await uow.media.update(id=media_id, data={'category_id': category_id})
+    async def _raise_not_found_error(self, category_id: int, media_id: int, uow: GenericUnitOfWork):
+        """
+        Raise the error describing which instance was missing when the category of the media was not updated.
 
-    async def remove_media_from_category(self, category_id: int, media_id: int, uow: GenericUnitOfWork):
-        category_instance = await uow.media_category.retrieve(id=category_id)
+        Args:
+            category_id (int): The ID of the category.
+            media_id (int): The ID of the media.
+            uow (GenericUnitOfWork): The unit of work instance.
+        """
 
-        if not category_instance:
+        if not await uow.media_category.exists(id=category_id):
             raise MediaCategoryNotFoundError(id=category_id)
 
-        media_instance = await uow.media.retrieve(id=media_id)
-
-        if not media_instance:
-            raise MediaNotFoundError(id=media_id)
-
-        await uow.media.update(id=media_id, data={'category_id': None})
+        raise MediaNotFoundError(id=media_id)
 
 
 class MediaPhotoService(DeleteMixin[MediaPhoto]):
@@ -243,13 +263,11 @@ class MediaPhotoService(DeleteMixin[MediaPhoto]):
         return self.schema_create_out.model_validate(updated_instance)
 
     async def delete_instance(self, id: int, uow: GenericUnitOfWork, **kwargs):
-        instance = await uow.media_photo.retrieve(id=id)
+        deleted_id = await uow.media_photo.delete(id=id)
 
-        if not instance:
+        if deleted_id is None:
             raise MediaPhotoNotFoundError(id=id)
 
-        await uow.media_photo.delete(id=id)
-
     async def create(self, media_id: int,
                      image: UploadFile,
                      uow: GenericUnitOfWork, **kwargs) -> MediaPhotoCreateOutSchema:
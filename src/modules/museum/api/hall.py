@@ -1,30 +1,34 @@
-from typing import Optional
+from typing import Optional, List
 
 from fastapi import APIRouter, Depends, Query, UploadFile, File, HTTPException
 
-from core.dependencies.uow.sqlalchemy import get_uow, get_uow_with_commit
+from core.dependencies.fields import get_fields
+from core.dependencies.uow.sqlalchemy import get_read_only_uow, get_uow_with_commit
 from core.errors.handler import handle_app_errors
 from core.pagination.schema import PaginatedOut
 from core.uow.generic import GenericUnitOfWork
-from db.sqlalchemy.models import User
+from core.routing import SchemaRoute
 from modules.museum.dependencies.services import get_museum_hall_service, get_museum_section_service
 from modules.museum.schemas import MuseumHallRetrieveOutSchema, MuseumHallCreateOutSchema, MuseumHallUpdateOutSchema, \
     MuseumHallCreateInSchema, MuseumHallUpdateInSchema, MuseumSectionCreateOutSchema, MuseumSectionCreateInSchema, \
     MuseumSectionRetrieveOutSchema
 from modules.museum.services import MuseumHallService, MuseumSectionService
-from modules.users.auth import fastapi_users
+from modules.users.auth.cache import AuthUser
+from modules.users.auth.dependencies import current_superuser
 
-museum_hall_router = APIRouter(prefix="/museum/halls", tags=["museum_halls"])
+museum_hall_router = APIRouter(prefix="/museum/halls", tags=["museum_halls"], route_class=SchemaRoute)
 
 
 @museum_hall_router.get("/", response_model=PaginatedOut[MuseumHallRetrieveOutSchema])
 @handle_app_errors
 async def retrieve_all(page: Optional[int] = Query(None),
                        per_page: Optional[int] = Query(None),
+                       fields: Optional[List[str]] = Depends(get_fields),
                        service: MuseumHallService = Depends(get_museum_hall_service),
-                       uow: GenericUnitOfWork = Depends(get_uow)):
+                       uow: GenericUnitOfWork = Depends(get_read_only_uow)):
     return await service.retrieve_all(page=page,
                                       per_page=per_page,
+                                      fields=fields,
                                       uow=uow)
 
 
@@ -32,14 +36,14 @@ async def retrieve_all(page: Optional[int] = Query(None),
 @handle_app_errors
 async def retrieve(id: int,
                    service: MuseumHallService = Depends(get_museum_hall_service),
-                   uow: GenericUnitOfWork = Depends(get_uow)):
+                   uow: GenericUnitOfWork = Depends(get_read_only_uow)):
     return await service.retrieve(id=id, uow=uow)
 
 
 @museum_hall_router.post("/", response_model=MuseumHallCreateOutSchema)
 @handle_app_errors
 async def create(hall: MuseumHallCreateInSchema,
-                 admin: User = Depends(fastapi_users.current_user(superuser=True)),
+                 admin: AuthUser = Depends(current_superuser),
                  service: MuseumHallService = Depends(get_museum_hall_service),
                  uow: GenericUnitOfWork = Depends(get_uow_with_commit)):
     return await service.create(item=hall, uow=uow)
@@ -49,7 +53,7 @@ async def create(hall: MuseumHallCreateInSchema,
 @handle_app_errors
 async def update(id: int,
                  hall: MuseumHallUpdateInSchema,
-                 admin: User = Depends(fastapi_users.current_user(superuser=True)),
+                 admin: AuthUser = Depends(current_superuser),
                  service: MuseumHallService = Depends(get_museum_hall_service),
                  uow: GenericUnitOfWork = Depends(get_uow_with_commit)):
     return await service.update(id=id, item=hall, uow=uow)
@@ -58,7 +62,7 @@ async def update(id: int,
 @museum_hall_router.delete("/{id}")
 @handle_app_errors
 async def delete(id: int,
-                 admin: User = Depends(fastapi_users.current_user(superuser=True)),
+                 admin: AuthUser = Depends(current_superuser),
                  service: MuseumHallService = Depends(get_museum_hall_service),
                  uow: GenericUnitOfWork = Depends(get_uow_with_commit)):
     await service.delete(id=id, uow=uow)
@@ -70,16 +74,17 @@ async def delete(id: int,
 async def retrieve_all_sections(hall_id: int,
                                 page: Optional[int] = Query(None),
                                 per_page: Optional[int] = Query(None),
+                                fields: Optional[List[str]] = Depends(get_fields),
                                 service: MuseumSectionService = Depends(get_museum_section_service),
-                                uow: GenericUnitOfWork = Depends(get_uow_with_commit)):
-    return await service.retrieve_all(hall_id=hall_id, page=page, per_page=per_page, uow=uow)
+                                uow: GenericUnitOfWork = Depends(get_read_only_uow)):
+    return await service.retrieve_all(hall_id=hall_id, page=page, per_page=per_page, fields=fields, uow=uow)
 
 
 @museum_hall_router.post("/{hall_id}/sections", response_model=MuseumSectionCreateOutSchema)
 @handle_app_errors
 async def create_section(hall_id: int,
                          section: MuseumSectionCreateInSchema,
-                         admin: User = Depends(fastapi_users.current_user(superuser=True)),
+                         admin: AuthUser = Depends(current_superuser),
                          service: MuseumSectionService = Depends(get_museum_section_service),
                          uow: GenericUnitOfWork = Depends(get_uow_with_commit)):
     return await service.create(hall_id=hall_id, item=section, uow=uow)
@@ -88,7 +93,7 @@ async def create_section(hall_id: int,
 @museum_hall_router.put("/{id}/image/upload", response_model=MuseumHallUpdateOutSchema)
 @handle_app_errors
 async def upload_image(id: int,
-                       admin: User = Depends(fastapi_users.current_user(superuser=True)),
+                       admin: AuthUser = Depends(current_superuser),
                        image: UploadFile = File(...),
                        service: MuseumHallService = Depends(get_museum_hall_service),
                        uow: GenericUnitOfWork = Depends(get_uow_with_commit)):
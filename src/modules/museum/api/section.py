@@ -1,23 +1,24 @@
 from fastapi import APIRouter, Depends, UploadFile, File, HTTPException
 
-from core.dependencies.uow.sqlalchemy import get_uow, get_uow_with_commit
+from core.dependencies.uow.sqlalchemy import get_read_only_uow, get_uow_with_commit
 from core.errors.handler import handle_app_errors
 from core.uow.generic import GenericUnitOfWork
-from db.sqlalchemy.models import User
+from core.routing import SchemaRoute
 from modules.museum.dependencies.services import get_museum_section_service
 from modules.museum.schemas import MuseumSectionRetrieveOutSchema, MuseumSectionCreateInSchema, \
     MuseumSectionUpdateOutSchema, MuseumSectionUpdateInSchema
 from modules.museum.services import MuseumSectionService
-from modules.users.auth import fastapi_users
+from modules.users.auth.cache import AuthUser
+from modules.users.auth.dependencies import current_superuser
 
-museum_section_router = APIRouter(prefix="/museum/sections", tags=["museum_sections"])
+museum_section_router = APIRouter(prefix="/museum/sections", tags=["museum_sections"], route_class=SchemaRoute)
 
 
 @museum_section_router.get("/{id}", response_model=MuseumSectionRetrieveOutSchema)
 @handle_app_errors
 async def retrieve(id: int,
                    service: MuseumSectionService = Depends(get_museum_section_service),
-                   uow: GenericUnitOfWork = Depends(get_uow)):
+                   uow: GenericUnitOfWork = Depends(get_read_only_uow)):
     return await service.retrieve(id=id, uow=uow)
 
 
@@ -25,7 +26,7 @@ async def retrieve(id: int,
 @handle_app_errors
 async def update(id: int,
                  hall: MuseumSectionUpdateInSchema,
-                 admin: User = Depends(fastapi_users.current_user(superuser=True)),
+                 admin: AuthUser = Depends(current_superuser),
                  service: MuseumSectionService = Depends(get_museum_section_service),
                  uow: GenericUnitOfWork = Depends(get_uow_with_commit)):
     return await service.update(id=id, item=hall, uow=uow)
@@ -34,7 +35,7 @@ async def update(id: int,
 @museum_section_router.delete("/{id}")
 @handle_app_errors
 async def delete(id: int,
-                 admin: User = Depends(fastapi_users.current_user(superuser=True)),
+                 admin: AuthUser = Depends(current_superuser),
                  service: MuseumSectionService = Depends(get_museum_section_service),
                  uow: GenericUnitOfWork = Depends(get_uow_with_commit)):
     await service.delete(id=id, uow=uow)
@@ -45,7 +46,7 @@ async def delete(id: int,
 @handle_app_errors
 async def upload_image(id: int,
                        image: UploadFile = File(...),
-                       admin: User = Depends(fastapi_users.current_user(superuser=True)),
+                       admin: AuthUser = Depends(current_superuser),
                        service: MuseumSectionService = Depends(get_museum_section_service),
                        uow: GenericUnitOfWork = Depends(get_uow_with_commit)):
     if not image.content_type.startswith('image'):
@@ -0,0 +1,18 @@
+from fastapi import APIRouter, Depends
+
+from core.dependencies.uow.sqlalchemy import get_primary_read_only_uow
+from core.errors.handler import handle_app_errors
+from core.routing import SchemaRoute
+from core.uow.generic import GenericUnitOfWork
+from modules.museum.dependencies.services import get_museum_hall_service
+from modules.museum.schemas import MuseumTreeOutSchema
+from modules.museum.services import MuseumHallService
+
+museum_tree_router = APIRouter(prefix="/museum/tree", tags=["museum_tree"], route_class=SchemaRoute)
+
+
+@museum_tree_router.get("/", response_model=MuseumTreeOutSchema)
+@handle_app_errors
+async def retrieve_tree(service: MuseumHallService = Depends(get_museum_hall_service),
+                        uow: GenericUnitOfWork = Depends(get_primary_read_only_uow)):
+    return await service.retrieve_tree(uow=uow)
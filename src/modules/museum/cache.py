@@ -0,0 +1,68 @@
+from typing import Optional
+
+from loguru import logger
+
+from core.metrics import CACHE_REQUESTS
+from modules.museum.schemas import MuseumTreeOutSchema
+
+__all__ = [
+    "MuseumTreeCache",
+    "museum_tree_cache",
+]
+
+
+class MuseumTreeCache:
+    """
+    Cache of the museum tree, so the landing page of the museum doesn't need to read all halls and sections.
+
+    The cache is local to the process, the tree is cached with the version of the tree in the database, which is
+    incremented by each change of halls or sections through services. Each read checks the cached version against
+    the database, so changes made through any process are seen by all processes after they are committed.
+    """
+
+    def __init__(self):
+        """
+        Initialize a new MuseumTreeCache instance.
+        """
+
+        self._tree: Optional[MuseumTreeOutSchema] = None
+        self._version: Optional[int] = None
+        self._hits = CACHE_REQUESTS.labels("museum_tree", "hit")
+        self._misses = CACHE_REQUESTS.labels("museum_tree", "miss")
+
+    def get(self, version: int) -> Optional[MuseumTreeOutSchema]:
+        """
+        Get the cached tree if it's of the current version.
+
+        Args:
+            version (int): The current version of the tree in the database.
+
+        Returns:
+            Optional[MuseumTreeOutSchema]: The tree, or None if no tree of the version is cached.
+        """
+
+        if self._tree is None or self._version != version:
+            self._misses.inc()
+            return None
+
+        self._hits.inc()
+        return self._tree
+
+    def set(self, tree: MuseumTreeOutSchema, version: int):
+        """
+        Cache the tree unless a tree of a newer version is already cached.
+
+        Args:
+            tree (MuseumTreeOutSchema): The tree.
+            version (int): The version of the tree read before the tree itself.
+        """
+
+        if self._version is not None and version < self._version:
+            return
+
+        self._tree = tree
+        self._version = version
+        logger.debug("Cached museum tree of version {}", version)
+
+
+museum_tree_cache = MuseumTreeCache()
@@ -1,14 +1,15 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Sequence, Mapping, Any
 
 from core.pagination.model import PaginatedModel
-from core.repositories.interfaces import IUpdateMixin, ICreateMixin, IDeleteMixin, IRetrieveMixin
+from core.repositories.interfaces import IUpdateMixin, ICreateMixin, IDeleteMixin, IRetrieveMixin, IExistsMixin
 from db.sqlalchemy.models import MuseumHall, MuseumSection
 
 
 class IMuseumHallRepository(ICreateMixin[MuseumHall],
                             IUpdateMixin[MuseumHall],
                             IDeleteMixin,
+                            IExistsMixin,
                             ABC):
     """
     Interface for museum hall repository.
@@ -19,7 +20,42 @@ class IMuseumHallRepository(ICreateMixin[MuseumHall],
         raise NotImplementedError
 
     @abstractmethod
-    async def retrieve_all(self, page: int, per_page: int, include_sections: bool = False) -> PaginatedModel[MuseumHall]:
+    async def retrieve_all(self,
+                           page: int,
+                           per_page: int,
+                           include_sections: bool = False,
+                           fields: Optional[Sequence[str]] = None) -> PaginatedModel[Mapping[str, Any]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def retrieve_tree(self) -> List[Mapping[str, Any]]:
+        """
+        Retrieve all halls with their sections.
+
+        Returns:
+            List[Mapping[str, Any]]: Rows of halls ordered by ID, with lists of rows of their sections ordered by ID
+                under the sections key.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def retrieve_tree_version(self) -> int:
+        """
+        Retrieve the version of the tree of halls and sections.
+
+        Returns:
+            int: The version, which is incremented by each change of halls or sections.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def increment_tree_version(self):
+        """
+        Increment the version of the tree of halls and sections, in the transaction changing them.
+        """
+
         raise NotImplementedError
 
 
@@ -36,5 +72,6 @@ class IMuseumSectionRepository(IRetrieveMixin[MuseumSection],
     async def retrieve_all(self,
                            page: int,
                            per_page: int,
-                           hall_id: Optional[int] = None) -> PaginatedModel[MuseumSection]:
+                           hall_id: Optional[int] = None,
+                           fields: Optional[Sequence[str]] = None) -> PaginatedModel[Mapping[str, Any]]:
         raise NotImplementedError
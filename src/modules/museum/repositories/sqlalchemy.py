@@ -1,16 +1,18 @@
-from typing import Optional, List
+from typing import Optional, Sequence, Mapping, Any, List
 
 from loguru import logger
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.orm import selectinload
 
 from core.pagination.model import PaginatedModel
 from core.pagination.paginator.sqlalchemy import SQLAlchemyPaginator
 from core.repositories.sqlalchemy import SQLAlchemyRepository
-from db.sqlalchemy.models import MuseumHall, MuseumSection
+from core.uow.registry import sqlalchemy_repositories
+from db.sqlalchemy.models import MuseumHall, MuseumSection, MuseumTreeVersion
 from modules.museum.repositories.interfaces import IMuseumHallRepository, IMuseumSectionRepository
 
 
+@sqlalchemy_repositories.register("museum_hall")
 class SQLAlchemyMuseumHallRepository(SQLAlchemyRepository[MuseumHall], IMuseumHallRepository):
     model = MuseumHall
 
@@ -24,32 +26,82 @@ class SQLAlchemyMuseumHallRepository(SQLAlchemyRepository[MuseumHall], IMuseumHa
         result = result.scalar_one_or_none()
 
         if result:
-            logger.debug(f"Retrieved {self.model.__name__} with id={id}")
+            logger.debug("Retrieved {} with id={}", self.model.__name__, id)
             return result
 
-        logger.warning(f"Requested {self.model.__name__} with id={id} but it not found")
+        logger.warning("Requested {} with id={} but it not found", self.model.__name__, id)
 
-    async def retrieve_all(self, page: int, per_page: int, include_sections: bool = False) -> PaginatedModel[MuseumHall]:
-        stmt = super()._get_list_stmt()
-
-        if include_sections:
-            stmt = stmt.options(selectinload(MuseumHall.sections))
+    async def retrieve_all(self,
+                           page: int,
+                           per_page: int,
+                           include_sections: bool = False,
+                           fields: Optional[Sequence[str]] = None) -> PaginatedModel[Mapping[str, Any]]:
+        stmt = super()._get_list_stmt(fields=fields)
 
         paginator = SQLAlchemyPaginator(session=self._session,
                                         query=stmt,
                                         page=page,
                                         per_page=per_page)
+        response = await paginator.get_response()
 
-        logger.debug(f"Retrieved page {page} of {per_page} of {self.model.__name__}")
+        if include_sections:
+            response.items = await self._add_related_rows(response.items, MuseumHall.sections)
 
-        return await paginator.get_response()
+        logger.debug("Retrieved page {} of {} of {}", page, per_page, self.model.__name__)
+
+        return response
+
+    async def retrieve_tree(self) -> List[Mapping[str, Any]]:
+        hall_columns = self._get_list_columns()
+        section_columns = [column.label(f"section_{column.key}") for column in MuseumSection.__table__.columns]
+
+        # Halls without sections are joined to a row of nulls
+        stmt = (select(*hall_columns, *section_columns)
+                .outerjoin(MuseumHall.sections)
+                .order_by(MuseumHall.id, MuseumSection.id))
+        result = await self._session.execute(stmt)
+
+        halls = {}
+
+        for row in result.mappings():
+            hall = halls.get(row["id"])
+
+            if hall is None:
+                hall = halls[row["id"]] = {column.key: row[column.key] for column in hall_columns}
+                hall["sections"] = []
+
+            if row["section_id"] is not None:
+                hall["sections"].append({column.key: row[f"section_{column.key}"]
+                                         for column in MuseumSection.__table__.columns})
+
+        logger.debug("Retrieved tree of {} {}", len(halls), self.model.__name__)
+
+        return list(halls.values())
+
+    async def retrieve_tree_version(self) -> int:
+        return await self._session.scalar(select(MuseumTreeVersion.version).where(MuseumTreeVersion.id == 1))
+
+    async def increment_tree_version(self):
+        # The row stays locked until the end of the transaction, so concurrent changes of the tree are serialized
+        stmt = (update(MuseumTreeVersion)
+                .where(MuseumTreeVersion.id == 1)
+                .values(version=MuseumTreeVersion.version + 1)
+                .execution_options(synchronize_session=False))
+        await self._session.execute(stmt)
+
+        logger.debug("Incremented version of tree of {}", self.model.__name__)
 
 
+@sqlalchemy_repositories.register("museum_section")
 class SQLAlchemyMuseumSectionRepository(SQLAlchemyRepository[MuseumSection], IMuseumSectionRepository):
     model = MuseumSection
 
-    async def retrieve_all(self, page: int, per_page: int, hall_id: Optional[int] = None) -> PaginatedModel[MuseumSection]:
-        stmt = super()._get_list_stmt()
+    async def retrieve_all(self,
+                           page: int,
+                           per_page: int,
+                           hall_id: Optional[int] = None,
+                           fields: Optional[Sequence[str]] = None) -> PaginatedModel[Mapping[str, Any]]:
+        stmt = super()._get_list_stmt(fields=fields)
 
         if hall_id:
             stmt = stmt.where(MuseumSection.hall_id == hall_id)
@@ -58,6 +110,6 @@ class SQLAlchemyMuseumSectionRepository(SQLAlchemyRepository[MuseumSection], IMu
                                         query=stmt,
                                         page=page,
                                         per_page=per_page)
-        logger.debug(f"Retrieved page {page} of {per_page} of {self.model.__name__}")
+        logger.debug("Retrieved page {} of {} of {}", page, per_page, self.model.__name__)
 
         return await paginator.get_response()
@@ -97,3 +97,9 @@ class MuseumHallUpdateOutSchema(MuseumHallBaseSchema):
         "from_attributes": True,
         "use_enum_values": True
     }
+
+
+# MUSEUM TREE
+
+class MuseumTreeOutSchema(BaseModel):
+    halls: List[MuseumHallRetrieveOutSchema] = Field(description='All halls of the museum with their sections')
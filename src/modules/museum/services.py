@@ -1,5 +1,4 @@
-from dataclasses import asdict
-from typing import Optional
+from typing import Optional, Tuple, Mapping, Any
 
 from fastapi import UploadFile
 from loguru import logger
@@ -9,14 +8,16 @@ from core.pagination.schema import PaginatedOut
 from core.services.mixins import RetrieveMixin, CreateMixin, UpdateMixin, DeleteMixin, RetrieveAllMixin
 from core.uow.generic import GenericUnitOfWork
 from db.sqlalchemy.models import MuseumHall, MuseumSection
+from modules.museum.cache import museum_tree_cache
 from modules.museum.errors import MuseumHallNotFoundError, MuseumSectionNotFoundError
 from modules.museum.schemas import MuseumHallUpdateInSchema, MuseumHallCreateInSchema, MuseumHallRetrieveOutSchema, \
     MuseumHallCreateOutSchema, MuseumHallUpdateOutSchema, MuseumSectionUpdateOutSchema, MuseumSectionCreateOutSchema, \
-    MuseumSectionRetrieveOutSchema, MuseumSectionCreateInSchema, MuseumSectionUpdateInSchema
+    MuseumSectionRetrieveOutSchema, MuseumSectionCreateInSchema, MuseumSectionUpdateInSchema, MuseumTreeOutSchema
 from modules.museum.utils.firebase import upload_museum_hall_image_to_firebase, upload_museum_section_image_to_firebase
 
 
 class MuseumHallService(RetrieveMixin[MuseumHall, MuseumHallRetrieveOutSchema],
+                        RetrieveAllMixin[MuseumHall, MuseumHallRetrieveOutSchema],
                         CreateMixin[MuseumHall, MuseumHallCreateInSchema, MuseumHallCreateOutSchema],
                         UpdateMixin[MuseumHall, MuseumHallUpdateInSchema, MuseumHallUpdateOutSchema],
                         DeleteMixin[MuseumHall]):
@@ -37,38 +38,37 @@ class MuseumHallService(RetrieveMixin[MuseumHall, MuseumHallRetrieveOutSchema],
                                      uow: GenericUnitOfWork,
                                      page: int,
                                      per_page: int,
-                                     **kwargs) -> PaginatedModel[MuseumHall]:
-        return await uow.museum_hall.retrieve_all(page=page, per_page=per_page, include_sections=True)
+                                     fields: Optional[Tuple[str, ...]] = None,
+                                     **kwargs) -> PaginatedModel[Mapping[str, Any]]:
+        return await uow.museum_hall.retrieve_all(page=page,
+                                                  per_page=per_page,
+                                                  include_sections=fields is None or "sections" in fields,
+                                                  fields=fields)
 
     async def create_instance(self, item: MuseumHallCreateInSchema, uow: GenericUnitOfWork, **kwargs) -> MuseumHall:
         data = item.model_dump()
-        return await uow.museum_hall.create(data=data)
+        instance = await uow.museum_hall.create(data=data)
+        await uow.museum_hall.increment_tree_version()
+        return instance
 
     async def update_instance(self, id: int, item: MuseumHallUpdateInSchema, uow: GenericUnitOfWork,
                               **kwargs) -> MuseumHall:
-        instance = await uow.museum_hall.retrieve(id=id)
+        data = item.model_dump()
+        instance = await uow.museum_hall.update(id=id, data=data)
 
         if not instance:
             raise MuseumHallNotFoundError(id=id)
 
-        data = item.model_dump()
-        return await uow.museum_hall.update(id=id, data=data)
+        await uow.museum_hall.increment_tree_version()
+        return instance
 
     async def delete_instance(self, id: int, uow: GenericUnitOfWork, **kwargs):
-        instance = await uow.museum_hall.retrieve(id=id)
+        deleted_id = await uow.museum_hall.delete(id=id)
 
-        if not instance:
+        if deleted_id is None:
             raise MuseumHallNotFoundError(id=id)
 
-        await uow.museum_hall.delete(id=id)
-
-    async def retrieve_all(self,
-                           uow: GenericUnitOfWork,
-                           page: int,
-                           per_page: int,
-                           **kwargs) -> PaginatedOut[MuseumHallRetrieveOutSchema]:
-        paginated_model = await self.retrieve_all_instances(uow=uow, page=page, per_page=per_page, **kwargs)
-        return self.schema_paginated_out.model_validate(asdict(paginated_model))
+        await uow.museum_hall.increment_tree_version()
 
     async def upload_image(self, id: int, image: UploadFile, uow: GenericUnitOfWork,
                            **kwargs) -> MuseumHallUpdateOutSchema:
@@ -82,13 +82,40 @@ class MuseumHallService(RetrieveMixin[MuseumHall, MuseumHallRetrieveOutSchema],
         updated_instance = await uow.museum_hall.update(id, {
             'image_url': image_url
         })
+        await uow.museum_hall.increment_tree_version()
 
         logger.info(f"Uploaded image for museum hall with id={id}.")
 
         return self.schema_update_out.model_validate(updated_instance)
 
+    async def retrieve_tree(self, uow: GenericUnitOfWork) -> MuseumTreeOutSchema:
+        """
+        Get all halls with their sections, the tree is cached until halls or sections are changed.
+
+        Args:
+            uow (GenericUnitOfWork): The unit of work instance of the primary database, a version read from a lagging
+                replica would miss the latest changes.
+
+        Returns:
+            MuseumTreeOutSchema: The tree of halls and sections.
+        """
+
+        # The version is read before the tree, so a tree changed in between is cached with an outdated version and
+        # read again by the next request
+        version = await uow.museum_hall.retrieve_tree_version()
+        tree = museum_tree_cache.get(version)
+
+        if tree is not None:
+            return tree
+
+        tree = MuseumTreeOutSchema.model_validate({"halls": await uow.museum_hall.retrieve_tree()})
+        museum_tree_cache.set(tree, version)
+
+        return tree
+
 
 class MuseumSectionService(RetrieveMixin[MuseumSection, MuseumSectionRetrieveOutSchema],
+                           RetrieveAllMixin[MuseumSection, MuseumSectionRetrieveOutSchema],
                            # CreateMixin[MuseumSection, MuseumSectionCreateInSchema, MuseumSectionCreateOutSchema],
                            UpdateMixin[MuseumSection, MuseumSectionUpdateInSchema, MuseumSectionUpdateOutSchema],
                            DeleteMixin[MuseumSection]):
@@ -110,14 +137,12 @@ class MuseumSectionService(RetrieveMixin[MuseumSection, MuseumSectionRetrieveOut
                                      page: int,
                                      per_page: int,
                                      hall_id: Optional[int] = None,
-                                     **kwargs) -> PaginatedModel[MuseumSectionRetrieveOutSchema]:
-        if hall_id:
-            hall_instance = await uow.museum_hall.retrieve(id=hall_id)
-
-            if not hall_instance:
-                raise MuseumHallNotFoundError(id=hall_id)
+                                     fields: Optional[Tuple[str, ...]] = None,
+                                     **kwargs) -> PaginatedModel[Mapping[str, Any]]:
+        if hall_id and not await uow.museum_hall.exists(id=hall_id):
+            raise MuseumHallNotFoundError(id=hall_id)
 
-        return await uow.museum_section.retrieve_all(page=page, per_page=per_page, hall_id=hall_id)
+        return await uow.museum_section.retrieve_all(page=page, per_page=per_page, hall_id=hall_id, fields=fields)
 
     async def create_instance(self,
                               hall_id: int,
@@ -130,30 +155,33 @@ class MuseumSectionService(RetrieveMixin[MuseumSection, MuseumSectionRetrieveOut
 
         data = item.model_dump()
         data['hall_id'] = hall_id
-        return await uow.museum_section.create(data=data)
+        instance = await uow.museum_section.create(data=data)
+        await uow.museum_hall.increment_tree_version()
+        return instance
 
     async def update_instance(self, id: int, item: MuseumSectionUpdateInSchema, uow: GenericUnitOfWork,
                               **kwargs) -> MuseumSection:
-        instance = await uow.museum_section.retrieve(id=id)
-
-        if not instance:
-            raise MuseumSectionNotFoundError(id=id)
-
         # hall_instance = await uow.museum_hall.retrieve(id=item.hall_id)
         #
         # if not hall_instance:
         #     raise MuseumHallNotFoundError(id=item.hall_id)
 
         data = item.model_dump()
-        return await uow.museum_section.update(id=id, data=data)
+        instance = await uow.museum_section.update(id=id, data=data)
+
+        if not instance:
+            raise MuseumSectionNotFoundError(id=id)
+
+        await uow.museum_hall.increment_tree_version()
+        return instance
 
     async def delete_instance(self, id: int, uow: GenericUnitOfWork, **kwargs):
-        instance = await uow.museum_section.retrieve(id=id)
+        deleted_id = await uow.museum_section.delete(id=id)
 
-        if not instance:
+        if deleted_id is None:
             raise MuseumSectionNotFoundError(id=id)
 
-        await uow.museum_section.delete(id=id)
+        await uow.museum_hall.increment_tree_version()
 
     async def retrieve_all(self,
                            uow: GenericUnitOfWork,
@@ -161,9 +189,7 @@ class MuseumSectionService(RetrieveMixin[MuseumSection, MuseumSectionRetrieveOut
                            per_page: int,
                            hall_id: Optional[int] = None,
                            **kwargs) -> PaginatedOut[MuseumSectionRetrieveOutSchema]:
-        paginated_model = await self.retrieve_all_instances(uow=uow, page=page, per_page=per_page, hall_id=hall_id,
-                                                            **kwargs)
-        return self.schema_paginated_out.model_validate(asdict(paginated_model))
+        return await super().retrieve_all(uow=uow, page=page, per_page=per_page, hall_id=hall_id, **kwargs)
 
     async def create(self,
                      hall_id: int,
@@ -184,6 +210,7 @@ class MuseumSectionService(RetrieveMixin[MuseumSection, MuseumSectionRetrieveOut
         updated_instance = await uow.museum_section.update(id, {
             'image_url': image_url
         })
+        await uow.museum_hall.increment_tree_version()
 
         logger.info(f"Uploaded image for museum section with id={id}.")
 
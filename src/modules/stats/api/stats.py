@@ -0,0 +1,53 @@
+import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+
+from core.dependencies.uow.sqlalchemy import get_read_only_uow, get_uow_with_commit
+from core.errors.handler import handle_app_errors
+from core.routing import SchemaRoute
+from core.uow.generic import GenericUnitOfWork
+from modules.stats.dependencies.services import get_stats_service
+from modules.stats.schemas import EventStatsListOutSchema, StudyOrganisationStatsListOutSchema, \
+    AttendanceStatsListOutSchema, StatsRefreshOutSchema
+from modules.stats.services import StatsService
+from modules.users.auth.cache import AuthUser
+from modules.users.auth.dependencies import current_superuser
+
+stats_router = APIRouter(prefix="/stats", tags=["stats"], route_class=SchemaRoute)
+
+
+@stats_router.get("/events", response_model=EventStatsListOutSchema)
+@handle_app_errors
+async def retrieve_event_stats(start_dt: Optional[datetime.date] = Query(None),
+                               end_dt: Optional[datetime.date] = Query(None),
+                               admin: AuthUser = Depends(current_superuser),
+                               service: StatsService = Depends(get_stats_service),
+                               uow: GenericUnitOfWork = Depends(get_read_only_uow)):
+    return await service.retrieve_event_stats(start_dt=start_dt, end_dt=end_dt, uow=uow)
+
+
+@stats_router.get("/study_organisations", response_model=StudyOrganisationStatsListOutSchema)
+@handle_app_errors
+async def retrieve_study_organisation_stats(admin: AuthUser = Depends(current_superuser),
+                                            service: StatsService = Depends(get_stats_service),
+                                            uow: GenericUnitOfWork = Depends(get_read_only_uow)):
+    return await service.retrieve_study_organisation_stats(uow=uow)
+
+
+@stats_router.get("/attendance", response_model=AttendanceStatsListOutSchema)
+@handle_app_errors
+async def retrieve_attendance_stats(start_dt: Optional[datetime.date] = Query(None),
+                                    end_dt: Optional[datetime.date] = Query(None),
+                                    admin: AuthUser = Depends(current_superuser),
+                                    service: StatsService = Depends(get_stats_service),
+                                    uow: GenericUnitOfWork = Depends(get_read_only_uow)):
+    return await service.retrieve_attendance_stats(start_dt=start_dt, end_dt=end_dt, uow=uow)
+
+
+@stats_router.post("/refresh", response_model=StatsRefreshOutSchema)
+@handle_app_errors
+async def refresh(admin: AuthUser = Depends(current_superuser),
+                  service: StatsService = Depends(get_stats_service),
+                  uow: GenericUnitOfWork = Depends(get_uow_with_commit)):
+    return await service.refresh(uow=uow)
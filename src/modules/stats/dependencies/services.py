@@ -0,0 +1,5 @@
+from modules.stats.services import StatsService
+
+
+def get_stats_service() -> StatsService:
+    return StatsService()
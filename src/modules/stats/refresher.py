@@ -0,0 +1,80 @@
+import asyncio
+from typing import Callable, Optional
+
+from loguru import logger
+
+from core.uow.generic import GenericUnitOfWork
+from core.uow.transactions import uow_transaction_with_commit
+from modules.stats.services import StatsService
+from setup.settings.app import get_app_settings
+
+__all__ = [
+    "StatsRefresher",
+    "stats_refresher",
+]
+
+settings = get_app_settings()
+
+
+class StatsRefresher:
+    """
+    Periodic refresher of statistics in the background.
+
+    Every process of the application runs its own refresher. Statistics refreshed by one process within half of
+    the interval aren't refreshed by the others, so they are refreshed about once per interval regardless of the
+    number of processes.
+    """
+
+    def __init__(self, get_uow: Callable[[], GenericUnitOfWork], interval_seconds: float):
+        """
+        Initialize a new StatsRefresher instance.
+
+        Args:
+            get_uow (Callable[[], GenericUnitOfWork]): Factory of units of work of the primary database.
+            interval_seconds (float): The interval between refreshes, statistics aren't refreshed periodically if
+                it's not positive.
+        """
+
+        self._get_uow = get_uow
+        self._interval_seconds = interval_seconds
+        self._service = StatsService()
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    async def refresh(self):
+        """
+        Refresh statistics unless they are fresh or being refreshed by another process.
+        """
+
+        try:
+            async with uow_transaction_with_commit(self._get_uow()) as uow:
+                await self._service.refresh(uow=uow, max_age_seconds=self._interval_seconds / 2)
+        except Exception:
+            logger.exception("Refresh of statistics failed")
+
+    async def _run_refreshes(self):
+        while True:
+            await asyncio.sleep(self._interval_seconds)
+            await self.refresh()
+
+    def start(self):
+        """
+        Start refreshing statistics periodically in the background.
+        """
+
+        if self._interval_seconds <= 0:
+            return
+
+        self._refresh_task = asyncio.create_task(self._run_refreshes())
+        logger.info(f"Started refreshes of statistics every {self._interval_seconds} seconds")
+
+    def stop(self):
+        """
+        Stop refreshing statistics.
+        """
+
+        if self._refresh_task:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+
+
+stats_refresher = StatsRefresher(get_uow=settings.get_uow, interval_seconds=settings.stats_refresh_interval_seconds)
@@ -0,0 +1,84 @@
+import datetime
+from abc import ABC, abstractmethod
+from typing import Optional, List, Mapping, Any
+
+
+class IStatsRepository(ABC):
+    """
+    Interface for statistics repository.
+
+    Statistics are aggregated ahead of reads, so their reads don't depend on the number of applications. They are
+    current as of the last refresh.
+    """
+
+    @abstractmethod
+    async def retrieve_event_stats(self,
+                                   start_dt: Optional[datetime.date] = None,
+                                   end_dt: Optional[datetime.date] = None) -> List[Mapping[str, Any]]:
+        """
+        Retrieve numbers of applications of events by statuses.
+
+        Args:
+            start_dt (Optional[datetime.date]): The earliest start date of events.
+            end_dt (Optional[datetime.date]): The latest start date of events.
+
+        Returns:
+            List[Mapping[str, Any]]: Events with the total number of applications and lists of statuses and numbers
+                of applications under the status_counts key, the latest events first.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def retrieve_study_organisation_stats(self) -> List[Mapping[str, Any]]:
+        """
+        Retrieve numbers of applicants and applications of study organisations.
+
+        Returns:
+            List[Mapping[str, Any]]: Study organisations, the ones with the most applicants first.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def retrieve_attendance_stats(self,
+                                        start_dt: Optional[datetime.date] = None,
+                                        end_dt: Optional[datetime.date] = None) -> List[Mapping[str, Any]]:
+        """
+        Retrieve numbers of events, applications and accepted applications by months of event start dates.
+
+        Args:
+            start_dt (Optional[datetime.date]): The date of the earliest month.
+            end_dt (Optional[datetime.date]): The date of the latest month.
+
+        Returns:
+            List[Mapping[str, Any]]: Months in chronological order.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def retrieve_refreshed_at(self) -> Optional[datetime.datetime]:
+        """
+        Retrieve the time of the last refresh of statistics.
+
+        Returns:
+            Optional[datetime.datetime]: The time of the last refresh, or None if statistics are aggregated on read.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def refresh(self, max_age_seconds: Optional[float] = None) -> bool:
+        """
+        Refresh statistics unless another transaction is refreshing them.
+
+        Args:
+            max_age_seconds (Optional[float]): Don't refresh statistics refreshed within this number of seconds.
+                Statistics are always refreshed if not set.
+
+        Returns:
+            bool: True if statistics were refreshed.
+        """
+
+        raise NotImplementedError
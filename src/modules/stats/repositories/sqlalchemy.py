@@ -0,0 +1,209 @@
+import datetime
+from typing import Optional, List, Mapping, Any
+
+from loguru import logger
+from sqlalchemy import Integer, String, Date, Enum, FromClause, select, update, func, cast, text, table, column, \
+    literal_column
+
+from core.repositories.sqlalchemy import SQLAlchemyRepository
+from core.uow.registry import sqlalchemy_repositories
+from db.sqlalchemy.models import Event, EventApplication, EventApplicationStatus, StatsRefresh
+from modules.stats.repositories.interfaces import IStatsRepository
+
+__all__ = [
+    "STATS_REFRESH_LOCK_ID",
+    "SQLAlchemyStatsRepository",
+]
+
+# Key of the advisory lock held by the transaction refreshing statistics
+STATS_REFRESH_LOCK_ID = 480_001
+
+# Materialized views created by the stats_views migration
+event_application_stats_view = table(
+    "event_application_stats",
+    column("event_id", Integer),
+    column("status", Enum(EventApplicationStatus)),
+    column("applications_count", Integer),
+)
+
+study_organisation_stats_view = table(
+    "study_organisation_stats",
+    column("study_organisation", String),
+    column("applicants_count", Integer),
+    column("applications_count", Integer),
+    column("accepted_count", Integer),
+)
+
+event_attendance_stats_view = table(
+    "event_attendance_stats",
+    column("month", Date),
+    column("events_count", Integer),
+    column("applications_count", Integer),
+    column("accepted_count", Integer),
+)
+
+STATS_VIEWS = (event_application_stats_view, study_organisation_stats_view, event_attendance_stats_view)
+
+
+@sqlalchemy_repositories.register("stats")
+class SQLAlchemyStatsRepository(SQLAlchemyRepository[StatsRefresh], IStatsRepository):
+    """
+    Repository of statistics read from materialized views of PostgreSQL databases.
+
+    Views are refreshed concurrently, so reads aren't blocked by refreshes. If materialized views are disabled,
+    e.g. by benchmarks, statistics are aggregated with the queries of the views on read. Only PostgreSQL is
+    supported.
+    """
+
+    model = StatsRefresh
+
+    # Whether statistics are read from materialized views
+    materialized_views: bool = True
+
+    def _uses_views(self) -> bool:
+        return self.materialized_views
+
+    def _get_event_application_stats(self) -> FromClause:
+        if self._uses_views():
+            return event_application_stats_view
+
+        return (select(EventApplication.event_id,
+                       EventApplication.status,
+                       func.count().label("applications_count"))
+                .group_by(EventApplication.event_id, EventApplication.status)
+                .subquery(event_application_stats_view.name))
+
+    def _get_study_organisation_stats(self) -> FromClause:
+        if self._uses_views():
+            return study_organisation_stats_view
+
+        return (select(EventApplication.study_organisation,
+                       func.count(func.lower(EventApplication.email).distinct()).label("applicants_count"),
+                       func.count().label("applications_count"),
+                       func.count().filter(EventApplication.status == EventApplicationStatus.ACCEPTED)
+                       .label("accepted_count"))
+                .group_by(EventApplication.study_organisation)
+                .subquery(study_organisation_stats_view.name))
+
+    def _get_event_attendance_stats(self) -> FromClause:
+        if self._uses_views():
+            return event_attendance_stats_view
+
+        applications = (select(EventApplication.event_id,
+                               func.count().label("applications_count"),
+                               func.count().filter(EventApplication.status == EventApplicationStatus.ACCEPTED)
+                               .label("accepted_count"))
+                        .group_by(EventApplication.event_id)
+                        .subquery("applications"))
+
+        # The unit is a literal, so the grouped expression is the same as the selected one
+        month = cast(func.date_trunc(literal_column("'month'"), Event.start_date), Date)
+
+        return (select(month.label("month"),
+                       func.count().label("events_count"),
+                       cast(func.coalesce(func.sum(applications.c.applications_count), 0), Integer)
+                       .label("applications_count"),
+                       cast(func.coalesce(func.sum(applications.c.accepted_count), 0), Integer)
+                       .label("accepted_count"))
+                .select_from(Event)
+                .outerjoin(applications, applications.c.event_id == Event.id)
+                .group_by(month)
+                .subquery(event_attendance_stats_view.name))
+
+    async def retrieve_event_stats(self,
+                                   start_dt: Optional[datetime.date] = None,
+                                   end_dt: Optional[datetime.date] = None) -> List[Mapping[str, Any]]:
+        stats = self._get_event_application_stats()
+
+        # Events without applications are joined to a row of nulls
+        stmt = (select(Event.id, Event.name, Event.start_date, Event.end_date,
+                       stats.c.status, stats.c.applications_count)
+                .outerjoin(stats, stats.c.event_id == Event.id)
+                .order_by(Event.start_date.desc(), Event.id, stats.c.status))
+
+        if start_dt:
+            stmt = stmt.where(Event.start_date >= start_dt)
+
+        if end_dt:
+            stmt = stmt.where(Event.start_date <= end_dt)
+
+        result = await self._session.execute(stmt)
+
+        events = {}
+
+        for row in result.mappings():
+            event = events.get(row["id"])
+
+            if event is None:
+                event = events[row["id"]] = {"id": row["id"],
+                                             "name": row["name"],
+                                             "start_date": row["start_date"],
+                                             "end_date": row["end_date"],
+                                             "applications_count": 0,
+                                             "status_counts": []}
+
+            if row["status"] is not None:
+                event["applications_count"] += row["applications_count"]
+                event["status_counts"].append({"status": row["status"], "count": row["applications_count"]})
+
+        logger.debug("Retrieved statistics of {} events", len(events))
+
+        return list(events.values())
+
+    async def retrieve_study_organisation_stats(self) -> List[Mapping[str, Any]]:
+        stats = self._get_study_organisation_stats()
+        stmt = select(stats).order_by(stats.c.applicants_count.desc(), stats.c.study_organisation)
+        result = await self._session.execute(stmt)
+
+        return result.mappings().all()
+
+    async def retrieve_attendance_stats(self,
+                                        start_dt: Optional[datetime.date] = None,
+                                        end_dt: Optional[datetime.date] = None) -> List[Mapping[str, Any]]:
+        stats = self._get_event_attendance_stats()
+        stmt = select(stats).order_by(stats.c.month)
+
+        if start_dt:
+            stmt = stmt.where(stats.c.month >= start_dt.replace(day=1))
+
+        if end_dt:
+            stmt = stmt.where(stats.c.month <= end_dt)
+
+        result = await self._session.execute(stmt)
+
+        return result.mappings().all()
+
+    async def retrieve_refreshed_at(self) -> Optional[datetime.datetime]:
+        if not self._uses_views():
+            return None
+
+        return await self._session.scalar(select(StatsRefresh.refreshed_at).where(StatsRefresh.id == 1))
+
+    async def refresh(self, max_age_seconds: Optional[float] = None) -> bool:
+        if not self._uses_views():
+            return False
+
+        # The lock is released with the end of the transaction, refreshes of other processes are skipped meanwhile
+        if not await self._session.scalar(select(func.pg_try_advisory_xact_lock(STATS_REFRESH_LOCK_ID))):
+            logger.debug("Statistics are being refreshed by another transaction")
+            return False
+
+        if max_age_seconds is not None:
+            is_fresh = await self._session.scalar(
+                select(StatsRefresh.refreshed_at > func.localtimestamp() - datetime.timedelta(seconds=max_age_seconds))
+                .where(StatsRefresh.id == 1)
+            )
+
+            if is_fresh:
+                logger.debug("Statistics are refreshed within {} seconds", max_age_seconds)
+                return False
+
+        for view in STATS_VIEWS:
+            await self._session.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view.name}"))
+
+        await self._session.execute(update(StatsRefresh)
+                                    .where(StatsRefresh.id == 1)
+                                    .values(refreshed_at=func.localtimestamp()))
+        logger.info("Refreshed statistics")
+
+        return True
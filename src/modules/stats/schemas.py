@@ -0,0 +1,73 @@
+from datetime import date, datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+from db.sqlalchemy.models import EventApplicationStatus
+
+
+class EventApplicationStatusCountOutSchema(BaseModel):
+    status: EventApplicationStatus = Field(examples=[EventApplicationStatus.ACCEPTED])
+    count: int = Field(ge=0, examples=[1, 2, 3, 4, 5])
+
+    model_config = {
+        "from_attributes": True,
+        "use_enum_values": True
+    }
+
+
+class EventStatsOutSchema(BaseModel):
+    id: int = Field(ge=0, examples=[1, 2, 3, 4, 5])
+    name: str = Field(max_length=255, examples=["Lunch", "Dinner"])
+    start_date: date = Field(examples=[date.today()])
+    end_date: date = Field(examples=[date.today()])
+    applications_count: int = Field(ge=0, examples=[1, 2, 3, 4, 5])
+    status_counts: List[EventApplicationStatusCountOutSchema]
+
+    model_config = {
+        "from_attributes": True
+    }
+
+
+class StudyOrganisationStatsOutSchema(BaseModel):
+    study_organisation: str = Field(max_length=255, examples=["BSU", "BSUIR"])
+    applicants_count: int = Field(ge=0, examples=[1, 2, 3, 4, 5])
+    applications_count: int = Field(ge=0, examples=[1, 2, 3, 4, 5])
+    accepted_count: int = Field(ge=0, examples=[1, 2, 3, 4, 5])
+
+    model_config = {
+        "from_attributes": True
+    }
+
+
+class AttendanceStatsOutSchema(BaseModel):
+    month: date = Field(examples=[date.today().replace(day=1)])
+    events_count: int = Field(ge=0, examples=[1, 2, 3, 4, 5])
+    applications_count: int = Field(ge=0, examples=[1, 2, 3, 4, 5])
+    accepted_count: int = Field(ge=0, examples=[1, 2, 3, 4, 5])
+
+    model_config = {
+        "from_attributes": True
+    }
+
+
+# Statistics are current as of refreshed_at, which is None if they are aggregated on read
+
+class EventStatsListOutSchema(BaseModel):
+    refreshed_at: Optional[datetime] = Field(examples=[datetime.now()])
+    items: List[EventStatsOutSchema]
+
+
+class StudyOrganisationStatsListOutSchema(BaseModel):
+    refreshed_at: Optional[datetime] = Field(examples=[datetime.now()])
+    items: List[StudyOrganisationStatsOutSchema]
+
+
+class AttendanceStatsListOutSchema(BaseModel):
+    refreshed_at: Optional[datetime] = Field(examples=[datetime.now()])
+    items: List[AttendanceStatsOutSchema]
+
+
+class StatsRefreshOutSchema(BaseModel):
+    refreshed: bool = Field(examples=[True])
+    refreshed_at: Optional[datetime] = Field(examples=[datetime.now()])
@@ -0,0 +1,93 @@
+import datetime
+from typing import Optional
+
+from core.uow.generic import GenericUnitOfWork
+from modules.stats.schemas import EventStatsListOutSchema, StudyOrganisationStatsListOutSchema, \
+    AttendanceStatsListOutSchema, StatsRefreshOutSchema
+
+
+class StatsService:
+    """
+    Service of statistics of events and applications for the admin dashboard.
+    """
+
+    async def retrieve_event_stats(self,
+                                   uow: GenericUnitOfWork,
+                                   start_dt: Optional[datetime.date] = None,
+                                   end_dt: Optional[datetime.date] = None) -> EventStatsListOutSchema:
+        """
+        Get numbers of applications of events by statuses.
+
+        Args:
+            uow (GenericUnitOfWork): The unit of work instance.
+            start_dt (Optional[datetime.date]): The earliest start date of events.
+            end_dt (Optional[datetime.date]): The latest start date of events.
+
+        Returns:
+            EventStatsListOutSchema: Statistics of events, the latest events first.
+        """
+
+        items = await uow.stats.retrieve_event_stats(start_dt=start_dt, end_dt=end_dt)
+
+        return EventStatsListOutSchema.model_validate(
+            {"refreshed_at": await uow.stats.retrieve_refreshed_at(), "items": items},
+            from_attributes=True,
+        )
+
+    async def retrieve_study_organisation_stats(self, uow: GenericUnitOfWork) -> StudyOrganisationStatsListOutSchema:
+        """
+        Get numbers of applicants and applications of study organisations.
+
+        Args:
+            uow (GenericUnitOfWork): The unit of work instance.
+
+        Returns:
+            StudyOrganisationStatsListOutSchema: Statistics of study organisations, the ones with the most
+                applicants first.
+        """
+
+        items = await uow.stats.retrieve_study_organisation_stats()
+
+        return StudyOrganisationStatsListOutSchema.model_validate(
+            {"refreshed_at": await uow.stats.retrieve_refreshed_at(), "items": items},
+            from_attributes=True,
+        )
+
+    async def retrieve_attendance_stats(self,
+                                        uow: GenericUnitOfWork,
+                                        start_dt: Optional[datetime.date] = None,
+                                        end_dt: Optional[datetime.date] = None) -> AttendanceStatsListOutSchema:
+        """
+        Get numbers of events, applications and accepted applications by months of event start dates.
+
+        Args:
+            uow (GenericUnitOfWork): The unit of work instance.
+            start_dt (Optional[datetime.date]): The date of the earliest month.
+            end_dt (Optional[datetime.date]): The date of the latest month.
+
+        Returns:
+            AttendanceStatsListOutSchema: Statistics of months in chronological order.
+        """
+
+        items = await uow.stats.retrieve_attendance_stats(start_dt=start_dt, end_dt=end_dt)
+
+        return AttendanceStatsListOutSchema.model_validate(
+            {"refreshed_at": await uow.stats.retrieve_refreshed_at(), "items": items},
+            from_attributes=True,
+        )
+
+    async def refresh(self, uow: GenericUnitOfWork, max_age_seconds: Optional[float] = None) -> StatsRefreshOutSchema:
+        """
+        Refresh statistics unless another transaction is refreshing them. The unit of work must be committed.
+
+        Args:
+            uow (GenericUnitOfWork): The unit of work instance.
+            max_age_seconds (Optional[float]): Don't refresh statistics refreshed within this number of seconds.
+
+        Returns:
+            StatsRefreshOutSchema: Whether statistics were refreshed and the time of the last refresh.
+        """
+
+        refreshed = await uow.stats.refresh(max_age_seconds=max_age_seconds)
+
+        return StatsRefreshOutSchema(refreshed=refreshed, refreshed_at=await uow.stats.retrieve_refreshed_at())
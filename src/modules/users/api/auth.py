@@ -2,11 +2,13 @@ from fastapi import APIRouter, Depends, HTTPException
 from fastapi_users import BaseUserManager, schemas
 from fastapi_users.exceptions import UserAlreadyExists
 
-from db.sqlalchemy.models import User
+from core.routing import SchemaRoute
 from modules.users.auth import fastapi_users, auth_backend
+from modules.users.auth.cache import AuthUser
+from modules.users.auth.dependencies import current_superuser
 from modules.users.schemas.user import UserRead, UserUpdate, SuperuserCreate
 
-auth_router = APIRouter()
+auth_router = APIRouter(route_class=SchemaRoute)
 
 auth_router.include_router(
     fastapi_users.get_auth_router(auth_backend), prefix="/auth/jwt", tags=["auth"]
@@ -41,7 +43,7 @@ auth_router.include_router(
 async def create_superuser(
     user_data: SuperuserCreate,
     user_manager: BaseUserManager = Depends(fastapi_users.get_user_manager),
-    current_user: User = Depends(fastapi_users.current_user(superuser=True)),
+    current_user: AuthUser = Depends(current_superuser),
 ):
     """
     Эндпоинт для создания суперпользователя.
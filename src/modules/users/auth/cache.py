@@ -0,0 +1,93 @@
+import uuid
+from dataclasses import dataclass
+from typing import Optional
+
+from cachetools import TTLCache
+from loguru import logger
+
+from core.metrics import CACHE_REQUESTS
+from setup.settings.app import get_app_settings
+
+__all__ = [
+    "AuthUser",
+    "UserCache",
+    "user_cache",
+]
+
+settings = get_app_settings()
+
+
+@dataclass(frozen=True)
+class AuthUser:
+    """
+    Claims of the user needed for authorization.
+    """
+
+    id: uuid.UUID
+    is_active: bool
+    is_superuser: bool
+
+
+class UserCache:
+    """
+    Short-lived cache of resolved users, so authorization of requests doesn't need database access.
+
+    The cache is local to the process. Entries are invalidated when the user is updated or deleted through the user
+    manager, the TTL bounds the staleness of entries changed by other processes.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        """
+        Initialize a new UserCache instance.
+
+        Args:
+            max_size (int): The maximum number of cached users.
+            ttl_seconds (float): The time to live of cached users in seconds.
+        """
+
+        self._cache: TTLCache[uuid.UUID, AuthUser] = TTLCache(maxsize=max_size, ttl=ttl_seconds)
+        self._hits = CACHE_REQUESTS.labels("auth_user", "hit")
+        self._misses = CACHE_REQUESTS.labels("auth_user", "miss")
+
+    def get(self, id: uuid.UUID) -> Optional[AuthUser]:
+        auth_user = self._cache.get(id)
+
+        if auth_user is None:
+            self._misses.inc()
+        else:
+            self._hits.inc()
+
+        return auth_user
+
+    def set(self, user) -> AuthUser:
+        """
+        Cache claims of the user.
+
+        Args:
+            user: The user model.
+
+        Returns:
+            AuthUser: The cached claims.
+        """
+
+        auth_user = AuthUser(id=user.id, is_active=user.is_active, is_superuser=user.is_superuser)
+        self._cache[user.id] = auth_user
+        return auth_user
+
+    def invalidate(self, id: uuid.UUID):
+        """
+        Remove the user from the cache.
+
+        Args:
+            id (uuid.UUID): The ID of the user.
+        """
+
+        if self._cache.pop(id, None) is not None:
+            logger.debug(f"Invalidated cached user with id={id}")
+
+    def clear(self):
+        self._cache.clear()
+
+
+user_cache = UserCache(max_size=settings.auth_user_cache_max_size,
+                       ttl_seconds=settings.auth_user_cache_ttl_seconds)
@@ -0,0 +1,105 @@
+from typing import Optional
+
+import jwt
+from fastapi import Depends, HTTPException, status
+from fastapi_users import BaseUserManager, exceptions
+from fastapi_users.jwt import decode_jwt
+from fastapi_users_db_sqlalchemy import SQLAlchemyUserDatabase
+
+from db.sqlalchemy.models import User
+from modules.users.auth.cache import AuthUser, user_cache
+from modules.users.auth.jwt import get_jwt_strategy
+from modules.users.auth.transport import transport
+from modules.users.manager.manager import get_user_manager, UserManager
+from setup.sqlalchemy.session import async_session_maker
+
+__all__ = [
+    "current_active_user",
+    "current_superuser",
+    "is_superuser_token",
+]
+
+strategy = get_jwt_strategy()
+
+
+async def _get_auth_user(token: Optional[str], user_manager: BaseUserManager) -> Optional[AuthUser]:
+    if token is None:
+        return None
+
+    try:
+        data = decode_jwt(token, strategy.decode_key, strategy.token_audience, algorithms=[strategy.algorithm])
+        id = user_manager.parse_id(data["sub"])
+    except (jwt.PyJWTError, KeyError, exceptions.InvalidID):
+        return None
+
+    auth_user = user_cache.get(id)
+
+    if auth_user is not None:
+        return auth_user
+
+    try:
+        user = await user_manager.get(id)
+    except exceptions.UserNotExists:
+        return None
+
+    return user_cache.set(user)
+
+
+async def current_active_user(token: Optional[str] = Depends(transport.scheme),
+                              user_manager: BaseUserManager = Depends(get_user_manager)) -> AuthUser:
+    """
+    Dependency for retrieving the active user authenticated by the JWT cookie.
+
+    The user is resolved from the cache, the database is queried only on a cache miss.
+
+    Raises:
+        HTTPException: 401 if the user isn't authenticated or isn't active.
+
+    Returns:
+        AuthUser: Claims of the user.
+    """
+
+    auth_user = await _get_auth_user(token, user_manager)
+
+    if auth_user is None or not auth_user.is_active:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
+
+    return auth_user
+
+
+async def current_superuser(auth_user: AuthUser = Depends(current_active_user)) -> AuthUser:
+    """
+    Dependency for retrieving the active superuser authenticated by the JWT cookie.
+
+    Raises:
+        HTTPException: 401 if the user isn't authenticated or isn't active, 403 if the user isn't a superuser.
+
+    Returns:
+        AuthUser: Claims of the superuser.
+    """
+
+    if not auth_user.is_superuser:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
+
+    return auth_user
+
+
+async def is_superuser_token(token: Optional[str]) -> bool:
+    """
+    Check whether the token authenticates an active superuser outside of dependencies, e.g. in middlewares.
+
+    Args:
+        token (Optional[str]): The JWT token.
+
+    Returns:
+        bool: True if the token authenticates an active superuser, False otherwise.
+    """
+
+    if token is None:
+        return False
+
+    async with async_session_maker() as session:
+        user_manager = UserManager(SQLAlchemyUserDatabase(session, User))
+        auth_user = await _get_auth_user(token, user_manager)
+
+    return auth_user is not None and auth_user.is_active and auth_user.is_superuser
@@ -1,5 +1,5 @@
 import uuid
-from typing import Optional
+from typing import Optional, Any, Dict
 
 from fastapi import Request, Depends
 from fastapi_users import UUIDIDMixin, BaseUserManager
@@ -7,6 +7,7 @@ from fastapi_users_db_sqlalchemy import SQLAlchemyUserDatabase
 from sqlalchemy.testing.pickleable import User
 
 from db.sqlalchemy.models.user import get_user_db
+from modules.users.auth.cache import user_cache
 from setup.settings.app import get_app_settings
 
 settings = get_app_settings()
@@ -29,6 +30,12 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
     ):
         print(f"Verification requested for user {user.id}. Verification token: {token}")
 
+    async def on_after_update(self, user: User, update_dict: Dict[str, Any], request: Optional[Request] = None):
+        user_cache.invalidate(user.id)
+
+    async def on_after_delete(self, user: User, request: Optional[Request] = None):
+        user_cache.invalidate(user.id)
+
 
 async def get_user_manager(user_db: SQLAlchemyUserDatabase = Depends(get_user_db)):
     yield UserManager(user_db)
@@ -0,0 +1,65 @@
+from fastapi import FastAPI
+from gunicorn.app.base import BaseApplication
+from uvicorn.importer import import_from_string
+from uvicorn_worker import UvicornWorker as BaseUvicornWorker
+
+from config.settings.server import ServerSettings
+from setup.app.metrics import mark_metrics_process_dead
+from setup.settings.server import get_server_settings
+
+
+class UvicornWorker(BaseUvicornWorker):
+    """
+    Uvicorn worker of gunicorn using the event loop and HTTP parser of the server settings.
+    """
+
+    CONFIG_KWARGS = {
+        "loop": get_server_settings().server_loop,
+        "http": get_server_settings().server_http,
+    }
+
+
+def child_exit(server, worker) -> None:
+    mark_metrics_process_dead(worker.pid)
+
+
+class GunicornApplication(BaseApplication):
+    """
+    Gunicorn application supervising uvicorn workers.
+
+    Unlike the uvicorn supervisor, gunicorn kills hung workers and spreads worker restarts with a jitter.
+    """
+
+    def __init__(self, app: FastAPI | str, settings: ServerSettings, workers: int):
+        """
+        Initialize a new GunicornApplication instance.
+
+        Args:
+            app (FastAPI | str): The application or its import string, which is imported in each worker.
+            settings (ServerSettings): The server settings.
+            workers (int): The number of worker processes.
+        """
+
+        self._app = app
+        self._options = {
+            "bind": f"{settings.web_app_host}:{settings.web_app_port}",
+            "workers": workers,
+            "worker_class": f"{UvicornWorker.__module__}.{UvicornWorker.__qualname__}",
+            "backlog": settings.server_backlog,
+            "keepalive": settings.server_keep_alive_seconds,
+            "graceful_timeout": settings.server_graceful_shutdown_seconds,
+            "max_requests": settings.server_limit_max_requests or 0,
+            "max_requests_jitter": settings.server_max_requests_jitter,
+            "child_exit": child_exit,
+        }
+        super().__init__()
+
+    def load_config(self):
+        for key, value in self._options.items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        if isinstance(self._app, str):
+            return import_from_string(self._app)
+
+        return self._app
@@ -1,9 +1,14 @@
+import os
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from loguru import logger
 
+from modules.stats.refresher import stats_refresher
+from setup.app.metrics import mark_metrics_process_dead
 from setup.settings.app import get_app_settings
+from setup.sqlalchemy.replicas import replica_router
+from setup.tracing import shutdown_tracing
 
 
 @asynccontextmanager
@@ -16,6 +21,21 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Error initializing firebase: {e}")
 
+    await replica_router.start()
+
+    stats_refresher.start()
+
     yield
 
     logger.info("Shutting down...")
+
+    stats_refresher.stop()
+
+    await replica_router.stop()
+
+    shutdown_tracing()
+
+    mark_metrics_process_dead(os.getpid())
+
+    await logger.complete()
+    logger.remove()
@@ -0,0 +1,41 @@
+import os
+
+from fastapi import FastAPI, Response
+from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, REGISTRY, generate_latest
+from prometheus_client.multiprocess import MultiProcessCollector, mark_process_dead
+
+
+def get_metrics_registry() -> CollectorRegistry:
+    """
+    Get the registry to expose metrics from.
+
+    When PROMETHEUS_MULTIPROC_DIR is set (several worker processes), metrics of all workers are collected from it.
+
+    Returns:
+        CollectorRegistry: The registry.
+    """
+
+    if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        return REGISTRY
+
+    registry = CollectorRegistry()
+    MultiProcessCollector(registry)
+    return registry
+
+
+def mark_metrics_process_dead(pid: int) -> None:
+    """
+    Remove live gauge values of the exited worker process, so restarted workers don't add up with dead ones.
+
+    Args:
+        pid (int): The ID of the worker process.
+    """
+
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        mark_process_dead(pid)
+
+
+def register_metrics(app: FastAPI) -> None:
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        return Response(content=generate_latest(get_metrics_registry()), media_type=CONTENT_TYPE_LATEST)
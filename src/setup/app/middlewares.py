@@ -0,0 +1,31 @@
+from fastapi import FastAPI
+
+from core.middlewares.access_log import AccessLogMiddleware
+from core.middlewares.compression import CompressionMiddleware
+from core.middlewares.metrics import MetricsMiddleware
+from core.middlewares.read_your_writes import ReadYourWritesMiddleware
+from core.middlewares.tracing import TracingMiddleware
+from core.tracing import is_tracing_available
+from setup.settings.server import get_server_settings
+from setup.sqlalchemy.replicas import replica_router
+
+
+def register_middlewares(app: FastAPI) -> None:
+    settings = get_server_settings()
+
+    if settings.compression_enabled:
+        app.add_middleware(CompressionMiddleware,
+                           minimum_size=settings.compression_minimum_size,
+                           gzip_level=settings.compression_gzip_level,
+                           brotli_quality=settings.compression_brotli_quality)
+
+    if replica_router.has_replicas:
+        app.add_middleware(ReadYourWritesMiddleware, sticky_seconds=settings.pg_primary_sticky_seconds)
+
+    if settings.metrics_enabled:
+        app.add_middleware(MetricsMiddleware)
+
+    if settings.otel_enabled and is_tracing_available():
+        app.add_middleware(TracingMiddleware)
+
+    app.add_middleware(AccessLogMiddleware, expose_db_stats=settings.debug)
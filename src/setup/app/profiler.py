@@ -0,0 +1,55 @@
+import asyncio
+import threading
+
+from fastapi import FastAPI, Depends, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+from starlette.requests import Request
+
+from core.middlewares.profiler import ProfilerMiddleware
+from core.utils.profiler import SamplingProfiler
+from modules.users.auth.cache import AuthUser
+from modules.users.auth.dependencies import current_superuser, is_superuser_token
+from modules.users.auth.transport import transport
+from setup.settings.server import get_server_settings
+
+_profile_lock = asyncio.Lock()
+
+
+async def _is_superuser_request(request: Request) -> bool:
+    return await is_superuser_token(request.cookies.get(transport.cookie_name))
+
+
+def register_profiler(app: FastAPI) -> None:
+    """
+    Register the admin-only profiling route of the worker and per-request profiling with `?profile=1`.
+
+    Args:
+        app (FastAPI): The application.
+    """
+
+    settings = get_server_settings()
+
+    app.add_middleware(ProfilerMiddleware, authorize=_is_superuser_request)
+
+    @app.get("/debug/profile", include_in_schema=False, response_class=PlainTextResponse)
+    async def profile(seconds: float = Query(10.0, gt=0, le=settings.profiler_max_seconds),
+                      interval: float = Query(0.005, ge=0.001, le=1.0),
+                      admin: AuthUser = Depends(current_superuser)):
+        """
+        Sample stacks of the event loop thread of this worker for the given time.
+
+        Returns:
+            PlainTextResponse: Samples in the collapsed stack format.
+        """
+
+        if _profile_lock.locked():
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Profiling is already in progress")
+
+        async with _profile_lock:
+            with SamplingProfiler(interval=interval, thread_id=threading.get_ident()) as profiler:
+                await asyncio.sleep(seconds)
+
+        return PlainTextResponse(profiler.get_collapsed_stacks(), headers={
+            "X-Profile-Duration": f"{profiler.duration:.6f}",
+            "X-Profile-Samples": str(profiler.samples.total()),
+        })
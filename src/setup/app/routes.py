@@ -6,6 +6,8 @@ from modules.media.api.media import media_router
 from modules.media.api.media_category import media_category_router
 from modules.museum.api.hall import museum_hall_router
 from modules.museum.api.section import museum_section_router
+from modules.museum.api.tree import museum_tree_router
+from modules.stats.api.stats import stats_router
 from modules.users.api.auth import auth_router
 
 
@@ -18,4 +20,6 @@ def register_routes(app: FastAPI, api_router: APIRouter) -> None:
     api_router.include_router(media_category_router)
     api_router.include_router(museum_hall_router)
     api_router.include_router(museum_section_router)
+    api_router.include_router(museum_tree_router)
+    api_router.include_router(stats_router)
     app.include_router(api_router)
@@ -1,15 +1,70 @@
+import os
+
 from fastapi import FastAPI
+from loguru import logger
 
+from config.settings.server import ServerSettings
 from setup.settings.server import get_server_settings
 
 
+def get_workers(settings: ServerSettings) -> int:
+    """
+    Get the number of worker processes to start.
+
+    Args:
+        settings (ServerSettings): The server settings.
+
+    Returns:
+        int: The configured number of workers, the number of CPU cores if not configured, 1 when reloading.
+    """
+
+    if settings.reload:
+        return 1
+
+    return settings.server_workers or os.cpu_count() or 1
+
+
 def start_app(app: FastAPI | str) -> None:
-    import uvicorn
+    """
+    Start the server with the supervisor, worker processes and tuning of the server settings.
+
+    Several workers need the application as an import string, e.g. "main:app".
+
+    Args:
+        app (FastAPI | str): The application or its import string.
+    """
 
     settings = get_server_settings()
+    workers = get_workers(settings)
+
+    if workers > 1 and settings.metrics_enabled and "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        logger.warning("PROMETHEUS_MULTIPROC_DIR is not set, /metrics will expose metrics of a single worker")
+
+    if settings.server_supervisor == "gunicorn":
+        from setup.app.gunicorn import GunicornApplication
+
+        GunicornApplication(app, settings, workers).run()
+        return
+
+    import uvicorn
+
+    # A single worker isn't supervised, it wouldn't be restarted after serving the limit of requests
+    limit_max_requests = settings.server_limit_max_requests if workers > 1 else None
+
+    if limit_max_requests and settings.server_max_requests_jitter:
+        logger.warning("Restarts of uvicorn workers are not spread by server_max_requests_jitter, "
+                       "use the gunicorn supervisor to spread them")
+
     uvicorn.run(
         app,
         host=settings.web_app_host,
         port=settings.web_app_port,
         reload=settings.reload,
+        workers=workers,
+        loop=settings.server_loop,
+        http=settings.server_http,
+        timeout_keep_alive=settings.server_keep_alive_seconds,
+        backlog=settings.server_backlog,
+        timeout_graceful_shutdown=settings.server_graceful_shutdown_seconds,
+        limit_max_requests=limit_max_requests,
     )
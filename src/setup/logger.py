@@ -1,33 +1,83 @@
 import sys
 
 from loguru import logger
+
 from config.directories import BASE_DIRECTORY
+from config.settings.server import ServerSettings
+from core.context.request import get_request_context
 
-simple_fmt = "<level>{level}</level> " "<cyan>{name}</cyan> " "<level>{message}</level>"
+simple_fmt = "<level>{level}</level> " "<cyan>{name}</cyan> " "<magenta>{extra[request_id]}</magenta> " \
+             "<level>{message}</level>"
 comprehensive_fmt = (
     "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | "
     "<level>{level: <8}</level> | "
     "REVIEW | "
+    "<magenta>{extra[request_id]}</magenta> | "
     "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | "
     " - <level>{message}</level>"
 )
 
-logger.remove()
+access_fmt = "{message}"
 
-logger.add(
-    sink=sys.stderr,
-    level="DEBUG",
-    format=simple_fmt,
-    colorize=True,
-    backtrace=True,
-    diagnose=True,
-)
 
+def _patch_request_id(record):
+    context = get_request_context()
+    record["extra"].setdefault("request_id", context.request_id if context else "-")
 
-logger.add(
-    sink=BASE_DIRECTORY / "logs.log",
-    level="DEBUG",
-    format=comprehensive_fmt,
-    backtrace=True,
-    diagnose=True,
-)
+
+def _is_not_access_record(record) -> bool:
+    return "access" not in record["extra"]
+
+
+def _is_access_record(record) -> bool:
+    return "access" in record["extra"]
+
+
+def configure_logger(settings: ServerSettings) -> None:
+    """
+    Configure sinks of the logger.
+
+    With enqueue enabled, messages are written by a background thread, so requests don't wait for stderr and
+    file writes. The file sink is rotated, old files are compressed and removed after the retention period.
+    Variables of tracebacks are only logged in environments with diagnose enabled, since they may contain secrets.
+    Every record gets the ID of the current request, access records are written as bare JSON lines to stdout.
+
+    Args:
+        settings (ServerSettings): The server settings.
+    """
+
+    logger.remove()
+    logger.configure(patcher=_patch_request_id)
+
+    logger.add(
+        sink=sys.stderr,
+        level=settings.log_level,
+        format=simple_fmt,
+        filter=_is_not_access_record,
+        colorize=True,
+        backtrace=True,
+        diagnose=settings.log_diagnose,
+        enqueue=settings.log_enqueue,
+    )
+
+    if settings.log_access:
+        logger.add(
+            sink=sys.stdout,
+            level="INFO",
+            format=access_fmt,
+            filter=_is_access_record,
+            enqueue=settings.log_enqueue,
+        )
+
+    if settings.log_file:
+        logger.add(
+            sink=BASE_DIRECTORY / settings.log_file,
+            level=settings.log_file_level,
+            format=comprehensive_fmt,
+            backtrace=True,
+            diagnose=settings.log_diagnose,
+            enqueue=settings.log_enqueue,
+            rotation=settings.log_rotation,
+            retention=settings.log_retention,
+            compression=settings.log_compression,
+        )
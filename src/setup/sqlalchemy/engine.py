@@ -1,8 +1,32 @@
 from sqlalchemy import NullPool
-from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine
 
-from .url import DATABASE_URL
+from .events import register_query_tracking, register_connection_metrics
+from .url import DATABASE_URL, REPLICA_DATABASE_URLS
 
 # Async Engine #
 
 async_engine = create_async_engine(DATABASE_URL, poolclass=NullPool)
+register_query_tracking(async_engine)
+register_connection_metrics(async_engine, "primary")
+
+
+# Async Read-Only Engines #
+
+def create_async_read_only_engine(url: str, name: str) -> AsyncEngine:
+    engine = create_async_engine(
+        url,
+        poolclass=NullPool,
+        isolation_level="AUTOCOMMIT",
+        connect_args={"server_settings": {"default_transaction_read_only": "on"}},
+    )
+    register_query_tracking(engine)
+    register_connection_metrics(engine, name)
+    return engine
+
+
+async_read_only_engine = create_async_read_only_engine(DATABASE_URL, "primary_read_only")
+
+async_replica_engines = [
+    create_async_read_only_engine(url, f"replica_{index}") for index, url in enumerate(REPLICA_DATABASE_URLS)
+]
@@ -0,0 +1,128 @@
+import time
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from core.context.request import get_request_context
+from core.metrics import DB_CONNECTION_CHECKOUT_DURATION, DB_CONNECTIONS_IN_USE, DB_CONNECTION_USAGE_DURATION
+from setup.settings.server import get_server_settings
+
+__all__ = [
+    "register_query_tracking",
+    "register_connection_metrics",
+    "redact_parameters",
+]
+
+settings = get_server_settings()
+
+QUERY_START_TIMES_KEY = "query_start_times"
+
+CONNECT_START_TIME_KEY = "connect_start_time"
+
+CHECKOUT_TIME_KEY = "checkout_time"
+
+
+def redact_parameters(parameters: Any) -> Any:
+    """
+    Replace values of query parameters with their type names, so logged queries don't leak user data.
+
+    Args:
+        parameters (Any): Parameters of the query, a mapping, a sequence or a list of them for executemany.
+
+    Returns:
+        Any: Parameters of the same shape with values replaced by type names.
+    """
+
+    if isinstance(parameters, dict):
+        return {key: f"<{type(value).__name__}>" for key, value in parameters.items()}
+
+    if isinstance(parameters, list):
+        return [redact_parameters(item) for item in parameters]
+
+    if isinstance(parameters, tuple):
+        return tuple(f"<{type(value).__name__}>" for value in parameters)
+
+    return f"<{type(parameters).__name__}>"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault(QUERY_START_TIMES_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    duration = time.perf_counter() - conn.info[QUERY_START_TIMES_KEY].pop()
+    request_context = get_request_context()
+
+    if request_context is not None:
+        request_context.add_query(duration)
+
+    if duration >= settings.db_slow_query_seconds:
+        logger.warning("Slow query took {:.3f} s: {} parameters={}",
+                       duration, statement, redact_parameters(parameters))
+
+
+def _handle_error(exception_context):
+    start_times = exception_context.connection.info.get(QUERY_START_TIMES_KEY) \
+        if exception_context.connection is not None else None
+
+    if start_times:
+        start_times.pop()
+
+
+def register_query_tracking(engine: AsyncEngine) -> None:
+    """
+    Register event hooks counting and timing queries of the engine within the context of the request.
+
+    Queries slower than the configured threshold are logged with redacted parameters.
+
+    Args:
+        engine (AsyncEngine): The engine.
+    """
+
+    sync_engine = engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
+
+
+def register_connection_metrics(engine: AsyncEngine, name: str) -> None:
+    """
+    Register event hooks observing how long connections of the engine take to check out and how long they are held.
+
+    With NullPool, checking out a connection means establishing a new one, so checkout duration is the connect
+    time of the driver.
+
+    Args:
+        engine (AsyncEngine): The engine.
+        name (str): The name of the engine used as the label of metrics.
+    """
+
+    sync_engine = engine.sync_engine
+    checkout_duration = DB_CONNECTION_CHECKOUT_DURATION.labels(name)
+    connections_in_use = DB_CONNECTIONS_IN_USE.labels(name)
+    usage_duration = DB_CONNECTION_USAGE_DURATION.labels(name)
+
+    @event.listens_for(sync_engine, "do_connect")
+    def do_connect(dialect, connection_record, cargs, cparams):
+        connection_record.info[CONNECT_START_TIME_KEY] = time.perf_counter()
+
+    @event.listens_for(sync_engine.pool, "checkout")
+    def checkout(dbapi_connection, connection_record, connection_proxy):
+        now = time.perf_counter()
+        connect_start_time = connection_record.info.pop(CONNECT_START_TIME_KEY, None)
+
+        if connect_start_time is not None:
+            checkout_duration.observe(now - connect_start_time)
+
+        connection_record.info[CHECKOUT_TIME_KEY] = now
+        connections_in_use.inc()
+
+    @event.listens_for(sync_engine.pool, "checkin")
+    def checkin(dbapi_connection, connection_record):
+        checkout_time = connection_record.info.pop(CHECKOUT_TIME_KEY, None)
+
+        if checkout_time is not None:
+            usage_duration.observe(time.perf_counter() - checkout_time)
+            connections_in_use.dec()
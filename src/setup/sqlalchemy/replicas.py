@@ -0,0 +1,162 @@
+import asyncio
+from itertools import count
+from typing import List, Optional
+
+from loguru import logger
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+from setup.settings.server import get_server_settings
+from .engine import async_replica_engines
+from .session import async_read_only_session_maker
+
+__all__ = [
+    "ReplicaRouter",
+    "replica_router",
+]
+
+settings = get_server_settings()
+
+REPLICATION_LAG_QUERY = text(
+    "SELECT CASE "
+    "WHEN NOT pg_is_in_recovery() THEN 0 "
+    "WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) "
+    "END"
+)
+
+
+class Replica:
+    """
+    Read-only replica of the database with the state of its last health check.
+    """
+
+    def __init__(self, engine: AsyncEngine):
+        self.engine = engine
+        self.session_maker = async_sessionmaker(bind=engine, expire_on_commit=False, autoflush=False)
+        self.healthy = True
+        self.lag: Optional[float] = None
+
+    @property
+    def name(self) -> str:
+        url = self.engine.url
+        return f"{url.host}:{url.port}/{url.database}"
+
+
+class ReplicaRouter:
+    """
+    Router of read-only sessions between the primary database and its replicas.
+
+    Replicas are picked in round-robin order among healthy ones. A replica is healthy when its last health check
+    succeeded and its replication lag did not exceed the tolerated one. Sessions are bound to the primary when
+    it is requested explicitly (e.g. to read own writes) or when no replica is healthy.
+    """
+
+    def __init__(self,
+                 primary_session_maker: async_sessionmaker,
+                 replica_engines: List[AsyncEngine],
+                 max_lag_seconds: float,
+                 health_check_seconds: float):
+        """
+        Initialize a new ReplicaRouter instance.
+
+        Args:
+            primary_session_maker (async_sessionmaker): Read-only session maker of the primary database.
+            replica_engines (List[AsyncEngine]): Read-only engines of the replicas.
+            max_lag_seconds (float): Maximum tolerated replication lag in seconds.
+            health_check_seconds (float): Interval between health checks in seconds.
+        """
+
+        self._primary_session_maker = primary_session_maker
+        self._replicas = [Replica(engine) for engine in replica_engines]
+        self._max_lag_seconds = max_lag_seconds
+        self._health_check_seconds = health_check_seconds
+        self._counter = count()
+        self._health_check_task: Optional[asyncio.Task] = None
+
+    @property
+    def has_replicas(self) -> bool:
+        return bool(self._replicas)
+
+    def get_session_maker(self, use_primary: bool = False) -> async_sessionmaker:
+        """
+        Get the session maker of the database the next read-only session should be bound to.
+
+        Args:
+            use_primary (bool): Whether the primary database must be used.
+
+        Returns:
+            async_sessionmaker: The session maker.
+        """
+
+        if use_primary:
+            return self._primary_session_maker
+
+        healthy_replicas = [replica for replica in self._replicas if replica.healthy]
+
+        if not healthy_replicas:
+            return self._primary_session_maker
+
+        return healthy_replicas[next(self._counter) % len(healthy_replicas)].session_maker
+
+    async def check_replica(self, replica: Replica):
+        """
+        Check the availability and the replication lag of the replica and update its health.
+
+        Args:
+            replica (Replica): The replica to check.
+        """
+
+        try:
+            async with replica.engine.connect() as connection:
+                replica.lag = float(await connection.scalar(REPLICATION_LAG_QUERY))
+            healthy = replica.lag <= self._max_lag_seconds
+        except Exception as e:
+            logger.warning(f"Health check of replica {replica.name} failed: {e}")
+            replica.lag = None
+            healthy = False
+
+        if healthy != replica.healthy:
+            logger.warning(f"Replica {replica.name} is {'healthy' if healthy else 'unhealthy'} (lag={replica.lag})")
+
+        replica.healthy = healthy
+
+    async def check_replicas(self):
+        await asyncio.gather(*(self.check_replica(replica) for replica in self._replicas))
+
+    async def _run_health_checks(self):
+        while True:
+            await asyncio.sleep(self._health_check_seconds)
+            await self.check_replicas()
+
+    async def start(self):
+        """
+        Check replicas and start checking them periodically in the background.
+        """
+
+        if not self._replicas:
+            return
+
+        await self.check_replicas()
+        self._health_check_task = asyncio.create_task(self._run_health_checks())
+        logger.info(f"Started health checks of {len(self._replicas)} replicas")
+
+    async def stop(self):
+        """
+        Stop checking replicas and dispose their engines.
+        """
+
+        if self._health_check_task:
+            self._health_check_task.cancel()
+            self._health_check_task = None
+
+        for replica in self._replicas:
+            await replica.engine.dispose()
+
+
+replica_router = ReplicaRouter(
+    primary_session_maker=async_read_only_session_maker,
+    replica_engines=async_replica_engines,
+    max_lag_seconds=settings.pg_replica_max_lag_seconds,
+    health_check_seconds=settings.pg_replica_health_check_seconds,
+)
@@ -1,13 +1,27 @@
 from typing import AsyncGenerator
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
-from .engine import async_engine
+from .engine import async_engine, async_read_only_engine
 
 # Async Session #
 
 async_session_maker = async_sessionmaker(bind=async_engine, expire_on_commit=False)
 
+# Async Read-Only Session #
+
+async_read_only_session_maker = async_sessionmaker(bind=async_read_only_engine, expire_on_commit=False,
+                                                   autoflush=False)
+
 
 async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for retrieving the session of the request.
+
+    FastAPI caches dependencies within a request, so every dependency of the request gets the same session.
+
+    Yields:
+        AsyncSession: The session.
+    """
+
     async with async_session_maker() as session:
         yield session
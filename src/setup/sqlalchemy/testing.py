@@ -0,0 +1,55 @@
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from .engine import async_engine, async_read_only_engine, async_replica_engines
+
+__all__ = [
+    "assert_max_queries",
+]
+
+
+@contextmanager
+def assert_max_queries(max_queries: int, engines: Optional[List[AsyncEngine]] = None) -> Iterator[List[str]]:
+    """
+    Context manager asserting that at most the given number of queries is executed within the block.
+
+    Intended for tests of endpoints, so N+1 regressions fail them, e.g.:
+
+        with assert_max_queries(3):
+            response = await client.get("/api/v1/media/")
+
+    Args:
+        max_queries (int): The maximum number of queries.
+        engines (Optional[List[AsyncEngine]]): Engines to count queries of. All engines of the application
+            by default.
+
+    Yields:
+        List[str]: Statements executed so far within the block.
+
+    Raises:
+        AssertionError: If more queries than allowed were executed.
+    """
+
+    if engines is None:
+        engines = [async_engine, async_read_only_engine, *async_replica_engines]
+
+    statements = []
+
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    for engine in engines:
+        event.listen(engine.sync_engine, "after_cursor_execute", after_cursor_execute)
+
+    try:
+        yield statements
+    finally:
+        for engine in engines:
+            event.remove(engine.sync_engine, "after_cursor_execute", after_cursor_execute)
+
+    if len(statements) > max_queries:
+        raise AssertionError(f"Expected at most {max_queries} queries, {len(statements)} were executed:\n" +
+                             "\n".join(statements))
@@ -1,17 +1,48 @@
-from core.uow.sqlalchemy import SqlAlchemyUnitOfWork
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import modules
+from core.uow.registry import sqlalchemy_repositories
+from core.uow.sqlalchemy import SqlAlchemyUnitOfWork, SqlAlchemyReadOnlyUnitOfWork
+from setup.sqlalchemy.replicas import replica_router
 from setup.sqlalchemy.session import async_session_maker
 
 __all__ = [
     "get_sqlalchemy_uow",
+    "get_sqlalchemy_read_only_uow",
 ]
 
+sqlalchemy_repositories.autodiscover(modules)
 
-def get_sqlalchemy_uow() -> SqlAlchemyUnitOfWork:
+
+def get_sqlalchemy_uow(session: Optional[AsyncSession] = None) -> SqlAlchemyUnitOfWork:
     """
     Gets SqlAlchemyUnitOfWork instance.
 
+    Args:
+        session (Optional[AsyncSession]): The session to share with the unit of work. If not provided,
+            the unit of work creates its own one.
+
     Returns:
         SqlAlchemyOfWork: The instance.
     """
 
+    if session is not None:
+        return SqlAlchemyUnitOfWork(session=session)
+
     return SqlAlchemyUnitOfWork(async_session_maker)
+
+
+def get_sqlalchemy_read_only_uow(use_primary: bool = False) -> SqlAlchemyReadOnlyUnitOfWork:
+    """
+    Gets SqlAlchemyReadOnlyUnitOfWork instance bound to a replica or to the primary database.
+
+    Args:
+        use_primary (bool): Whether the unit of work must read from the primary database.
+
+    Returns:
+        SqlAlchemyReadOnlyUnitOfWork: The instance.
+    """
+
+    return SqlAlchemyReadOnlyUnitOfWork(replica_router.get_session_maker(use_primary=use_primary))
@@ -8,3 +8,7 @@ DATABASE_URL = (
     f"postgresql+asyncpg://{settings.pg_user}:{settings.pg_password}@"
     f"{settings.pg_host}:{settings.pg_port}/{settings.pg_database}"
 )
+
+# Replica Database URLs #
+
+REPLICA_DATABASE_URLS = list(settings.pg_replica_urls)
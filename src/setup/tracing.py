@@ -0,0 +1,80 @@
+from typing import Optional
+
+from loguru import logger
+
+from config.settings.server import ServerSettings
+from core.tracing import is_tracing_available, set_tracer
+
+_provider = None
+
+
+def configure_tracing(settings: ServerSettings, exporter=None):
+    """
+    Configure OpenTelemetry tracing if it's enabled and the SDK and the exporter are installed.
+
+    Spans are exported in batches to the OTLP endpoint from settings. A custom exporter, e.g. the in-memory one in
+    tests, is used instead with a simple processor, so spans are available as soon as they end.
+
+    Args:
+        settings (ServerSettings): The server settings.
+        exporter: The span exporter to use instead of the OTLP one.
+
+    Returns:
+        The tracer provider, or None if tracing isn't configured.
+    """
+
+    if not settings.otel_enabled:
+        return None
+
+    if not is_tracing_available():
+        logger.warning("Tracing is enabled, but opentelemetry-api isn't installed")
+        return None
+
+    try:
+        from opentelemetry import trace
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor, SimpleSpanProcessor
+    except ImportError:
+        logger.warning("Tracing is enabled, but opentelemetry-sdk isn't installed")
+        return None
+
+    if exporter is not None:
+        processor = SimpleSpanProcessor(exporter)
+    else:
+        try:
+            processor = BatchSpanProcessor(_get_otlp_exporter(settings.otel_exporter_otlp_endpoint))
+        except ImportError:
+            logger.warning("Tracing is enabled, but opentelemetry-exporter-otlp-proto-http isn't installed")
+            return None
+
+    provider = TracerProvider(resource=Resource.create({"service.name": settings.otel_service_name}))
+    provider.add_span_processor(processor)
+
+    global _provider
+    _provider = provider
+
+    trace.set_tracer_provider(provider)
+    set_tracer(provider.get_tracer("ideological-center"))
+    logger.info("Tracing configured")
+
+    return provider
+
+
+def _get_otlp_exporter(endpoint: Optional[str]):
+    from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+
+    return OTLPSpanExporter(endpoint=endpoint) if endpoint else OTLPSpanExporter()
+
+
+def shutdown_tracing() -> None:
+    """
+    Export pending spans and shut the tracer provider down.
+    """
+
+    global _provider
+
+    if _provider is not None:
+        set_tracer(None)
+        _provider.shutdown()
+        _provider = None